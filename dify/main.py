@@ -1,6 +1,8 @@
 from dify_plugin import Plugin, DifyPluginEnv
 
-plugin = Plugin(DifyPluginEnv(MAX_REQUEST_TIMEOUT=120))
+from provider.jobs import MAX_REQUEST_TIMEOUT_SECONDS
+
+plugin = Plugin(DifyPluginEnv(MAX_REQUEST_TIMEOUT=MAX_REQUEST_TIMEOUT_SECONDS))
 
 if __name__ == '__main__':
     plugin.run()
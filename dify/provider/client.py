@@ -0,0 +1,80 @@
+import hashlib
+import os
+import threading
+from typing import Any
+
+import httpx
+
+from provider.core.client import AgentQLClient
+from provider.core.const import EXTRACT_DATA_PATH
+from provider.core.endpoints import resolve_base_urls
+from provider.core.errors import from_status_error, from_transport_error
+from provider.core.http_client import configure_http_clients, get_sync_client
+from provider.core.metrics import OpenMetricsFileExporter, get_registry
+from provider.core.retry import RetryPolicy
+from provider.core.timeouts import Deadline, Timeouts
+from provider.core.tracing import CallTrace
+
+# Keep-alive connections kept open, shared by all tool invocations of the plugin process.
+MAX_CONNECTIONS = int(os.getenv("AGENTQL_MAX_CONNECTIONS") or 20)
+KEEPALIVE_EXPIRY_SECONDS = 60
+REQUEST_ORIGIN = "dify"
+VALIDATE_API_KEY_PATH = "/api/validate-api-key"
+VALIDATE_API_KEY_TIMEOUT_SECONDS = 10
+# Name of the calls in the metrics, as for the REST tool of langchain_agentql
+CALL_NAME = "agentql.extract_web_data"
+# File the metrics are written to in the OpenMetrics text format after every call, e.g. for a textfile collector
+METRICS_FILE = os.getenv("AGENTQL_METRICS_FILE")
+
+configure_http_clients(
+    max_connections=MAX_CONNECTIONS,
+    max_keepalive_connections=MAX_CONNECTIONS,
+    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+)
+_metrics_exporter = OpenMetricsFileExporter(METRICS_FILE) if METRICS_FILE else None
+_export_lock = threading.Lock()
+
+
+def credential_key(api_key: str) -> str:
+    """Identify a credential without keeping the API key itself around."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def extract_data(api_key: str, payload: dict[str, Any], timeout: float, max_retries: int) -> Any:
+    """
+    Extract data with the client core shared with `langchain_agentql`, within `timeout` seconds including retries:
+    requests go over the pooled connections, are spread over the API base URLs, rate limited, retried up to
+    `max_retries` times, fail with `provider.core.errors` and are recorded in `provider.core.metrics`.
+    """
+    timeouts = Timeouts.of(timeout)
+    trace = CallTrace(CALL_NAME, url=payload.get("url"))
+    client = AgentQLClient(
+        api_key,
+        retry_policy=RetryPolicy(max_attempts=max_retries + 1),
+        origin=REQUEST_ORIGIN,
+        trace=trace,
+    )
+    try:
+        with trace.run():
+            return client.post(EXTRACT_DATA_PATH, payload, timeouts, Deadline.after(timeouts.total))
+    finally:
+        _export_metrics()
+
+
+def validate_api_key(api_key: str) -> None:
+    """Check an API key without retries, which also warms up the pooled connection the extractions reuse."""
+    headers = AgentQLClient(api_key, origin=REQUEST_ORIGIN).headers
+    url = f"{resolve_base_urls()[0]}{VALIDATE_API_KEY_PATH}"
+    try:
+        get_sync_client().get(url, headers=headers, timeout=VALIDATE_API_KEY_TIMEOUT_SECONDS).raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise from_status_error(e) from e
+    except httpx.TransportError as e:
+        raise from_transport_error(e) from e
+
+
+def _export_metrics() -> None:
+    if _metrics_exporter is None:
+        return
+    with _export_lock:
+        _metrics_exporter.export(get_registry().collect())
@@ -0,0 +1 @@
+"""REST client core of `langchain_agentql`, generated by scripts/sync_dify_core.py. Do not edit."""
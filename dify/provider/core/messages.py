@@ -0,0 +1,23 @@
+# Generated from langchain/langchain_agentql/messages.py by scripts/sync_dify_core.py. Do not edit.
+UNAUTHORIZED_ERROR_MESSAGE = "Invalid AgentQL API key provided. Please provide a valid API Key. You can create one at https://dev.agentql.com."
+QUERY_PROMPT_REQUIRED_ERROR_MESSAGE = "Invalid arguments provided. Either 'query' or 'prompt' must be provided."
+QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE = "Invalid arguments provided. Only one of 'query' or 'prompt' should be provided."
+UNSET_API_KEY_ERROR_MESSAGE = "No AgentQL API key provided. You can set your API key in code by specifying the `api_key` argument or by setting the `AGENTQL_API_KEY` environment variable. You can create an API key at https://dev.agentql.com."
+MISSING_BROWSER_ERROR_MESSAGE = "Browser Instance not found. A browser instance is required to use this tool."
+MISSING_QUERY_ERROR_MESSAGE = "No AgentQL query provided for URL {url}. Either set the `query` argument or pass `(url, query)` pairs."
+INVALID_CONCURRENCY_ERROR_MESSAGE = "Invalid `concurrency` provided. It must be a positive integer."
+ASYNC_URLS_SYNC_LOAD_ERROR_MESSAGE = "An async iterable of URLs can only be loaded with `alazy_load` or `aload`."
+INVALID_RATE_LIMIT_ERROR_MESSAGE = "Invalid rate limit provided. `requests_per_second`, `burst` and `max_concurrency` must be positive."
+INVALID_PAGE_POOL_SIZE_ERROR_MESSAGE = "Invalid page pool `size` provided. It must be a positive integer."
+CLOSED_PAGE_POOL_ERROR_MESSAGE = "The page pool is closed."
+PAGE_POOL_TIMEOUT_ERROR_MESSAGE = "No page of the pool was returned within {timeout} seconds."
+MISSING_BROWSER_OR_PAGE_ERROR_MESSAGE = "Either async_browser, sync_browser, async_page or sync_page must be specified."
+MISSING_PSUTIL_ERROR_MESSAGE = "Unable to import psutil, which is required to restart the browser on a memory threshold. Please install it with `pip install 'langchain-agentql[memory]'`."
+CLOSED_BROWSER_MANAGER_ERROR_MESSAGE = "The browser manager is closed."
+INVALID_JSON_STREAM_ERROR_MESSAGE = "Invalid JSON received from the AgentQL API."
+INVALID_JSON_BACKEND_ERROR_MESSAGE = "Invalid JSON backend `{backend}`. It must be `orjson`, if installed, or `json`."
+EMPTY_API_BASE_URL_ERROR_MESSAGE = "At least one AgentQL API base URL must be specified."
+CALLBACK_TIMEOUT_ERROR_MESSAGE = "No extraction result was posted to the callback URL within {timeout} seconds."
+MISSING_AIOHTTP_ERROR_MESSAGE = "Unable to import aiohttp, which is required to run the embedded callback server. Please install it with `pip install aiohttp`."
+DEADLINE_EXCEEDED_ERROR_MESSAGE = "The AgentQL call ran out of time before it could complete."
+INVALID_QUERY_ERROR_MESSAGE = "Invalid AgentQL query: {reason} on line {line}, column {column}. Learn more about the query syntax at https://docs.agentql.com/agentql-query."
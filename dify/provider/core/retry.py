@@ -0,0 +1,159 @@
+# Generated from langchain/langchain_agentql/retry.py by scripts/sync_dify_core.py. Do not edit.
+"""Retry policy for AgentQL REST API requests."""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+from provider.core.const import (
+    DEFAULT_RETRY_AFTER_MAX_SECONDS,
+    DEFAULT_RETRY_BACKOFF_BASE_SECONDS,
+    DEFAULT_RETRY_BACKOFF_MAX_SECONDS,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_STATUS_CODES,
+)
+from provider.core.timeouts import Deadline
+
+# Transport errors raised before the server could have started processing the request,
+# or after the connection broke. Read timeouts are not retried by default since the
+# extraction may still be running on the server.
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parse the `Retry-After` header of a response.
+    Args:
+        response: The response to parse the header from.
+    Returns:
+        Optional[float]: Seconds to wait, or `None` if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy with exponential backoff, full jitter and `Retry-After` support."""
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    """Maximum number of attempts, including the first one. `1` disables retries."""
+    backoff_base: float = DEFAULT_RETRY_BACKOFF_BASE_SECONDS
+    """Backoff in seconds before the first retry. Doubles with every attempt."""
+    backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX_SECONDS
+    """Upper bound in seconds of the exponential backoff."""
+    jitter: bool = True
+    """Whether to wait a random time between 0 and the backoff ("full jitter") instead of the full backoff."""
+    respect_retry_after: bool = True
+    """Whether to wait as long as the `Retry-After` response header asks, instead of the backoff."""
+    retry_after_max: float = DEFAULT_RETRY_AFTER_MAX_SECONDS
+    """Upper bound in seconds of a wait requested with `Retry-After`."""
+    retry_on_status: FrozenSet[int] = DEFAULT_RETRY_STATUS_CODES
+    """HTTP status codes that are retried."""
+    retry_on_exceptions: Tuple[Type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS
+    """Exceptions raised by the HTTP client that are retried."""
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether a failed attempt may be retried."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_on_status
+        return isinstance(error, self.retry_on_exceptions)
+
+    def get_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Get the number of seconds to wait before retrying.
+        Args:
+            attempt: Zero-based index of the failed attempt.
+            error: The error of the failed attempt.
+        Returns:
+            float: Seconds to wait.
+        """
+        if self.respect_retry_after and isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response)
+            if retry_after is not None:
+                return min(retry_after, self.retry_after_max)
+
+        backoff = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+NO_RETRY_POLICY = RetryPolicy(max_attempts=1)
+
+
+def send_with_retry(
+    send: Callable[[], httpx.Response], policy: RetryPolicy, deadline: Optional[Deadline] = None
+) -> httpx.Response:
+    """
+    Send a request, retrying failed attempts according to the policy.
+    Args:
+        send: Sends the request. Responses with an error status must raise `httpx.HTTPStatusError`.
+        policy: The retry policy.
+        deadline: Deadline of the request. A failed attempt is not retried if the backoff would reach it.
+    Returns:
+        httpx.Response: The response of the first successful attempt.
+    """
+    retryable: Tuple[Type[Exception], ...] = (httpx.HTTPStatusError, *policy.retry_on_exceptions)
+    attempt = 0
+    while True:
+        try:
+            return send()
+        except retryable as e:
+            if attempt + 1 >= policy.max_attempts or not policy.is_retryable(e):
+                raise
+            delay = policy.get_delay(attempt, e)
+            if deadline is not None and not deadline.allows(delay):
+                raise
+            time.sleep(delay)
+            attempt += 1
+
+
+async def asend_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]], policy: RetryPolicy, deadline: Optional[Deadline] = None
+) -> httpx.Response:
+    """
+    Send a request, retrying failed attempts according to the policy.
+    Args:
+        send: Sends the request. Responses with an error status must raise `httpx.HTTPStatusError`.
+        policy: The retry policy.
+        deadline: Deadline of the request. A failed attempt is not retried if the backoff would reach it.
+    Returns:
+        httpx.Response: The response of the first successful attempt.
+    """
+    retryable: Tuple[Type[Exception], ...] = (httpx.HTTPStatusError, *policy.retry_on_exceptions)
+    attempt = 0
+    while True:
+        try:
+            return await send()
+        except retryable as e:
+            if attempt + 1 >= policy.max_attempts or not policy.is_retryable(e):
+                raise
+            delay = policy.get_delay(attempt, e)
+            if deadline is not None and not deadline.allows(delay):
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,82 @@
+# Generated from langchain/langchain_agentql/serialization.py by scripts/sync_dify_core.py. Do not edit.
+"""JSON encoding and decoding of AgentQL REST API payloads and responses.
+
+`orjson` is used when it is installed, and the standard library `json` module otherwise. Both backends produce the same
+compact, UTF-8 encoded JSON.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+from provider.core.messages import INVALID_JSON_BACKEND_ERROR_MESSAGE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+JSON_BACKENDS = ("orjson", "json")
+
+_backend = "orjson" if orjson is not None else "json"
+
+
+def get_json_backend() -> str:
+    """
+    Get the JSON backend in use.
+    Returns:
+        str: `orjson` or `json`.
+    """
+    return _backend
+
+
+def set_json_backend(backend: Optional[str] = None) -> None:
+    """
+    Set the JSON backend used by all requests.
+    Args:
+        backend: `orjson` or `json`. Defaults to `None`, i.e. `orjson` if it is installed.
+    """
+    global _backend
+    if backend is None:
+        backend = "orjson" if orjson is not None else "json"
+    if backend not in JSON_BACKENDS or (backend == "orjson" and orjson is None):
+        raise ValueError(INVALID_JSON_BACKEND_ERROR_MESSAGE.format(backend=backend))
+    _backend = backend
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact, UTF-8 encoded JSON.
+    Args:
+        obj: The object to encode.
+    Returns:
+        bytes: The JSON document.
+    """
+    if _backend == "orjson":
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """
+    Encode an object as compact JSON text.
+    Args:
+        obj: The object to encode.
+    Returns:
+        str: The JSON document.
+    """
+    if _backend == "orjson":
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+    Args:
+        data: The JSON document.
+    Returns:
+        Any: The decoded object.
+    """
+    if _backend == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
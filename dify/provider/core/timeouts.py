@@ -0,0 +1,149 @@
+# Generated from langchain/langchain_agentql/timeouts.py by scripts/sync_dify_core.py. Do not edit.
+"""Timeouts of AgentQL calls, and deadlines propagated from the invocation down to the HTTP request or browser query.
+
+A call gets a deadline from its total timeout, tightened by the deadline of the surrounding context, e.g. an agent run:
+
+.. code-block:: python
+
+    from provider.core.timeouts import deadline
+
+    with deadline(120):
+        agent.invoke({"messages": [...]})  # every AgentQL call of the run ends within 120 seconds
+
+Retries and backoff waits only happen while the deadline allows them, and every attempt is bounded by the time left.
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
+
+import httpx
+
+from provider.core.const import (
+    DEFAULT_API_TIMEOUT_SECONDS,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_WRITE_TIMEOUT_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """Timeouts in seconds of an AgentQL REST API call. `None` means no limit other than the deadline of the call."""
+
+    total: Optional[float] = DEFAULT_API_TIMEOUT_SECONDS
+    """Whole call, including retries and backoff waits."""
+    connect: Optional[float] = DEFAULT_CONNECT_TIMEOUT_SECONDS
+    """Establishing a connection."""
+    write: Optional[float] = DEFAULT_WRITE_TIMEOUT_SECONDS
+    """Sending a chunk of the request."""
+    read: Optional[float] = None
+    """Receiving a chunk of the response. The first chunk only arrives once the data is extracted."""
+    pool: Optional[float] = None
+    """Waiting for a connection of the pool to be free."""
+
+    @classmethod
+    def of(cls, timeout: "TimeoutLike") -> "Timeouts":
+        """
+        Get the timeouts of a `timeout` argument.
+        Args:
+            timeout: The timeouts, or the total timeout in seconds, or `None` for no total timeout.
+        Returns:
+            Timeouts: The timeouts.
+        """
+        if isinstance(timeout, Timeouts):
+            return timeout
+        return cls(total=None if timeout is None else float(timeout))
+
+    def to_httpx(self, remaining: Optional[float]) -> httpx.Timeout:
+        """
+        Get the timeouts of an HTTP attempt.
+        Args:
+            remaining: Seconds left until the deadline of the call, or `None` if it has none.
+        Returns:
+            httpx.Timeout: The timeouts, bounded by the time left.
+        """
+
+        def cap(seconds: Optional[float]) -> Optional[float]:
+            if remaining is None:
+                return seconds
+            return remaining if seconds is None else min(seconds, remaining)
+
+        return httpx.Timeout(connect=cap(self.connect), read=cap(self.read), write=cap(self.write), pool=cap(self.pool))
+
+
+TimeoutLike = Union[Timeouts, float, None]
+
+
+class Deadline:
+    """A point in time by which a call must complete, on the monotonic clock."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: Optional[float] = None):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> "Deadline":
+        """The deadline `seconds` from now, or no deadline if `seconds` is `None`."""
+        return cls(None if seconds is None else time.monotonic() + seconds)
+
+    def earliest(self, *others: Optional["Deadline"]) -> "Deadline":
+        """The earliest of this deadline and `others`."""
+        expiries = [d.expires_at for d in (self, *others) if d is not None and d.expires_at is not None]
+        return Deadline(min(expiries)) if expiries else Deadline()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or `None` if there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allows(self, seconds: float) -> bool:
+        """Whether there is time left after waiting `seconds`."""
+        remaining = self.remaining()
+        return remaining is None or remaining > seconds
+
+    def timeout(self) -> Optional[int]:
+        """Seconds left rounded up, for APIs taking a whole number of seconds, or `None` if there is no deadline."""
+        remaining = self.remaining()
+        return None if remaining is None else max(1, math.ceil(remaining))
+
+
+_deadline: ContextVar[Deadline] = ContextVar("agentql_deadline", default=Deadline())
+
+
+def get_deadline(*timeouts: Optional[float]) -> Deadline:
+    """
+    Get the deadline of a call starting now.
+    Args:
+        timeouts: Timeouts in seconds of the call, or `None`.
+    Returns:
+        Deadline: The earliest of the deadline of the current context and the timeouts.
+    """
+    return _deadline.get().earliest(*(Deadline.after(timeout) for timeout in timeouts))
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Deadline]:
+    """
+    Bound the AgentQL calls made within the block, including those of threads and tasks started with its context.
+    Nested blocks can only tighten the deadline.
+    Args:
+        seconds: Seconds from now, or `None` to keep the current deadline.
+    Returns:
+        Iterator[Deadline]: The deadline of the block.
+    """
+    current = get_deadline(seconds)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
@@ -1,3 +0,0 @@
-AGENTQL_HOST_URL = "https://api.agentql.com"
-QUERY_DATA_ENDPOINT = "v1/query-data"
-VALIDATE_API_KEY_ENDPOINT = "api/validate-api-key"
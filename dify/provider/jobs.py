@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+# Seconds the plugin daemon waits for a tool invocation, see main.py.
+MAX_REQUEST_TIMEOUT_SECONDS = 120
+# Seconds a tool invocation waits for its extractions before returning a job to poll, within the plugin timeout.
+MAX_WAIT_SECONDS = float(os.getenv("AGENTQL_MAX_WAIT_SECONDS") or MAX_REQUEST_TIMEOUT_SECONDS - 20)
+# Extractions run concurrently by the plugin process.
+WORKERS = int(os.getenv("AGENTQL_WORKERS") or 10)
+# Seconds an unpolled job is kept after its extractions finished.
+JOB_TTL_SECONDS = 3600
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="agentql")
+
+
+class Job:
+    """Extractions of one tool invocation, running in the worker pool."""
+
+    def __init__(self, owner: str, urls: list[str], futures: list[Future], is_batch: bool):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.urls = urls
+        self.futures = futures
+        self.is_batch = is_batch
+        self.finished_at: Optional[float] = None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for the extractions and return whether they all finished."""
+        wait(self.futures, timeout=max(timeout, 0))
+        return self.done()
+
+    def done(self) -> bool:
+        if all(future.done() for future in self.futures):
+            if self.finished_at is None:
+                self.finished_at = time.monotonic()
+            return True
+        return False
+
+    def progress(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": "PENDING",
+            "completed": sum(future.done() for future in self.futures),
+            "total": len(self.futures),
+        }
+
+
+class JobRegistry:
+    """Jobs by ID, so that an invocation that ran out of time can be picked up by a later invocation."""
+
+    def __init__(self):
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, owner: str, urls: list[str], extract: Callable[[str], Any], is_batch: bool) -> Job:
+        job = Job(owner, urls, [_executor.submit(extract, url) for url in urls], is_batch)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, owner: str, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        # Jobs are only handed to invocations with the credential that submitted them
+        return job if job is not None and job.owner == owner else None
+
+    def remove(self, job: Job) -> None:
+        with self._lock:
+            self._jobs.pop(job.id, None)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for job_id, job in list(self._jobs.items()):
+            if job.done() and now - job.finished_at > JOB_TTL_SECONDS:
+                del self._jobs[job_id]
+
+
+# Shared by all tool invocations of the plugin process.
+jobs = JobRegistry()
@@ -1,2 +1,3 @@
-UNAUTHORIZED_ERROR_MESSAGE = "Please, provide a valid API Key. You can create one at https://dev.agentql.com."
 INTERNAL_SERVER_ERROR_MESSAGE = "Internal Server Error"
+MISSING_URL_ERROR_MESSAGE = "Please, provide the URL of the web page to extract data from, or the ID of a pending job."
+UNKNOWN_JOB_ERROR_MESSAGE = "Job {job_id} was not found. It may have expired or been submitted with another API key."
@@ -1,22 +1,70 @@
 from collections.abc import Generator
 from typing import Any
 
-import httpx
-
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from provider.endpoints import AGENTQL_HOST_URL, QUERY_DATA_ENDPOINT
-from provider.messages import UNAUTHORIZED_ERROR_MESSAGE
+from provider.client import credential_key, extract_data
+from provider.core.serialization import loads
+from provider.jobs import MAX_WAIT_SECONDS, Job, jobs
+from provider.messages import MISSING_URL_ERROR_MESSAGE, UNKNOWN_JOB_ERROR_MESSAGE
+
+
+def parse_urls(value: str) -> list[str]:
+    """Parse one URL, URLs separated by whitespace, or a JSON array of URLs."""
+    value = value.strip()
+    if value.startswith("["):
+        return [str(url).strip() for url in loads(value) if str(url).strip()]
+    return value.split()
+
 
 class ExtractWebDataTool(Tool):
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage]:
+        api_key = self.runtime.credentials["api_key"]
+        owner = credential_key(api_key)
+
+        job_id = tool_parameters.get("job_id")
+        if job_id:
+            job = jobs.get(owner, job_id)
+            if job is None:
+                raise ValueError(UNKNOWN_JOB_ERROR_MESSAGE.format(job_id=job_id))
+        else:
+            url = tool_parameters.get("url")
+            urls = parse_urls(url) if url else []
+            if not urls:
+                raise ValueError(MISSING_URL_ERROR_MESSAGE)
+            # A single URL keeps the plain response of the API as the result
+            is_batch = len(urls) > 1 or url.strip().startswith("[")
+            job = jobs.submit(owner, urls, self._extractor(api_key, tool_parameters), is_batch)
+
+        # Return the job to poll instead of running into the plugin timeout
+        if not job.wait(MAX_WAIT_SECONDS):
+            yield self.create_json_message(job.progress())
+            return
 
-        url = tool_parameters["url"]
+        jobs.remove(job)
+        yield self.create_json_message(self._to_result(job))
+
+    @staticmethod
+    def _to_result(job: Job) -> dict[str, Any]:
+        if not job.is_batch:
+            return job.futures[0].result()
+        results = []
+        for url, future in zip(job.urls, job.futures):
+            error = future.exception()
+            if error is None:
+                results.append({"url": url, **future.result()})
+            else:
+                results.append({"url": url, "error": str(error)})
+        return {"results": results}
+
+    @staticmethod
+    def _extractor(api_key: str, tool_parameters: dict[str, Any]):
         query = tool_parameters.get("query", None)
         prompt = tool_parameters.get("prompt", None)
-        
+
         timeout = tool_parameters["timeout"]
+        max_retries = int(tool_parameters.get("max_retries", 2))
 
         metadata = {}
         metadata["experimental_stealth_mode_enabled"] = tool_parameters["stealth_mode"]
@@ -27,46 +75,14 @@ class ExtractWebDataTool(Tool):
         params["is_scroll_to_bottom_enabled"] = tool_parameters["scroll_to_bottom"]
         params["is_screenshot_enabled"] = tool_parameters["enable_screenshot"]
 
-        endpoint = f"{AGENTQL_HOST_URL}/{QUERY_DATA_ENDPOINT}"
-        headers = {
-            "X-API-Key": self.runtime.credentials["api_key"],
-            "Content-Type": "application/json",
-            "X-TF-Request-Origin": "dify",
-        }
-
-        payload = {
-            "url": url,
-            "query": query,
-            "prompt": prompt,
-            "params": params,
-            "metadata": metadata
-        }
-
-        try:
-            response = httpx.post(
-                endpoint,
-                headers=headers,
-                json=payload,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-
-        except httpx.HTTPStatusError as e:
-            response = e.response
-            if response.status_code == httpx.codes.UNAUTHORIZED:
-                raise ValueError(UNAUTHORIZED_ERROR_MESSAGE) from e
-            else:
-                msg = response.text
-                try:
-                    error_json = response.json()
-                    msg = (
-                        error_json["error_info"]
-                        if "error_info" in error_json
-                        else str(error_json)
-                    )
-                except (ValueError, TypeError):
-                    msg = f"HTTP {e}."
-                raise ValueError(msg) from e
-        else:
-            json = response.json()
-            yield self.create_json_message(json)
+        def extract(url: str) -> dict[str, Any]:
+            payload = {
+                "url": url,
+                "query": query,
+                "prompt": prompt,
+                "params": params,
+                "metadata": metadata
+            }
+            return extract_data(api_key, payload, timeout, max_retries)
+
+        return extract
@@ -1,12 +1,14 @@
-from importlib import metadata
+from importlib import import_module, metadata
+from typing import TYPE_CHECKING, Any, List
 
-from langchain_agentql.document_loaders import AgentQLLoader
-from langchain_agentql.toolkits import AgentQLBrowserToolkit
-from langchain_agentql.tools import (
-    ExtractWebDataBrowserTool,
-    ExtractWebDataTool,
-    GetWebElementBrowserTool,
-)
+if TYPE_CHECKING:
+    from langchain_agentql.document_loaders import AgentQLLoader
+    from langchain_agentql.toolkits import AgentQLBrowserToolkit
+    from langchain_agentql.tools import (
+        ExtractWebDataBrowserTool,
+        ExtractWebDataTool,
+        GetWebElementBrowserTool,
+    )
 
 try:
     __version__ = metadata.version(__package__)
@@ -14,6 +16,16 @@ except metadata.PackageNotFoundError:
     # Case where package metadata is not available.
     __version__ = "1.0.0"
 
+# Modules of the exported classes, imported on first access so that REST-only users do not import
+# Playwright, agentql and langchain_community
+_LAZY_IMPORTS = {
+    "AgentQLBrowserToolkit": "langchain_agentql.toolkits",
+    "AgentQLLoader": "langchain_agentql.document_loaders",
+    "ExtractWebDataBrowserTool": "langchain_agentql.tools.extract_web_data_browser_tool",
+    "ExtractWebDataTool": "langchain_agentql.tools.extract_web_data_tool",
+    "GetWebElementBrowserTool": "langchain_agentql.tools.get_web_element_browser_tool",
+}
+
 __all__ = [
     "AgentQLBrowserToolkit",
     "AgentQLLoader",
@@ -22,3 +34,15 @@ __all__ = [
     "GetWebElementBrowserTool",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,149 @@
+"""Bounded-concurrency execution of many extractions, yielding results as they complete."""
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Union,
+)
+
+from langchain_agentql.messages import INVALID_CONCURRENCY_ERROR_MESSAGE
+
+# End of the URLs, distinct from any element of them, e.g. a `None` to report as invalid
+_END: Any = object()
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of one extraction of a batch."""
+
+    url: str
+    """The URL of the web page."""
+    data: Optional[dict] = None
+    """The extraction response, if it succeeded."""
+    error: Optional[Exception] = None
+    """The error raised by the extraction, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the extraction succeeded."""
+        return self.error is None
+
+
+def iter_extractions(
+    extract: Callable[[str], dict],
+    urls: Iterable[str],
+    concurrency: int,
+    stop_on_error: bool = False,
+) -> Iterator[ExtractionResult]:
+    """
+    Run `extract` for every URL in a thread pool and yield results in completion order.
+    Args:
+        extract: Extracts the data of one URL.
+        urls: The URLs, consumed lazily.
+        concurrency: Maximum number of extractions in flight.
+        stop_on_error: Whether to raise the first error and cancel pending extractions,
+            instead of yielding failed results.
+    Returns:
+        Iterator[ExtractionResult]: The results, as they complete.
+    """
+    if concurrency < 1:
+        raise ValueError(INVALID_CONCURRENCY_ERROR_MESSAGE)
+
+    pending: Dict["Future[dict]", str] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            url_iterator = iter(urls)
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < concurrency:
+                    url = next(url_iterator, _END)
+                    if url is _END:
+                        exhausted = True
+                    else:
+                        # Workers run in the caller's context, e.g. its deadline and runnable config
+                        pending[executor.submit(contextvars.copy_context().run, extract, url)] = url
+
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield ExtractionResult(url=url, data=future.result())
+                    elif stop_on_error or not isinstance(error, Exception):
+                        raise error
+                    else:
+                        yield ExtractionResult(url=url, error=error)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aiter_extractions(
+    extract: Callable[[str], Awaitable[dict]],
+    urls: Union[Iterable[str], AsyncIterable[str]],
+    concurrency: int,
+    stop_on_error: bool = False,
+) -> AsyncIterator[ExtractionResult]:
+    """
+    Run `extract` for every URL on the event loop and yield results in completion order.
+    Args:
+        extract: Extracts the data of one URL.
+        urls: The URLs, consumed lazily.
+        concurrency: Maximum number of extractions in flight.
+        stop_on_error: Whether to raise the first error and cancel pending extractions,
+            instead of yielding failed results.
+    Returns:
+        AsyncIterator[ExtractionResult]: The results, as they complete.
+    """
+    if concurrency < 1:
+        raise ValueError(INVALID_CONCURRENCY_ERROR_MESSAGE)
+
+    async def url_stream() -> AsyncIterator[str]:
+        if isinstance(urls, AsyncIterable):
+            async for url in urls:
+                yield url
+        else:
+            for url in urls:
+                yield url
+
+    pending: Dict["asyncio.Task[Any]", str] = {}
+
+    async def completed() -> Set["asyncio.Task[Any]"]:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        return done
+
+    def to_result(task: "asyncio.Task[Any]") -> ExtractionResult:
+        url = pending.pop(task)
+        error = task.exception()
+        if error is not None:
+            if stop_on_error or not isinstance(error, Exception):
+                raise error
+            return ExtractionResult(url=url, error=error)
+        return ExtractionResult(url=url, data=task.result())
+
+    try:
+        async for url in url_stream():
+            pending[asyncio.ensure_future(extract(url))] = url
+            if len(pending) >= concurrency:
+                for task in await completed():
+                    yield to_result(task)
+        while pending:
+            for task in await completed():
+                yield to_result(task)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,322 @@
+"""Lifecycle management of Playwright drivers and browsers.
+
+A browser manager owns the Playwright driver, launches the browser once and shares it
+across toolkits, relaunches it after a crash or once it opened too many pages or uses
+too much memory, and shuts both the browser and the driver down when closed. Toolkits and
+tools keep the browser they were created with and do not recover from a relaunch, so create
+them inside each `browser()` block:
+
+.. code-block:: python
+
+    async with AsyncBrowserManager(max_pages=500, max_memory_mb=2048) as manager:
+        async with manager.browser() as async_browser:
+            tools = AgentQLBrowserToolkit(async_browser=async_browser).get_tools()
+            ...
+"""
+
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_agentql.messages import (
+    CLOSED_BROWSER_MANAGER_ERROR_MESSAGE,
+    MISSING_PSUTIL_ERROR_MESSAGE,
+)
+from langchain_agentql.metrics import BROWSER_PAGES_OPENED
+
+try:
+    from playwright.async_api import Browser as AsyncBrowser
+    from playwright.async_api import Error as AsyncPlaywrightError
+    from playwright.async_api import Playwright as AsyncPlaywright
+    from playwright.async_api import async_playwright
+    from playwright.sync_api import Browser as SyncBrowser
+    from playwright.sync_api import Error as SyncPlaywrightError
+    from playwright.sync_api import Playwright as SyncPlaywright
+    from playwright.sync_api import sync_playwright
+except ImportError as e:
+    raise ImportError(
+        "Unable to import playwright. Please make sure playwright module is properly installed."
+    ) from e
+
+
+class _BaseBrowserManager:
+    def __init__(
+        self,
+        headless: bool = True,
+        args: Optional[List[str]] = None,
+        browser_type: str = "chromium",
+        max_pages: Optional[int] = None,
+        max_memory_mb: Optional[float] = None,
+        **launch_options: Any,
+    ):
+        """
+        Args:
+            headless: Whether to run the browser in headless mode. Defaults to True.
+            args: Arguments to pass to the browser launch.
+            browser_type: The Playwright browser type to launch, `chromium`, `firefox` or `webkit`. Defaults to `chromium`.
+            max_pages: Number of pages opened after which the browser is relaunched. Pages are counted per browser context and may be undercounted for contexts that are opened and closed between two checks. Defaults to `None`, i.e. never.
+            max_memory_mb: Resident memory in MiB of all child processes of this process (the Playwright drivers and browsers) above which the browser is relaunched. Requires `psutil`, installed with the `memory` extra. Defaults to `None`, i.e. never.
+            launch_options: Other keyword arguments passed to the browser launch.
+        """
+        if max_memory_mb is not None:
+            try:
+                import psutil  # noqa: F401
+            except ImportError as e:
+                raise ImportError(MISSING_PSUTIL_ERROR_MESSAGE) from e
+
+        self.headless = headless
+        self.args = args
+        self.browser_type = browser_type
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.launch_options = launch_options
+        self.restarts = 0
+        self._pages_opened = 0
+        self._tracked_contexts: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._leases = 0
+        self._closed = False
+
+    @property
+    def pages_opened(self) -> int:
+        """Number of pages opened in the current browser."""
+        return self._pages_opened
+
+    def _on_page(self, _: Any) -> None:
+        self._pages_opened += 1
+        BROWSER_PAGES_OPENED.inc()
+
+    def _track_pages(self, browser: Any) -> None:
+        for context in browser.contexts:
+            if context not in self._tracked_contexts:
+                self._tracked_contexts.add(context)
+                self._pages_opened += len(context.pages)
+                BROWSER_PAGES_OPENED.inc(len(context.pages))
+                context.on("page", self._on_page)
+
+    def _memory_mb(self) -> float:
+        import psutil
+
+        total = 0
+        for child in psutil.Process().children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / 2**20
+
+    def _is_worn_out(self, browser: Any) -> bool:
+        if self.max_pages is not None and self._pages_opened >= self.max_pages:
+            return True
+        return self.max_memory_mb is not None and self._memory_mb() >= self.max_memory_mb
+
+    def _reset_counters(self) -> None:
+        self._pages_opened = 0
+        self._tracked_contexts = weakref.WeakSet()
+
+
+class AsyncBrowserManager(_BaseBrowserManager):
+    """Owns an async Playwright driver and browser, relaunching the browser when needed."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._playwright: Optional[AsyncPlaywright] = None
+        self._browser: Optional[AsyncBrowser] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _launch(self) -> AsyncBrowser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        launcher = getattr(self._playwright, self.browser_type)
+        browser = await launcher.launch(headless=self.headless, args=self.args, **self.launch_options)
+        self._reset_counters()
+        return browser
+
+    async def _close_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except AsyncPlaywrightError:
+                # The browser already went away
+                pass
+
+    async def _get_browser(self, lease: bool = False, restart: bool = False) -> AsyncBrowser:
+        if self._closed:
+            raise RuntimeError(CLOSED_BROWSER_MANAGER_ERROR_MESSAGE)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # Leases are counted and checked under the lock, so that no block gets a browser another one recycles
+        async with self._lock:
+            if self._browser is not None:
+                self._track_pages(self._browser)
+            if self._browser is not None and (restart or not self._browser.is_connected()):
+                await self._close_browser()
+                self.restarts += 1
+            elif self._browser is not None and self._leases == 0 and self._is_worn_out(self._browser):
+                await self._close_browser()
+                self.restarts += 1
+            if self._browser is None:
+                self._browser = await self._launch()
+            if lease:
+                self._leases += 1
+            return self._browser
+
+    async def start(self) -> AsyncBrowser:
+        """
+        Start the Playwright driver and launch the browser.
+        Returns:
+            Browser: The browser.
+        """
+        return await self.get_browser()
+
+    async def get_browser(self) -> AsyncBrowser:
+        """
+        Get the browser, launching it first if it is not running or crashed.
+        The browser is only relaunched for the page or memory limits while no `browser()` block is active.
+        Returns:
+            Browser: The browser.
+        """
+        return await self._get_browser()
+
+    @asynccontextmanager
+    async def browser(self) -> AsyncIterator[AsyncBrowser]:
+        """
+        Use the browser for the duration of the block. It is not relaunched for the page or memory limits until every block exits.
+        Returns:
+            AsyncIterator[Browser]: The browser.
+        """
+        browser = await self._get_browser(lease=True)
+        try:
+            yield browser
+        finally:
+            self._leases -= 1
+
+    async def restart(self) -> AsyncBrowser:
+        """
+        Close the browser and launch a new one, e.g. when it hangs.
+        Active `browser()` blocks are not waited for: the browser they use is closed.
+        Returns:
+            Browser: The new browser.
+        """
+        return await self._get_browser(restart=True)
+
+    async def close(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        self._closed = True
+        await self._close_browser()
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            await playwright.stop()
+
+    async def __aenter__(self) -> "AsyncBrowserManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class SyncBrowserManager(_BaseBrowserManager):
+    """
+    Owns a sync Playwright driver and browser, relaunching the browser when needed.
+    Sync Playwright objects may only be used from the thread that created them, so the manager must be used from that thread as well.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._playwright: Optional[SyncPlaywright] = None
+        self._browser: Optional[SyncBrowser] = None
+        self._lock = threading.RLock()
+
+    def _launch(self) -> SyncBrowser:
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        launcher = getattr(self._playwright, self.browser_type)
+        browser = launcher.launch(headless=self.headless, args=self.args, **self.launch_options)
+        self._reset_counters()
+        return browser
+
+    def _close_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                browser.close()
+            except SyncPlaywrightError:
+                # The browser already went away
+                pass
+
+    def _get_browser(self, lease: bool = False, restart: bool = False) -> SyncBrowser:
+        if self._closed:
+            raise RuntimeError(CLOSED_BROWSER_MANAGER_ERROR_MESSAGE)
+        # Leases are counted and checked under the lock, so that no block gets a browser another one recycles
+        with self._lock:
+            if self._browser is not None:
+                self._track_pages(self._browser)
+            if self._browser is not None and (restart or not self._browser.is_connected()):
+                self._close_browser()
+                self.restarts += 1
+            elif self._browser is not None and self._leases == 0 and self._is_worn_out(self._browser):
+                self._close_browser()
+                self.restarts += 1
+            if self._browser is None:
+                self._browser = self._launch()
+            if lease:
+                self._leases += 1
+            return self._browser
+
+    def start(self) -> SyncBrowser:
+        """
+        Start the Playwright driver and launch the browser.
+        Returns:
+            Browser: The browser.
+        """
+        return self.get_browser()
+
+    def get_browser(self) -> SyncBrowser:
+        """
+        Get the browser, launching it first if it is not running or crashed.
+        The browser is only relaunched for the page or memory limits while no `browser()` block is active.
+        Returns:
+            Browser: The browser.
+        """
+        return self._get_browser()
+
+    @contextmanager
+    def browser(self) -> Iterator[SyncBrowser]:
+        """
+        Use the browser for the duration of the block. It is not relaunched for the page or memory limits until every block exits.
+        Returns:
+            Iterator[Browser]: The browser.
+        """
+        browser = self._get_browser(lease=True)
+        try:
+            yield browser
+        finally:
+            with self._lock:
+                self._leases -= 1
+
+    def restart(self) -> SyncBrowser:
+        """
+        Close the browser and launch a new one, e.g. when it hangs.
+        Active `browser()` blocks are not waited for: the browser they use is closed.
+        Returns:
+            Browser: The new browser.
+        """
+        return self._get_browser(restart=True)
+
+    def close(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        self._closed = True
+        self._close_browser()
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            playwright.stop()
+
+    def __enter__(self) -> "SyncBrowserManager":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
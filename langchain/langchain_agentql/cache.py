@@ -0,0 +1,190 @@
+"""Response caches for AgentQL REST API extractions."""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from langchain_agentql.const import DEFAULT_CACHE_MAX_SIZE
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent URLs share a cache entry.
+    Lowercases the scheme and host, drops default ports and the fragment, and sorts query parameters.
+    Args:
+        url: The URL to normalize.
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    if parts.username:
+        credentials = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{credentials}@{netloc}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def make_cache_key(
+    url: str,
+    query: Optional[str],
+    prompt: Optional[str],
+    params: dict,
+    metadata: dict,
+) -> str:
+    """
+    Build the cache key of an extraction request.
+    Args:
+        url: The URL of the web page.
+        query: The AgentQL query, if any.
+        prompt: The Natural Language prompt, if any.
+        params: The request params.
+        metadata: The request metadata.
+    Returns:
+        str: A hex digest identifying the request.
+    """
+    key = json.dumps(
+        [normalize_url(url), query, prompt, params, metadata],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _is_fresh(created_at: float, ttl: Optional[float], max_age: Optional[float]) -> bool:
+    age = time.time() - created_at
+    return (ttl is None or age <= ttl) and (max_age is None or age <= max_age)
+
+
+class BaseCache(ABC):
+    """Interface of AgentQL response caches."""
+
+    @abstractmethod
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[dict]:
+        """
+        Look up a cached response.
+        Args:
+            key: The cache key, see `make_cache_key`.
+            max_age: Maximum age in seconds of an entry to be returned. Defaults to the cache's TTL.
+        Returns:
+            Optional[dict]: The cached response, or `None` on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: dict) -> None:
+        """
+        Store a response.
+        Args:
+            key: The cache key, see `make_cache_key`.
+            value: The response to store.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class InMemoryCache(BaseCache):
+    """Thread-safe in-memory LRU cache with an optional TTL."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE, ttl: Optional[float] = None):
+        """
+        Args:
+            max_size: Maximum number of entries. The least recently used entry is evicted first.
+            ttl: Seconds an entry stays valid. Defaults to `None`, i.e. entries never expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if not _is_fresh(created_at, self.ttl, max_age):
+                if not _is_fresh(created_at, self.ttl, None):
+                    del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: dict) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(BaseCache):
+    """On-disk cache backed by a SQLite database, shareable across processes."""
+
+    def __init__(self, database_path: str = ".agentql_cache.db", ttl: Optional[float] = None):
+        """
+        Args:
+            database_path: Path of the SQLite database file. Defaults to `.agentql_cache.db`.
+            ttl: Seconds an entry stays valid. Defaults to `None`, i.e. entries never expire.
+        """
+        self.database_path = database_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS agentql_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM agentql_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if not _is_fresh(created_at, self.ttl, max_age):
+                if not _is_fresh(created_at, self.ttl, None):
+                    with self._connection:
+                        self._connection.execute("DELETE FROM agentql_cache WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO agentql_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM agentql_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,277 @@
+"""Client core of the AgentQL REST API.
+
+Every request of the tools and the loader goes through `AgentQLClient`, which sends it over the shared, pooled HTTP
+clients, spreads it over the API base URLs, applies the rate limiter and the retry policy, and raises the structured
+errors of `langchain_agentql.errors`. Each attempt is recorded into the `CallTrace` of the call, if any.
+"""
+
+import time
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Iterator,
+    NoReturn,
+    Optional,
+)
+
+import httpx
+
+from langchain_agentql.const import REQUEST_ORIGIN
+from langchain_agentql.endpoints import BaseURL, get_endpoint_pool
+from langchain_agentql.errors import (
+    AgentQLError,
+    AgentQLTimeoutError,
+    from_status_error,
+    from_transport_error,
+    get_request_id,
+)
+from langchain_agentql.http_client import get_async_client, get_sync_client
+from langchain_agentql.messages import DEADLINE_EXCEEDED_ERROR_MESSAGE
+from langchain_agentql.rate_limit import RateLimiter, get_rate_limiter
+from langchain_agentql.retry import (
+    DEFAULT_RETRY_POLICY,
+    RetryPolicy,
+    asend_with_retry,
+    send_with_retry,
+)
+from langchain_agentql.serialization import dumps, loads
+from langchain_agentql.timeouts import Deadline, Timeouts
+from langchain_agentql.tracing import CallTrace
+
+
+class AgentQLClient:
+    """Sends requests to the AgentQL REST API. Creating one is cheap; connections are pooled process-wide."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[BaseURL] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        origin: str = REQUEST_ORIGIN,
+        trace: Optional[CallTrace] = None,
+    ):
+        """
+        Args:
+            api_key: AgentQL API key.
+            base_url: Base URL or base URLs of the AgentQL REST API. Defaults to the `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+            retry_policy: Retry policy. Defaults to 3 attempts with exponential backoff and jitter.
+            rate_limiter: Rate limiter. Defaults to the process-wide rate limiter.
+            http_client: HTTP client of sync requests. Defaults to the shared, pooled client.
+            async_http_client: HTTP client of async requests. Defaults to the shared, pooled client of the event loop.
+            origin: Integration the requests originate from, sent as `X-TF-Request-Origin`.
+            trace: Trace of the call the requests are sent for, recording their timings, sizes and attempts.
+        """
+        self.endpoint_pool = get_endpoint_pool(base_url)
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.rate_limiter = rate_limiter
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+        self.headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+            "X-TF-Request-Origin": origin,
+        }
+        self.trace = trace
+        self._attempt_ended_at: Optional[float] = None
+
+    def _build_request(
+        self,
+        http_client: Any,
+        endpoint: str,
+        path: str,
+        body: Any,
+        timeouts: Timeouts,
+        deadline: Deadline,
+        trace_hook: Optional[Callable] = None,
+    ) -> httpx.Request:
+        if deadline.expired:
+            raise AgentQLTimeoutError(DEADLINE_EXCEEDED_ERROR_MESSAGE)
+        content = dumps(body)
+        extensions = {}
+        if self.trace is not None:
+            self.trace.set(request_bytes=len(content))
+            extensions["trace"] = trace_hook
+        return http_client.build_request(
+            "POST",
+            f"{endpoint}{path}",
+            headers=self.headers,
+            content=content,
+            timeout=timeouts.to_httpx(deadline.remaining()),
+            extensions=extensions,
+        )
+
+    def _start_attempt(self, queued_at: float) -> None:
+        """Record an attempt let through by the rate limiter, and the backoff wait before it."""
+        if self.trace is None:
+            return
+        self.trace.attempts += 1
+        self.trace.add_phase("queue", time.perf_counter() - queued_at)
+        if self._attempt_ended_at is not None:
+            self.trace.add_phase("backoff", queued_at - self._attempt_ended_at)
+
+    def _end_attempt(self, response: Optional[httpx.Response]) -> None:
+        self._attempt_ended_at = time.perf_counter()
+        if self.trace is not None and response is not None:
+            self.trace.set(status_code=response.status_code, request_id=response.headers.get("X-Request-Id"))
+
+    def _phase(self, phase: str) -> ContextManager:
+        return nullcontext() if self.trace is None else self.trace.phase(phase)
+
+    def _raise(self, e: Exception) -> NoReturn:
+        error: AgentQLError
+        if isinstance(e, httpx.HTTPStatusError):
+            error = from_status_error(e, self.retry_policy)
+        elif isinstance(e, httpx.TransportError):
+            error = from_transport_error(e, self.retry_policy)
+        else:
+            raise e
+        if self.trace is not None:
+            self.trace.set(request_id=error.request_id)
+        raise error from e
+
+    def _send(self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline, stream: bool) -> httpx.Response:
+        http_client = self.http_client or get_sync_client()
+
+        def send() -> httpx.Response:
+            response = None
+            try:
+                with self.endpoint_pool.endpoint() as endpoint:
+                    queued_at = time.perf_counter()
+                    with (self.rate_limiter or get_rate_limiter()).limit():
+                        self._start_attempt(queued_at)
+                        # Built once the rate limiter let it through, so the wait counts against the deadline
+                        request = self._build_request(
+                            http_client, endpoint, path, body, timeouts, deadline, self.trace.http_event if self.trace is not None else None
+                        )
+                        response = http_client.send(request, stream=stream)
+                    if stream and response.is_error:
+                        # Read the error body before the connection is released
+                        response.read()
+                        response.close()
+                    return response.raise_for_status()
+            finally:
+                self._end_attempt(response)
+
+        try:
+            return send_with_retry(send, self.retry_policy, deadline)
+        except (httpx.HTTPStatusError, httpx.TransportError) as e:
+            self._raise(e)
+
+    async def _asend(
+        self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline, stream: bool
+    ) -> httpx.Response:
+        http_client = self.async_http_client or get_async_client()
+
+        async def send() -> httpx.Response:
+            response = None
+            try:
+                with self.endpoint_pool.endpoint() as endpoint:
+                    queued_at = time.perf_counter()
+                    async with (self.rate_limiter or get_rate_limiter()).alimit():
+                        self._start_attempt(queued_at)
+                        # Built once the rate limiter let it through, so the wait counts against the deadline
+                        request = self._build_request(
+                            http_client, endpoint, path, body, timeouts, deadline, self.trace.ahttp_event if self.trace is not None else None
+                        )
+                        response = await http_client.send(request, stream=stream)
+                    if stream and response.is_error:
+                        # Read the error body before the connection is released
+                        await response.aread()
+                        await response.aclose()
+                    return response.raise_for_status()
+            finally:
+                self._end_attempt(response)
+
+        try:
+            return await asend_with_retry(send, self.retry_policy, deadline)
+        except (httpx.HTTPStatusError, httpx.TransportError) as e:
+            self._raise(e)
+
+    def post(self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline) -> Any:
+        """
+        Send a request and decode its response.
+        Args:
+            path: Path of the API endpoint, e.g. `/v1/query-data`.
+            body: The request body, encoded as JSON.
+            timeouts: Timeouts of each attempt.
+            deadline: Deadline of the request, bounding its attempts and retries.
+        Returns:
+            Any: The decoded response body.
+        """
+        response = self._send(path, body, timeouts, deadline, stream=False)
+        return self._decode(response)
+
+    async def apost(self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline) -> Any:
+        """
+        Send a request and decode its response.
+        Args:
+            path: Path of the API endpoint, e.g. `/v1/query-data`.
+            body: The request body, encoded as JSON.
+            timeouts: Timeouts of each attempt.
+            deadline: Deadline of the request, bounding its attempts and retries.
+        Returns:
+            Any: The decoded response body.
+        """
+        response = await self._asend(path, body, timeouts, deadline, stream=False)
+        return self._decode(response)
+
+    def _decode(self, response: httpx.Response) -> Any:
+        with self._phase("decode"):
+            data = loads(response.content)
+        if self.trace is not None:
+            self.trace.set(response_bytes=len(response.content), request_id=get_request_id(data))
+        return data
+
+    @contextmanager
+    def stream(self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline) -> Iterator[httpx.Response]:
+        """
+        Send a request and stream its response within the block.
+        Args:
+            path: Path of the API endpoint, e.g. `/v1/query-data`.
+            body: The request body, encoded as JSON.
+            timeouts: Timeouts of each attempt.
+            deadline: Deadline of the request, bounding its attempts and retries.
+        Returns:
+            Iterator[httpx.Response]: The response, whose body is not read yet.
+        """
+        response = self._send(path, body, timeouts, deadline, stream=True)
+        try:
+            yield response
+        except httpx.TransportError as e:
+            self._raise(e)
+        finally:
+            response.close()
+            self._record_download(response)
+
+    @asynccontextmanager
+    async def astream(
+        self, path: str, body: Any, timeouts: Timeouts, deadline: Deadline
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request and stream its response within the block.
+        Args:
+            path: Path of the API endpoint, e.g. `/v1/query-data`.
+            body: The request body, encoded as JSON.
+            timeouts: Timeouts of each attempt.
+            deadline: Deadline of the request, bounding its attempts and retries.
+        Returns:
+            AsyncIterator[httpx.Response]: The response, whose body is not read yet.
+        """
+        response = await self._asend(path, body, timeouts, deadline, stream=True)
+        try:
+            yield response
+        except httpx.TransportError as e:
+            self._raise(e)
+        finally:
+            await response.aclose()
+            self._record_download(response)
+
+    def _record_download(self, response: httpx.Response) -> None:
+        if self.trace is not None:
+            self.trace.set(response_bytes=response.num_bytes_downloaded)
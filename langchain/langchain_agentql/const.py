@@ -10,7 +10,56 @@ DEFAULT_IS_SCROLL_TO_BOTTOM_ENABLED = False
 DEFAULT_IS_SCREENSHOT_ENABLED = False
 DEFAULT_IS_STEALTH_MODE_ENABLED = False
 
-EXTRACT_DATA_ENDPOINT = "https://api.agentql.com/v1/query-data"
+DEFAULT_API_BASE_URL = "https://api.agentql.com"
+# Comma-separated base URLs of the AgentQL REST API, e.g. regional endpoints or proxies
+API_BASE_URL_ENV = "AGENTQL_API_BASE_URL"
+EXTRACT_DATA_PATH = "/v1/query-data"
+EXTRACT_DATA_ENDPOINT = f"{DEFAULT_API_BASE_URL}{EXTRACT_DATA_PATH}"
+# Extractions whose result is posted to a webhook URL
+EXTRACT_DATA_ASYNC_PATH = "/v1/query-data-async"
+# Seconds an endpoint that failed is skipped while other endpoints are available
+DEFAULT_ENDPOINT_COOLDOWN_SECONDS = 30
 DEFAULT_API_TIMEOUT_SECONDS = 900
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_WRITE_TIMEOUT_SECONDS = 30
 
 REQUEST_ORIGIN = "langchain"
+
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS = 30
+
+DEFAULT_LOADER_CONCURRENCY = 5
+
+DEFAULT_CACHE_MAX_SIZE = 1024
+# Parsed AgentQL queries kept in memory, by query string
+DEFAULT_QUERY_CACHE_MAX_SIZE = 512
+# Keys of per-call options read from `RunnableConfig["configurable"]`
+BYPASS_CACHE_CONFIG_KEY = "agentql_bypass_cache"
+CACHE_MAX_AGE_CONFIG_KEY = "agentql_cache_max_age"
+TIMEOUT_CONFIG_KEY = "agentql_timeout"
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_BASE_SECONDS = 1
+DEFAULT_RETRY_BACKOFF_MAX_SECONDS = 30
+DEFAULT_RETRY_AFTER_MAX_SECONDS = 60
+DEFAULT_RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Environment variables configuring the process-wide rate limiter
+RATE_LIMIT_REQUESTS_PER_SECOND_ENV = "AGENTQL_RATE_LIMIT_RPS"
+RATE_LIMIT_BURST_ENV = "AGENTQL_RATE_LIMIT_BURST"
+RATE_LIMIT_MAX_CONCURRENCY_ENV = "AGENTQL_MAX_CONCURRENCY"
+
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Largest callback body accepted by the embedded callback server, leaving room for full-page Base64 screenshots
+DEFAULT_CALLBACK_MAX_BODY_SIZE = 64 * 2**20
+
+DEFAULT_PAGE_POOL_SIZE = 4
+DEFAULT_PAGE_POOL_MAX_USES = 50
+# Browser extraction results kept per page while its DOM is unchanged
+DEFAULT_PAGE_CACHE_MAX_SIZE = 64
+
+# Buckets of the latency histograms, from fast cache hits to the default timeout
+DEFAULT_LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+DEFAULT_METRICS_EXPORT_INTERVAL_SECONDS = 60
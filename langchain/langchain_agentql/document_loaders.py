@@ -1,13 +1,35 @@
 """AgentQL document loader."""
 
+import asyncio
 import os
-from typing import Iterator, Optional
+import uuid
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import httpx
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 
-from langchain_agentql.const import DEFAULT_API_TIMEOUT_SECONDS
-from langchain_agentql.load_data import load_data
+from langchain_agentql.cache import BaseCache
+from langchain_agentql.const import DEFAULT_API_TIMEOUT_SECONDS, DEFAULT_LOADER_CONCURRENCY
+from langchain_agentql.load_data import aload_data, astream_data, load_data, stream_data
+from langchain_agentql.query import parse_query
+from langchain_agentql.retry import RetryPolicy
+from langchain_agentql.serialization import dumps_str
+from langchain_agentql.timeouts import TimeoutLike
+from langchain_agentql.tracing import CallTrace
+from langchain_agentql.webhook import CallbackReceiver
 
 from langchain_agentql.const import (
     DEFAULT_IS_STEALTH_MODE_ENABLED,
@@ -16,7 +38,17 @@ from langchain_agentql.const import (
     DEFAULT_IS_SCREENSHOT_ENABLED,
     DEFAULT_RESPONSE_MODE,
 )
-from langchain_agentql.messages import UNSET_API_KEY_ERROR_MESSAGE
+from langchain_agentql.messages import (
+    ASYNC_URLS_SYNC_LOAD_ERROR_MESSAGE,
+    INVALID_CONCURRENCY_ERROR_MESSAGE,
+    MISSING_QUERY_ERROR_MESSAGE,
+    UNSET_API_KEY_ERROR_MESSAGE,
+)
+
+URLItem = Union[str, Tuple[str, str]]
+URLInput = Union[str, Iterable[URLItem], AsyncIterable[URLItem]]
+# A URL being loaded asynchronously and the queue its documents are put in
+_Loading = Tuple["asyncio.Task[None]", "asyncio.Queue[Any]"]
 
 
 class AgentQLLoader(BaseLoader):
@@ -55,47 +87,96 @@ class AgentQLLoader(BaseLoader):
             metadata={
                 'request_id': 'xxxxxx-xxxx-xxxx-xxxx-xxxx',
                 'generated_query': None,
-                'screenshot': None},
-            page_content="{
-                'posts': [
-                    {
-                        'title': 'Launch Week Recap—make the web AI-ready', 
-                        'url': 'https://www.agentql.com/blog/2024-launch-week-recap', 
-                        'date': 'Nov 18, 2024', 
-                        'author': 'Rachel-Lee Nabors'
-                    }
-                    ...
-                ]
-            }"
+                'screenshot': None,
+                'agentql_timing': {'total_ms': 2710.4, 'phases_ms': {...}, 'attempts': 1, ...},
+                'url': 'https://www.agentql.com/blog'},
+            page_content='{"posts":[{"title":"Launch Week Recap—make the web AI-ready","url":"https://www.agentql.com/blog/2024-launch-week-recap","date":"Nov 18, 2024","author":"Rachel-Lee Nabors"},...]}'
         ]
-        
+
+    Async load multiple URLs:
+        .. code-block:: python
+
+        loader = AgentQLLoader(
+            url = [
+                "https://www.agentql.com/blog",
+                ("https://www.agentql.com/pricing", "{ plans[] { name price } }"),
+            ],
+            query = "{ posts[] { title url date author } }",
+            concurrency = 10,
+        )
+
+        async for doc in loader.alazy_load():
+            print(doc.metadata["url"])
+
+        # or collect them all at once
+        docs = await loader.aload()
+
+    One document per list element:
+        .. code-block:: python
+
+        loader = AgentQLLoader(
+            url = "https://www.agentql.com/blog",
+            query = "{ posts[] { title url date author } }",
+            item_path = "posts",
+        )
+
+        for doc in loader.lazy_load():
+            print(doc.page_content)
+            # {"title":"Launch Week Recap—make the web AI-ready","url":"https://www.agentql.com/blog/2024-launch-week-recap",...}
+
+    `alazy_load` and `aload` run on the event loop without worker threads. They also accept an async iterable of URLs, e.g. URLs read from a queue.
+
     """  # noqa: E501
 
     def __init__(
         self,
-        url: str,
-        query: str,
+        url: URLInput,
+        query: Optional[str] = None,
         api_key: Optional[str] = None,
-        timeout: int = DEFAULT_API_TIMEOUT_SECONDS,
+        timeout: TimeoutLike = DEFAULT_API_TIMEOUT_SECONDS,
         is_stealth_mode_enabled: bool = DEFAULT_IS_STEALTH_MODE_ENABLED,
         wait_for: int = DEFAULT_WAIT_FOR_PAGE_LOAD_SECONDS,
         is_scroll_to_bottom_enabled: bool = DEFAULT_IS_SCROLL_TO_BOTTOM_ENABLED,
         mode: str = DEFAULT_RESPONSE_MODE,
         is_screenshot_enabled: bool = DEFAULT_IS_SCREENSHOT_ENABLED,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        concurrency: int = DEFAULT_LOADER_CONCURRENCY,
+        preserve_order: bool = False,
+        cache: Optional[BaseCache] = None,
+        cache_max_age: Optional[float] = None,
+        coalesce_requests: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        screenshot_dir: Optional[str] = None,
+        item_path: Optional[str] = None,
+        api_base_url: Optional[Union[str, List[str]]] = None,
+        callback_receiver: Optional[CallbackReceiver] = None,
     ):
         """
         Initialize with API key and params.
 
         Args:
-            url (str): The URL of the web page you want to extract data from.
-            query (str): The AgentQL query to execute. Learn more at https://docs.agentql.com/agentql-query
+            url (Union[str, Iterable[Union[str, Tuple[str, str]]], AsyncIterable[Union[str, Tuple[str, str]]]]): The URL of the web page you want to extract data from, or an iterable of URLs or `(url, query)` pairs. Iterables are consumed lazily. Async iterables can only be loaded with `alazy_load` or `aload`.
+            query (Optional[str]): The AgentQL query to execute. Used for every URL given without its own query. Malformed queries raise an `AgentQLQuerySyntaxError` before any request is sent. Learn more at https://docs.agentql.com/agentql-query
             api_key (Optional[str]): AgentQL API key. You can create one at https://dev.agentql.com.
-            timeout (int): Seconds to wait for a request. Defaults to 900.
+            timeout (Union[float, Timeouts]): Seconds a request may take, including retries, or `Timeouts` splitting it into connect, write, read and pool timeouts. Requests made within `langchain_agentql.timeouts.deadline` are also bounded by it. Defaults to 900 seconds in total, with 10 seconds to connect.
             is_stealth_mode_enabled (boolean): Enable experimental anti-bot evasion strategies. May not work for all websites at all times. Defaults to `False`.
             wait_for (int): Wait time in seconds for page load (max 10 seconds). Defaults to 0.
             is_scroll_to_bottom_enabled (boolean): Whether to scroll to bottom of the page before extracting data. Defaults to `False`.
             mode (str): 'standard' uses deep data analysis, while 'fast' trades some depth of analysis for speed. Learn more at https://docs.agentql.com/accuracy/standard-mode. Defaults to 'fast'.
             is_screenshot_enabled (boolean): Whether to take a screenshot before extracting data. Returned in 'metadata' as a Base64 string. Defaults to `False`.
+            http_client (Optional[httpx.Client]): HTTP client used for requests. Defaults to the shared, pooled client from `langchain_agentql.http_client`.
+            async_http_client (Optional[httpx.AsyncClient]): HTTP client used for async requests. Defaults to the shared, pooled client from `langchain_agentql.http_client`.
+            concurrency (int): Maximum number of requests in flight when loading asynchronously. Defaults to 5.
+            preserve_order (boolean): Whether to yield documents in input order instead of completion order when loading asynchronously. Defaults to `False`.
+            cache (Optional[BaseCache]): Cache of extraction results keyed by URL, query and params, e.g. `InMemoryCache` or `SQLiteCache`. Defaults to `None`, i.e. no caching.
+            cache_max_age (Optional[float]): Maximum age in seconds of a cached result to be reused. Defaults to `None`, i.e. the cache's own TTL.
+            coalesce_requests (boolean): Whether identical requests in flight at the same time share a single call to the API and its result. Defaults to `True`.
+            retry_policy (Optional[RetryPolicy]): Retry policy for rate-limited (429), failed (5xx) and disconnected requests. Defaults to 3 attempts with exponential backoff and jitter.
+            screenshot_dir (Optional[str]): Directory the Base64 screenshots are streamed to, one file per document, instead of being kept in memory. The file path is returned in 'metadata' as 'screenshot'. Responses are then decoded as they are received and not cached. Defaults to `None`.
+            item_path (Optional[str]): Dotted path of a list in the extracted data, e.g. `posts`. If set, one document is yielded per list element, with the element as compact JSON in 'page_content' and its position in 'metadata' as 'index'. Without a cache, the documents are yielded as the response is decoded, before the response metadata is received, so their 'metadata' only holds 'url', 'index' and, with `screenshot_dir`, the path the screenshot is written to once the response is read. Defaults to `None`, i.e. one document per URL.
+            api_base_url (Optional[Union[str, List[str]]]): Base URL of the AgentQL REST API, e.g. a regional endpoint or a proxy, or a list of base URLs that requests are spread over. Retries go to the next base URL, and base URLs that fail to connect or return server errors are skipped for 30 seconds. Defaults to the comma-separated `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+            callback_receiver (Optional[CallbackReceiver]): Receiver of results posted to a webhook URL, e.g. `EmbeddedCallbackServer`. If set, extractions are submitted to the API and their results are posted back to the receiver, instead of holding a connection open until they are ready. Responses are then not streamed. Defaults to `None`.
 
             Visit https://docs.agentql.com/rest-api/api-reference for more details.
         """
@@ -106,7 +187,24 @@ class AgentQLLoader(BaseLoader):
         if not self._api_key:
             raise ValueError(UNSET_API_KEY_ERROR_MESSAGE)
         
+        if concurrency < 1:
+            raise ValueError(INVALID_CONCURRENCY_ERROR_MESSAGE)
+        if query:
+            parse_query(query)
+
         self.timeout = timeout
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+        self.concurrency = concurrency
+        self.preserve_order = preserve_order
+        self.cache = cache
+        self.cache_max_age = cache_max_age
+        self.coalesce_requests = coalesce_requests
+        self.retry_policy = retry_policy
+        self.screenshot_dir = screenshot_dir
+        self.item_path = item_path
+        self.api_base_url = api_base_url
+        self.callback_receiver = callback_receiver
 
         self.params = {
             "wait_for": wait_for,
@@ -119,16 +217,202 @@ class AgentQLLoader(BaseLoader):
             "experimental_stealth_mode_enabled": is_stealth_mode_enabled,
         }
 
-    def lazy_load(self) -> Iterator[Document]:
-        data = load_data(
-            url=self.url,
-            query=self.query,
-            api_key=self._api_key,
-            metadata=self.metadata,
-            params=self.params,
-            timeout=self.timeout,
+    def _to_request(self, item: URLItem) -> Tuple[str, str]:
+        url, query = (item, self.query) if isinstance(item, str) else item
+        if not query:
+            raise ValueError(MISSING_QUERY_ERROR_MESSAGE.format(url=url))
+        return url, query
+
+    def _iter_requests(self) -> Iterator[Tuple[str, str]]:
+        if isinstance(self.url, AsyncIterable):
+            raise TypeError(ASYNC_URLS_SYNC_LOAD_ERROR_MESSAGE)
+        urls = [self.url] if isinstance(self.url, str) else self.url
+        for item in urls:
+            yield self._to_request(item)
+
+    async def _aiter_requests(self) -> AsyncIterator[Tuple[str, str]]:
+        if not isinstance(self.url, AsyncIterable):
+            for request in self._iter_requests():
+                yield request
+            return
+        async for item in self.url:
+            yield self._to_request(item)
+
+    @staticmethod
+    def _to_document(url: str, data: dict) -> Document:
+        return Document(
+            page_content=dumps_str(data["data"]),
+            metadata={**data["metadata"], "url": url},
         )
-        yield Document(
-            page_content=str(data["data"]),
-            metadata=data["metadata"],
+
+    def _new_screenshot_path(self) -> Optional[str]:
+        if self.screenshot_dir is None:
+            return None
+        return os.path.join(self.screenshot_dir, f"{uuid.uuid4().hex}.b64")
+
+    @staticmethod
+    def _response_metadata(response: dict, trace: CallTrace, screenshot: Optional[str] = None) -> dict:
+        metadata = {**response.get("metadata", {}), "agentql_timing": trace.to_dict()}
+        if screenshot is not None:
+            metadata["screenshot"] = screenshot if os.path.exists(screenshot) else None
+        return metadata
+
+    @staticmethod
+    def _to_item_document(url: str, index: int, item: Any, metadata: dict) -> Document:
+        return Document(
+            page_content=dumps_str(item),
+            metadata={**metadata, "url": url, "index": index},
         )
+
+    @staticmethod
+    def _find_items(data: dict, item_path: str) -> List[Any]:
+        value: Any = data.get("data")
+        for key in item_path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return []
+            value = value[key]
+        return value if isinstance(value, list) else [value]
+
+    def _stream_kwargs(self, url: str, query: str, screenshot: Optional[str]) -> dict:
+        return {
+            "url": url,
+            "query": query,
+            "api_key": self._api_key,
+            "metadata": self.metadata,
+            "params": self.params,
+            "timeout": self.timeout,
+            "item_path": self.item_path,
+            "screenshot": screenshot,
+            "retry_policy": self.retry_policy,
+            "base_url": self.api_base_url,
+        }
+
+    def _load_kwargs(self, url: str, query: str) -> dict:
+        return {
+            "url": url,
+            "query": query,
+            "api_key": self._api_key,
+            "metadata": self.metadata,
+            "params": self.params,
+            "timeout": self.timeout,
+            "cache": self.cache,
+            "cache_max_age": self.cache_max_age,
+            "coalesce": self.coalesce_requests,
+            "retry_policy": self.retry_policy,
+            "base_url": self.api_base_url,
+            "callback_receiver": self.callback_receiver,
+        }
+
+    @staticmethod
+    def _streamed_item_metadata(request_id: Optional[str], screenshot: Optional[str]) -> dict:
+        # The API sends the response metadata after the data, so streamed elements only get the request ID of the
+        # `X-Request-Id` header instead of waiting for it
+        metadata = {"request_id": request_id} if request_id is not None else {}
+        return {**metadata, "screenshot": screenshot} if screenshot is not None else metadata
+
+    def _stream_documents(self, url: str, query: str) -> Iterator[Document]:
+        screenshot = self._new_screenshot_path()
+        trace = CallTrace("agentql.load")
+        with stream_data(**self._stream_kwargs(url, query, screenshot), client=self.http_client, trace=trace) as stream:
+            if self.item_path is None:
+                for _ in stream:
+                    pass
+                metadata = self._response_metadata(stream.response, trace, screenshot)
+                yield self._to_document(url, {**stream.response, "metadata": metadata})
+                return
+
+            for index, item in enumerate(stream):
+                metadata = self._streamed_item_metadata(stream.request_id, screenshot)
+                yield self._to_item_document(url, index, item, metadata)
+
+    async def _astream_documents(self, url: str, query: str) -> AsyncIterator[Document]:
+        screenshot = self._new_screenshot_path()
+        trace = CallTrace("agentql.load")
+        async with astream_data(
+            **self._stream_kwargs(url, query, screenshot), client=self.async_http_client, trace=trace
+        ) as stream:
+            if self.item_path is None:
+                async for _ in stream:
+                    pass
+                metadata = self._response_metadata(stream.response, trace, screenshot)
+                yield self._to_document(url, {**stream.response, "metadata": metadata})
+                return
+
+            index = 0
+            async for item in stream:
+                metadata = self._streamed_item_metadata(stream.request_id, screenshot)
+                yield self._to_item_document(url, index, item, metadata)
+                index += 1
+
+    def _is_streamed(self) -> bool:
+        # Cached and posted results are received whole, so they are not streamed
+        if self.callback_receiver is not None:
+            return False
+        return self.screenshot_dir is not None or (self.item_path is not None and self.cache is None)
+
+    def _to_documents(self, url: str, data: dict, trace: CallTrace) -> List[Document]:
+        metadata = self._response_metadata(data, trace)
+        if self.item_path is None:
+            return [self._to_document(url, {**data, "metadata": metadata})]
+        return [
+            self._to_item_document(url, index, item, metadata)
+            for index, item in enumerate(self._find_items(data, self.item_path))
+        ]
+
+    def lazy_load(self) -> Iterator[Document]:
+        for url, query in self._iter_requests():
+            if self._is_streamed():
+                yield from self._stream_documents(url, query)
+                continue
+            trace = CallTrace("agentql.load")
+            data = load_data(**self._load_kwargs(url, query), client=self.http_client, trace=trace)
+            yield from self._to_documents(url, data, trace)
+
+    async def _aload_documents(self, url: str, query: str, documents: "asyncio.Queue[Any]") -> None:
+        """Put the documents of a URL in the queue as they are loaded, then the current task to mark the end."""
+        try:
+            if self._is_streamed():
+                async for document in self._astream_documents(url, query):
+                    documents.put_nowait(document)
+                return
+            trace = CallTrace("agentql.load")
+            data = await aload_data(**self._load_kwargs(url, query), client=self.async_http_client, trace=trace)
+            for document in self._to_documents(url, data, trace):
+                documents.put_nowait(document)
+        finally:
+            documents.put_nowait(asyncio.current_task())
+
+    async def _next_completed(self, pending: Deque[_Loading]) -> AsyncIterator[Document]:
+        """Yield documents as they are loaded until a URL is done, in input order if `preserve_order` is set."""
+        documents = pending[0][1]
+        while True:
+            entry = await documents.get()
+            if isinstance(entry, Document):
+                yield entry
+                continue
+            for loading in pending:
+                if loading[0] is entry:
+                    pending.remove(loading)
+                    break
+            # Raises the error of the URL, if any
+            await entry
+            return
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Load documents concurrently, with at most `concurrency` requests in flight."""
+        pending: Deque[_Loading] = deque()
+        # Without `preserve_order`, all URLs share a queue and documents are yielded as soon as they are loaded
+        shared: "asyncio.Queue[Any]" = asyncio.Queue()
+        try:
+            async for url, query in self._aiter_requests():
+                documents: "asyncio.Queue[Any]" = asyncio.Queue() if self.preserve_order else shared
+                pending.append((asyncio.create_task(self._aload_documents(url, query, documents)), documents))
+                if len(pending) >= self.concurrency:
+                    async for document in self._next_completed(pending):
+                        yield document
+            while pending:
+                async for document in self._next_completed(pending):
+                    yield document
+        finally:
+            for task, _ in pending:
+                task.cancel()
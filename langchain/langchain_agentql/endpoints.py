@@ -0,0 +1,124 @@
+"""Base URLs of the AgentQL REST API, with client-side load balancing and failover."""
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from langchain_agentql.const import (
+    API_BASE_URL_ENV,
+    DEFAULT_API_BASE_URL,
+    DEFAULT_ENDPOINT_COOLDOWN_SECONDS,
+)
+from langchain_agentql.messages import EMPTY_API_BASE_URL_ERROR_MESSAGE
+from langchain_agentql.retry import DEFAULT_RETRY_EXCEPTIONS
+
+BaseURL = Union[str, Sequence[str]]
+
+
+def resolve_base_urls(base_url: Optional[BaseURL] = None) -> Tuple[str, ...]:
+    """
+    Resolve the base URLs of the AgentQL REST API.
+    Args:
+        base_url: A base URL, a comma-separated list or a sequence of base URLs. Defaults to the `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+    Returns:
+        Tuple[str, ...]: The base URLs, without trailing slashes.
+    """
+    if base_url is None:
+        base_url = os.getenv(API_BASE_URL_ENV) or DEFAULT_API_BASE_URL
+    urls = base_url.split(",") if isinstance(base_url, str) else base_url
+    resolved = tuple(url.strip().rstrip("/") for url in urls if url.strip())
+    if not resolved:
+        raise ValueError(EMPTY_API_BASE_URL_ERROR_MESSAGE)
+    return resolved
+
+
+class EndpointPool:
+    """
+    Spreads requests over base URLs round-robin. A base URL whose request failed to connect or got a server error is
+    skipped for `cooldown` seconds, unless all of them failed.
+    """
+
+    def __init__(self, base_urls: Sequence[str], cooldown: float = DEFAULT_ENDPOINT_COOLDOWN_SECONDS):
+        if not base_urls:
+            raise ValueError(EMPTY_API_BASE_URL_ERROR_MESSAGE)
+        self.base_urls = tuple(base_urls)
+        self.cooldown = cooldown
+        self._failed_at: Dict[str, float] = {}
+        self._order = itertools.cycle(self.base_urls)
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        """
+        Pick the base URL of the next request.
+        Returns:
+            str: The base URL.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self.base_urls)):
+                base_url = next(self._order)
+                failed_at = self._failed_at.get(base_url)
+                if failed_at is None or now - failed_at >= self.cooldown:
+                    return base_url
+            # All of them failed recently, try the one that failed first
+            return min(self._failed_at, key=self._failed_at.__getitem__)
+
+    @contextmanager
+    def endpoint(self) -> Iterator[str]:
+        """
+        Pick the base URL of the next request, and report the outcome of the request made within the block.
+        Returns:
+            Iterator[str]: The base URL.
+        """
+        base_url = self.next()
+        try:
+            yield base_url
+        except Exception as e:
+            self.report(base_url, e)
+            raise
+        self.report(base_url)
+
+    def report(self, base_url: str, error: Optional[Exception] = None) -> None:
+        """
+        Report the outcome of a request.
+        Args:
+            base_url: The base URL of the request.
+            error: The error of the request, or `None` if it succeeded.
+        """
+        with self._lock:
+            if error is None:
+                self._failed_at.pop(base_url, None)
+            elif _is_endpoint_failure(error):
+                self._failed_at[base_url] = time.monotonic()
+
+
+def _is_endpoint_failure(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, DEFAULT_RETRY_EXCEPTIONS)
+
+
+_pools: Dict[Tuple[str, ...], EndpointPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_endpoint_pool(base_url: Optional[BaseURL] = None) -> EndpointPool:
+    """
+    Get the endpoint pool of base URLs, shared by all requests to the same base URLs.
+    Args:
+        base_url: A base URL, a comma-separated list or a sequence of base URLs. Defaults to the `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+    Returns:
+        EndpointPool: The endpoint pool.
+    """
+    base_urls = resolve_base_urls(base_url)
+    with _pools_lock:
+        pool = _pools.get(base_urls)
+        if pool is None:
+            pool = _pools[base_urls] = EndpointPool(base_urls)
+        return pool
+
@@ -0,0 +1,129 @@
+"""Errors raised by AgentQL REST API calls."""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from langchain_agentql.messages import UNAUTHORIZED_ERROR_MESSAGE
+from langchain_agentql.retry import DEFAULT_RETRY_POLICY, RetryPolicy, parse_retry_after
+
+
+class AgentQLError(Exception):
+    """Base class of the errors of AgentQL REST API calls."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        request_id: Optional[str] = None,
+        retryable: bool = False,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        """HTTP status code of the response, if any."""
+        self.request_id = request_id
+        """ID of the request, to give to the AgentQL support, if the API returned one."""
+        self.retryable = retryable
+        """Whether the request may succeed if it is sent again."""
+
+
+class AgentQLAPIError(AgentQLError, ValueError):
+    """The AgentQL API rejected the request or failed to extract the data. Also a `ValueError`, for backward compatibility."""
+
+
+class AgentQLAuthenticationError(AgentQLAPIError):
+    """The API key is missing or invalid."""
+
+
+class AgentQLRateLimitError(AgentQLAPIError):
+    """Too many requests were sent with the API key."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, **kwargs: Any):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+        """Seconds the API asked to wait before retrying, if it did."""
+
+
+class AgentQLQuerySyntaxError(AgentQLError, ValueError):
+    """The AgentQL query is malformed. Raised before any request is sent."""
+
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(message)
+        self.line = line
+        """Line of the query the error was found on, starting at 1."""
+        self.column = column
+        """Column of the query the error was found at, starting at 1."""
+
+
+class AgentQLConnectionError(AgentQLError):
+    """The AgentQL API could not be reached, or the connection broke."""
+
+
+class AgentQLTimeoutError(AgentQLConnectionError, TimeoutError):
+    """The call ran out of time, either for one of its phases or for its deadline."""
+
+
+def get_request_id(body: Any, response: Optional[httpx.Response] = None) -> Optional[str]:
+    """Get the request ID of a response body, falling back to the `X-Request-Id` header of the response."""
+    if isinstance(body, dict):
+        request_id = body.get("request_id") or (body.get("metadata") or {}).get("request_id")
+        if request_id:
+            return request_id
+    if response is not None:
+        return response.headers.get("X-Request-Id")
+    return None
+
+
+def from_status_error(e: httpx.HTTPStatusError, policy: RetryPolicy = DEFAULT_RETRY_POLICY) -> AgentQLAPIError:
+    """
+    Convert an error response of the AgentQL API.
+    The body of a streamed response must have been read.
+    Args:
+        e: The error raised for the response.
+        policy: The retry policy that decides whether the error is retryable.
+    Returns:
+        AgentQLAPIError: The error, with the message of the API.
+    """
+    response = e.response
+    try:
+        body = response.json()
+        message = body["error_info"] if "error_info" in body else str(body)
+    except (ValueError, TypeError):
+        body = None
+        message = f"HTTP {e}."
+
+    kwargs: Dict[str, Any] = {
+        "status_code": response.status_code,
+        "request_id": get_request_id(body, response),
+        "retryable": policy.is_retryable(e),
+    }
+    if response.status_code == httpx.codes.UNAUTHORIZED:
+        return AgentQLAuthenticationError(UNAUTHORIZED_ERROR_MESSAGE, **kwargs)
+    if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+        return AgentQLRateLimitError(message, retry_after=parse_retry_after(response), **kwargs)
+    return AgentQLAPIError(message, **kwargs)
+
+
+def from_transport_error(e: httpx.TransportError, policy: RetryPolicy = DEFAULT_RETRY_POLICY) -> AgentQLConnectionError:
+    """
+    Convert an error of the HTTP transport.
+    Args:
+        e: The error raised by the HTTP client.
+        policy: The retry policy that decides whether the error is retryable.
+    Returns:
+        AgentQLConnectionError: The error.
+    """
+    error_class = AgentQLTimeoutError if isinstance(e, httpx.TimeoutException) else AgentQLConnectionError
+    return error_class(f"{type(e).__name__}: {e}", retryable=policy.is_retryable(e))
+
+
+def from_callback(body: dict) -> AgentQLAPIError:
+    """
+    Convert the `error_info` of a result posted to a webhook URL.
+    Args:
+        body: The callback body.
+    Returns:
+        AgentQLAPIError: The error.
+    """
+    return AgentQLAPIError(body["error_info"], request_id=get_request_id(body))
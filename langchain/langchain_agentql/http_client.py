@@ -0,0 +1,106 @@
+"""Shared, pooled HTTP clients for the AgentQL REST API.
+
+``httpx`` keeps TCP/TLS connections alive inside a client's connection pool, so
+reusing a single client across calls avoids a fresh handshake for every
+extraction. This module keeps one process-wide sync client and one async client
+per running event loop (an ``httpx.AsyncClient`` must not be shared between
+event loops).
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+
+from langchain_agentql.const import (
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+_lock = threading.Lock()
+_limits = httpx.Limits(
+    max_connections=DEFAULT_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+)
+_sync_client: Optional[httpx.Client] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def configure_http_clients(
+    max_connections: Optional[int] = DEFAULT_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+) -> None:
+    """
+    Configure the connection pool limits of the shared clients.
+    The shared sync client is closed and recreated on next use. Async clients are
+    dropped and recreated on next use; close them first with ``aclose_http_clients``
+    if they are in use.
+    Args:
+        max_connections: Maximum number of concurrent connections per client.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+    """
+    global _limits, _sync_client
+    with _lock:
+        _limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+        _async_clients.clear()
+
+
+def get_sync_client() -> httpx.Client:
+    """
+    Get the shared sync HTTP client, creating it on first use.
+    Returns:
+        httpx.Client: The shared client.
+    """
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(limits=_limits)
+        return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client of the running event loop, creating it on first use.
+    Returns:
+        httpx.AsyncClient: The shared client.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_limits)
+            _async_clients[loop] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close the shared sync HTTP client."""
+    global _sync_client
+    with _lock:
+        client, _sync_client = _sync_client, None
+    if client is not None:
+        client.close()
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared async HTTP client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -1,68 +1,119 @@
-from typing import Optional
+from typing import Any, AsyncGenerator, Generator, List, Optional, Tuple
 
 import httpx
 
-from langchain_agentql.const import EXTRACT_DATA_ENDPOINT, REQUEST_ORIGIN
+from langchain_agentql.cache import BaseCache, make_cache_key
+from langchain_agentql.client import AgentQLClient
+from langchain_agentql.const import EXTRACT_DATA_ASYNC_PATH, EXTRACT_DATA_PATH
+from langchain_agentql.endpoints import BaseURL
+from langchain_agentql.errors import AgentQLTimeoutError, get_request_id
 from langchain_agentql.messages import (
+    DEADLINE_EXCEEDED_ERROR_MESSAGE,
     QUERY_PROMPT_REQUIRED_ERROR_MESSAGE,
     QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE,
-    UNAUTHORIZED_ERROR_MESSAGE,
 )
+from langchain_agentql.query import normalize_query
+from langchain_agentql.rate_limit import RateLimiter
+from langchain_agentql.retry import RetryPolicy
+from langchain_agentql.single_flight import SingleFlight
+from langchain_agentql.streaming import (
+    SCREENSHOT_PATH,
+    AsyncExtractionStream,
+    ExtractionStream,
+    JSONStreamParser,
+    ScreenshotTarget,
+    ScreenshotWriter,
+    to_item_path,
+)
+from langchain_agentql.timeouts import Deadline, TimeoutLike, Timeouts, get_deadline
+from langchain_agentql.tracing import CallTrace
+from langchain_agentql.webhook import CallbackReceiver
 
-
-def handle_http_error(e: httpx.HTTPStatusError) -> None:
-    response = e.response
-    if response.status_code == httpx.codes.UNAUTHORIZED:
-        raise ValueError(UNAUTHORIZED_ERROR_MESSAGE) from e
-    
-    msg = response.text
-    try:
-        error_json = response.json()
-        msg = (
-            error_json["error_info"]
-            if "error_info" in error_json
-            else str(error_json)
-        )
-    except (ValueError, TypeError):
-        msg = f"HTTP {e}."
-    raise ValueError(msg) from e
+# Identical requests in flight at the same time share one call to the API.
+_single_flight = SingleFlight()
 
 
-def load_data(
+def _build_payload(
     url: str,
-    api_key: str,
     metadata: dict,
     params: dict,
-    timeout: int,
-    query: Optional[str] = None,
-    prompt: Optional[str] = None,
+    query: Optional[str],
+    prompt: Optional[str],
 ) -> dict:
     if not query and not prompt:
         raise ValueError(QUERY_PROMPT_REQUIRED_ERROR_MESSAGE)
     if query and prompt:
         raise ValueError(QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE)
+    if query:
+        # Reject malformed queries before any request, and send the canonical form so that cache keys match
+        query = normalize_query(query)
 
-    payload = {"url": url, "query": query, "prompt": prompt, "params": params, "metadata": metadata}
+    return {"url": url, "query": query, "prompt": prompt, "params": params, "metadata": metadata}
 
-    headers = {
-        "X-API-Key": f"{api_key}",
-        "Content-Type": "application/json",
-        "X-TF-Request-Origin": REQUEST_ORIGIN,
-    }
 
-    try:
-        response = httpx.post(
-            EXTRACT_DATA_ENDPOINT,
-            headers=headers,
-            json=payload,
-            timeout=timeout,
+def load_data(
+    url: str,
+    api_key: str,
+    metadata: dict,
+    params: dict,
+    timeout: TimeoutLike,
+    query: Optional[str] = None,
+    prompt: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
+    cache: Optional[BaseCache] = None,
+    cache_max_age: Optional[float] = None,
+    bypass_cache: bool = False,
+    coalesce: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    base_url: Optional[BaseURL] = None,
+    callback_receiver: Optional[CallbackReceiver] = None,
+    deadline: Optional[Deadline] = None,
+    trace: Optional[CallTrace] = None,
+) -> dict:
+    payload = _build_payload(url, metadata, params, query, prompt)
+    timeouts = Timeouts.of(timeout)
+    deadline = get_deadline(timeouts.total).earliest(deadline)
+    cache_key = make_cache_key(url, payload["query"], prompt, params, metadata)
+    trace = trace if trace is not None else CallTrace("agentql.query_data")
+    trace.set(url=url)
+
+    with trace.run():
+        if cache is not None and not bypass_cache:
+            with trace.phase("cache"):
+                cached = cache.get(cache_key, max_age=cache_max_age)
+            trace.set(cache_hit=cached is not None)
+            if cached is not None:
+                return cached
+
+        api = AgentQLClient(
+            api_key,
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            http_client=client,
+            trace=trace,
         )
-        response.raise_for_status()
 
-    except httpx.HTTPStatusError as e:
-        handle_http_error(e)
-    else:
-        return response.json()
+        def fetch() -> dict:
+            if callback_receiver is None:
+                data = api.post(EXTRACT_DATA_PATH, payload, timeouts, deadline)
+            else:
+                with callback_receiver.expect() as callback:
+                    body = {**payload, "webhook_url": callback.url}
+                    submission = api.post(EXTRACT_DATA_ASYNC_PATH, body, timeouts, deadline)
+                    callback.bind_request_id(submission)
+                    with trace.phase("callback"):
+                        data = callback.result(deadline.remaining())
+                trace.set(request_id=get_request_id(data))
+
+            if cache is not None:
+                cache.set(cache_key, data)
+            return data
+
+        if coalesce:
+            return _single_flight.do((api_key, cache_key), fetch, deadline)
+        return fetch()
 
 
 async def aload_data(
@@ -70,34 +121,217 @@ async def aload_data(
     api_key: str,
     metadata: dict,
     params: dict,
-    timeout: int,
+    timeout: TimeoutLike,
     query: Optional[str] = None,
     prompt: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    cache: Optional[BaseCache] = None,
+    cache_max_age: Optional[float] = None,
+    bypass_cache: bool = False,
+    coalesce: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    base_url: Optional[BaseURL] = None,
+    callback_receiver: Optional[CallbackReceiver] = None,
+    deadline: Optional[Deadline] = None,
+    trace: Optional[CallTrace] = None,
 ) -> dict:
-    if not query and not prompt:
-        raise ValueError(QUERY_PROMPT_REQUIRED_ERROR_MESSAGE)
-    if query and prompt:
-        raise ValueError(QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE)
+    payload = _build_payload(url, metadata, params, query, prompt)
+    timeouts = Timeouts.of(timeout)
+    deadline = get_deadline(timeouts.total).earliest(deadline)
+    cache_key = make_cache_key(url, payload["query"], prompt, params, metadata)
+    trace = trace if trace is not None else CallTrace("agentql.query_data")
+    trace.set(url=url)
+
+    with trace.run():
+        if cache is not None and not bypass_cache:
+            with trace.phase("cache"):
+                cached = cache.get(cache_key, max_age=cache_max_age)
+            trace.set(cache_hit=cached is not None)
+            if cached is not None:
+                return cached
+
+        api = AgentQLClient(
+            api_key,
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            async_http_client=client,
+            trace=trace,
+        )
+
+        async def fetch() -> dict:
+            if callback_receiver is None:
+                data = await api.apost(EXTRACT_DATA_PATH, payload, timeouts, deadline)
+            else:
+                with callback_receiver.expect() as callback:
+                    body = {**payload, "webhook_url": callback.url}
+                    submission = await api.apost(EXTRACT_DATA_ASYNC_PATH, body, timeouts, deadline)
+                    callback.bind_request_id(submission)
+                    with trace.phase("callback"):
+                        data = await callback.aresult(deadline.remaining())
+                trace.set(request_id=get_request_id(data))
 
-    payload = {"url": url, "query": query, "prompt": prompt, "params": params, "metadata": metadata}
+            if cache is not None:
+                cache.set(cache_key, data)
+            return data
 
-    headers = {
-        "X-API-Key": f"{api_key}",
-        "Content-Type": "application/json",
-        "X-TF-Request-Origin": REQUEST_ORIGIN,
-    }
+        if coalesce:
+            return await _single_flight.ado((api_key, cache_key), fetch, deadline)
+        return await fetch()
 
-    async with httpx.AsyncClient() as client:
+
+def _check_deadline(deadline: Deadline) -> None:
+    if deadline.expired:
+        raise AgentQLTimeoutError(DEADLINE_EXCEEDED_ERROR_MESSAGE)
+
+
+def _feed(parser: JSONStreamParser, chunk: str, trace: CallTrace) -> List[Any]:
+    with trace.phase("decode"):
+        return parser.feed(chunk)
+
+
+def _build_stream_parser(
+    item_path: Optional[str], screenshot: Optional[ScreenshotTarget]
+) -> Tuple[JSONStreamParser, Optional[ScreenshotWriter]]:
+    writer = ScreenshotWriter(screenshot) if screenshot is not None else None
+    sinks = {SCREENSHOT_PATH: writer.write} if writer is not None else None
+    return JSONStreamParser(item_path=to_item_path(item_path), string_sinks=sinks), writer
+
+
+def stream_data(
+    url: str,
+    api_key: str,
+    metadata: dict,
+    params: dict,
+    timeout: TimeoutLike,
+    query: Optional[str] = None,
+    prompt: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
+    item_path: Optional[str] = None,
+    screenshot: Optional[ScreenshotTarget] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    base_url: Optional[BaseURL] = None,
+    deadline: Optional[Deadline] = None,
+    trace: Optional[CallTrace] = None,
+) -> ExtractionStream:
+    """
+    Extract data, decoding the response as it is received instead of loading it whole.
+    Streamed responses are neither cached nor shared between identical requests.
+    Args:
+        item_path: Dotted path of a list in the extracted data, e.g. `products`, whose elements are yielded as they are decoded.
+        screenshot: File path or binary buffer the Base64 screenshot is written to instead of being kept in the metadata.
+        base_url: Base URL or base URLs of the AgentQL REST API. Defaults to the `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+        deadline: Deadline of the call, tightening the total timeout and the deadline of the current context. Streaming stops with an `AgentQLTimeoutError` once it is reached.
+        trace: Trace recording the timings of the call, complete once the stream is exhausted or closed.
+    Returns:
+        ExtractionStream: The list elements, with the rest of the response in `response` once exhausted.
+    """
+    payload = _build_payload(url, metadata, params, query, prompt)
+    timeouts = Timeouts.of(timeout)
+    deadline = get_deadline(timeouts.total).earliest(deadline)
+    trace = trace if trace is not None else CallTrace("agentql.stream_data")
+    trace.set(url=url)
+    api = AgentQLClient(
+        api_key,
+        base_url=base_url,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        http_client=client,
+        trace=trace,
+    )
+    parser, writer = _build_stream_parser(item_path, screenshot)
+
+    def items() -> Generator[Any, None, None]:
+        # Not run as the current span: the generator is suspended while the caller consumes the items
+        trace.start()
+        error = None
         try:
-            response = await client.post(
-                EXTRACT_DATA_ENDPOINT,
-                headers=headers,
-                json=payload,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-
-        except httpx.HTTPStatusError as e:
-            handle_http_error(e)
-        else:
-            return response.json()
+            with api.stream(EXTRACT_DATA_PATH, payload, timeouts, deadline) as response:
+                stream.request_id = response.headers.get("X-Request-Id")
+                for chunk in response.iter_text():
+                    yield from _feed(parser, chunk, trace)
+                    _check_deadline(deadline)
+                yield from parser.close()
+            trace.set(request_id=get_request_id(parser.document))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+            trace.finish(error)
+
+    stream = ExtractionStream(parser, items())
+    return stream
+
+
+def astream_data(
+    url: str,
+    api_key: str,
+    metadata: dict,
+    params: dict,
+    timeout: TimeoutLike,
+    query: Optional[str] = None,
+    prompt: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    item_path: Optional[str] = None,
+    screenshot: Optional[ScreenshotTarget] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    base_url: Optional[BaseURL] = None,
+    deadline: Optional[Deadline] = None,
+    trace: Optional[CallTrace] = None,
+) -> AsyncExtractionStream:
+    """
+    Extract data, decoding the response as it is received instead of loading it whole.
+    Streamed responses are neither cached nor shared between identical requests.
+    Args:
+        item_path: Dotted path of a list in the extracted data, e.g. `products`, whose elements are yielded as they are decoded.
+        screenshot: File path or binary buffer the Base64 screenshot is written to instead of being kept in the metadata.
+        base_url: Base URL or base URLs of the AgentQL REST API. Defaults to the `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`.
+        deadline: Deadline of the call, tightening the total timeout and the deadline of the current context. Streaming stops with an `AgentQLTimeoutError` once it is reached.
+        trace: Trace recording the timings of the call, complete once the stream is exhausted or closed.
+    Returns:
+        AsyncExtractionStream: The list elements, with the rest of the response in `response` once exhausted.
+    """
+    payload = _build_payload(url, metadata, params, query, prompt)
+    timeouts = Timeouts.of(timeout)
+    deadline = get_deadline(timeouts.total).earliest(deadline)
+    trace = trace if trace is not None else CallTrace("agentql.stream_data")
+    trace.set(url=url)
+    api = AgentQLClient(
+        api_key,
+        base_url=base_url,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        async_http_client=client,
+        trace=trace,
+    )
+    parser, writer = _build_stream_parser(item_path, screenshot)
+
+    async def items() -> AsyncGenerator[Any, None]:
+        # Not run as the current span: the generator is suspended while the caller consumes the items
+        trace.start()
+        error = None
+        try:
+            async with api.astream(EXTRACT_DATA_PATH, payload, timeouts, deadline) as response:
+                stream.request_id = response.headers.get("X-Request-Id")
+                async for chunk in response.aiter_text():
+                    for item in _feed(parser, chunk, trace):
+                        yield item
+                    _check_deadline(deadline)
+                for item in parser.close():
+                    yield item
+            trace.set(request_id=get_request_id(parser.document))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+            trace.finish(error)
+
+    stream = AsyncExtractionStream(parser, items())
+    return stream
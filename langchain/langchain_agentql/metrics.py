@@ -0,0 +1,372 @@
+"""Process-wide metrics of AgentQL calls, exportable in the OpenMetrics text format.
+
+Every call of the tools, the loader, `load_data` and the streams is recorded when its `CallTrace` finishes: counts by
+outcome and status code, latencies, attempts, bytes sent and received, calls in flight and cache lookups, along with the
+browser pages wrapped and checked out of page pools. Serve the OpenMetrics text from your worker, or push snapshots to
+an exporter:
+
+.. code-block:: python
+
+    from langchain_agentql.metrics import OpenMetricsFileExporter, PeriodicExporter, get_registry
+
+    get_registry().to_openmetrics()  # e.g. the body of a /metrics endpoint
+
+    # or write it every 15 seconds for the node exporter's textfile collector
+    with PeriodicExporter(OpenMetricsFileExporter("/var/lib/node_exporter/agentql.prom"), interval=15):
+        ...
+"""
+
+import asyncio
+import math
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from langchain_agentql.const import (
+    DEFAULT_LATENCY_BUCKETS_SECONDS,
+    DEFAULT_METRICS_EXPORT_INTERVAL_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from langchain_agentql.tracing import CallTrace
+
+
+@dataclass(frozen=True)
+class Sample:
+    """A value of a metric, with its labels."""
+
+    name: str
+    labels: Dict[str, str]
+    value: float
+
+
+@dataclass(frozen=True)
+class MetricFamily:
+    """A snapshot of a metric and its samples."""
+
+    name: str
+    type: str
+    help: str
+    samples: List[Sample] = field(default_factory=list)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple("" if labels.get(name) is None else str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def _add(self, amount: float, labels: Dict[str, Any]) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = dict(self._values)
+        return MetricFamily(
+            self.name, self.type, self.help, [Sample(self.name, self._labels(key), v) for key, v in values.items()]
+        )
+
+
+class Counter(_Metric):
+    """A value that only goes up, e.g. a number of calls. Its sample is named `<name>_total`."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        self._add(amount, labels)
+
+    def collect(self) -> MetricFamily:
+        family = super().collect()
+        samples = [Sample(f"{self.name}_total", sample.labels, sample.value) for sample in family.samples]
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, e.g. a number of calls in flight."""
+
+    type = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self._add(-amount, labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """A distribution of values, e.g. latencies, counted in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECONDS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted({*buckets, math.inf}))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        samples = []
+        for key, (counts, total) in values.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                samples.append(Sample(f"{self.name}_bucket", {**labels, "le": _format_value(float(bound))}, cumulative))
+            samples.append(Sample(f"{self.name}_count", labels, cumulative))
+            samples.append(Sample(f"{self.name}_sum", labels, total))
+        return MetricFamily(self.name, self.type, self.help, samples)
+
+
+class MetricsRegistry:
+    """The metrics of a process."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            self._metrics.setdefault(metric.name, metric)
+            return self._metrics[metric.name]
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Register a counter, or get the counter already registered with the name."""
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Register a gauge, or get the gauge already registered with the name."""
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECONDS,
+    ) -> Histogram:
+        """Register a histogram, or get the histogram already registered with the name."""
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def collect(self) -> List[MetricFamily]:
+        """Take a snapshot of all metrics."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [metric.collect() for metric in metrics]
+
+    def get_sample_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """
+        Get the current value of a sample, e.g. `agentql_requests_total`.
+        Returns:
+            Optional[float]: The value, or `None` if the sample was never recorded.
+        """
+        for family in self.collect():
+            for sample in family.samples:
+                if sample.name == name and sample.labels == (labels or {}):
+                    return sample.value
+        return None
+
+    def to_openmetrics(self) -> str:
+        """Get a snapshot of all metrics in the OpenMetrics text format."""
+        return to_openmetrics(self.collect())
+
+
+def _format_value(value: Union[int, float]) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_openmetrics(families: List[MetricFamily]) -> str:
+    """Format metric snapshots in the OpenMetrics text format."""
+    lines = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in sample.labels.items())
+            name = f"{sample.name}{{{labels}}}" if labels else sample.name
+            lines.append(f"{name} {_format_value(sample.value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter(ABC):
+    """Receives snapshots of the metrics, e.g. to push them to a monitoring system."""
+
+    @abstractmethod
+    def export(self, families: List[MetricFamily]) -> None:
+        """Export a snapshot of the metrics."""
+
+    def shutdown(self) -> None:
+        """Release the resources of the exporter."""
+
+
+class OpenMetricsFileExporter(MetricsExporter):
+    """Writes snapshots in the OpenMetrics text format to a file, replaced atomically, e.g. for a textfile collector."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, families: List[MetricFamily]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".agentql-metrics-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(to_openmetrics(families))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class PeriodicExporter:
+    """Exports snapshots of a registry from a background thread, and a last one when stopped."""
+
+    def __init__(
+        self,
+        exporter: MetricsExporter,
+        interval: float = DEFAULT_METRICS_EXPORT_INTERVAL_SECONDS,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            exporter: The exporter of the snapshots.
+            interval: Seconds between snapshots. Defaults to 60.
+            registry: The registry to export. Defaults to the process-wide registry.
+        """
+        self.exporter = exporter
+        self.interval = interval
+        self.registry = registry or _registry
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.exporter.export(self.registry.collect())
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="agentql-metrics-exporter", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.exporter.export(self.registry.collect())
+        self.exporter.shutdown()
+
+    def __enter__(self) -> "PeriodicExporter":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+REQUESTS = _registry.counter(
+    "agentql_requests", "AgentQL calls by operation, outcome and HTTP status code.", ("operation", "outcome", "status")
+)
+REQUEST_DURATION = _registry.histogram(
+    "agentql_request_duration_seconds", "Duration of AgentQL calls, including retries.", ("operation", "outcome")
+)
+REQUEST_ATTEMPTS = _registry.counter(
+    "agentql_request_attempts", "HTTP attempts of AgentQL calls, including retries.", ("operation",)
+)
+REQUEST_BYTES = _registry.counter(
+    "agentql_request_bytes", "Bytes of the request bodies sent, including retries.", ("operation",)
+)
+RESPONSE_BYTES = _registry.counter("agentql_response_bytes", "Bytes of the response bodies received.", ("operation",))
+REQUESTS_IN_FLIGHT = _registry.gauge("agentql_requests_in_flight", "AgentQL calls in progress.", ("operation",))
+CACHE_LOOKUPS = _registry.counter("agentql_cache_lookups", "Lookups of the result cache by result.", ("result",))
+BROWSER_PAGES_WRAPPED = _registry.gauge("agentql_browser_pages_wrapped", "Playwright pages wrapped with AgentQL.")
+BROWSER_PAGES_IN_USE = _registry.gauge("agentql_browser_pages_in_use", "Pages checked out of page pools.")
+BROWSER_PAGES_OPENED = _registry.counter(
+    "agentql_browser_pages_opened", "Pages opened in browsers of browser managers."
+)
+
+
+def _get_outcome(error: Optional[BaseException]) -> str:
+    if error is None:
+        return "success"
+    if isinstance(error, (GeneratorExit, asyncio.CancelledError, KeyboardInterrupt)):
+        return "cancelled"
+    # Timeouts of Playwright and AgentQL are not `TimeoutError`s
+    if isinstance(error, TimeoutError) or "Timeout" in type(error).__name__:
+        return "timeout"
+    return "error"
+
+
+def record_call_started(trace: "CallTrace") -> None:
+    """Record a call starting."""
+    REQUESTS_IN_FLIGHT.inc(operation=trace.operation)
+
+
+def record_call(trace: "CallTrace") -> None:
+    """Record a finished call."""
+    operation = trace.operation
+    outcome = _get_outcome(trace.error)
+    attributes = trace.attributes
+    REQUESTS_IN_FLIGHT.dec(operation=operation)
+    REQUESTS.inc(operation=operation, outcome=outcome, status=attributes.get("status_code"))
+    if trace.duration is not None:
+        REQUEST_DURATION.observe(trace.duration, operation=operation, outcome=outcome)
+    if trace.attempts:
+        REQUEST_ATTEMPTS.inc(trace.attempts, operation=operation)
+    if "request_bytes" in attributes:
+        REQUEST_BYTES.inc(attributes["request_bytes"] * trace.attempts, operation=operation)
+    if "response_bytes" in attributes:
+        RESPONSE_BYTES.inc(attributes["response_bytes"], operation=operation)
+    if "cache_hit" in attributes:
+        CACHE_LOOKUPS.inc(result="hit" if attributes["cache_hit"] else "miss")
@@ -0,0 +1,224 @@
+"""Cache of browser extraction results, valid while the page's document is unchanged.
+
+A `PageResultCache` keeps the results of `ExtractWebDataBrowserTool` by page, URL, query or prompt and
+extraction options. Each result is tagged with the DOM version of the page it was extracted from: a
+counter of DOM mutations kept by a `MutationObserver` injected into the page, together with a token
+of the document. Navigating replaces the document and any DOM mutation, other than the annotations AgentQL
+adds when it queries the page, bumps the counter, so both invalidate the cached results of the page;
+reading the version is a single `page.evaluate` call:
+
+.. code-block:: python
+
+    from langchain_agentql.page_cache import PageResultCache
+
+    tool = ExtractWebDataBrowserTool(async_page=page, page_cache=PageResultCache())
+"""
+
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from langchain_agentql.const import DEFAULT_PAGE_CACHE_MAX_SIZE
+from langchain_agentql.tracing import CallTrace
+
+try:
+    from playwright.async_api import Error as AsyncPlaywrightError
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Error as SyncPlaywrightError
+    from playwright.sync_api import Page as SyncPage
+except ImportError as e:
+    raise ImportError(
+        "Unable to import playwright. Please make sure playwright module is properly installed."
+    ) from e
+
+# Installs the mutation observer on first use in a document and returns the DOM version. Mutations AgentQL makes
+# when it queries the page are not counted: the attributes it annotates elements with, and the spans it wraps text in,
+# inserted before the text nodes they replace.
+DOM_VERSION_SCRIPT = """() => {
+  let state = window.__agentqlDomVersion;
+  if (!state) {
+    state = window.__agentqlDomVersion = {
+      document: Math.random().toString(36).slice(2) + Date.now().toString(36),
+      version: 0,
+    };
+    const wrappedTexts = new WeakSet();
+    const isAgentQLMutation = (m) => {
+      if (m.type === "attributes") {
+        return m.attributeName.startsWith("tf623") || m.attributeName === "iframe_path";
+      }
+      if (m.type !== "childList") {
+        return false;
+      }
+      const [added, ...otherAdded] = m.addedNodes;
+      if (added && !otherAdded.length && !m.removedNodes.length) {
+        const isWrapper = added.nodeName === "SPAN" && added.hasAttribute("tf623_id");
+        if (isWrapper && m.nextSibling && m.nextSibling.nodeType === Node.TEXT_NODE) {
+          wrappedTexts.add(m.nextSibling);
+          return true;
+        }
+        return false;
+      }
+      return !m.addedNodes.length && Array.from(m.removedNodes).every((node) => wrappedTexts.has(node));
+    };
+    new MutationObserver((mutations) => {
+      // Every mutation is checked, so that the text nodes of all wrappers are known
+      if (mutations.filter((m) => !isAgentQLMutation(m)).length) {
+        state.version += 1;
+      }
+    }).observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+  }
+  return `${state.document}:${state.version}`;
+}"""
+
+
+class _PageEntries:
+    def __init__(self, dom_version: str):
+        self.dom_version = dom_version
+        self.results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+
+class PageResultCache:
+    """
+    Thread-safe LRU cache of browser extraction results by page, invalidated when the page navigates or its DOM changes.
+    Entries of a page are released with the page. Results are only cached if the page did not change while they were
+    extracted, other than by AgentQL itself, so a page that is still loading is extracted again.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PAGE_CACHE_MAX_SIZE):
+        """
+        Args:
+            max_size: Maximum number of results kept per page. The least recently used result is evicted first.
+        """
+        self.max_size = max_size
+        self._pages: "weakref.WeakKeyDictionary[Any, _PageEntries]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, page: Any, key: Hashable, dom_version: str) -> Optional[Any]:
+        """
+        Look up the result of an extraction.
+        Args:
+            page: The page the data was extracted from.
+            key: Identifies the extraction, e.g. the URL, query and options.
+            dom_version: The current DOM version of the page. Entries of other versions are dropped.
+        Returns:
+            Optional[Any]: A copy of the cached result, or `None` on a miss.
+        """
+        with self._lock:
+            entries = self._pages.get(page)
+            if entries is not None and entries.dom_version != dom_version:
+                del self._pages[page]
+                return None
+            if entries is None or key not in entries.results:
+                return None
+            entries.results.move_to_end(key)
+            value = entries.results[key]
+        return copy.deepcopy(value)
+
+    def set(self, page: Any, key: Hashable, dom_version: str, value: Any) -> None:
+        """
+        Store the result of an extraction, dropping the results of other DOM versions of the page.
+        Args:
+            page: The page the data was extracted from.
+            key: Identifies the extraction.
+            dom_version: The DOM version of the page the data was extracted from.
+            value: The extracted data.
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            entries = self._pages.get(page)
+            if entries is None or entries.dom_version != dom_version:
+                entries = self._pages[page] = _PageEntries(dom_version)
+            entries.results[key] = value
+            entries.results.move_to_end(key)
+            while len(entries.results) > self.max_size:
+                entries.results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries.results) for entries in self._pages.values())
+
+    def get_or_extract(
+        self, page: SyncPage, key: Hashable, extract: Callable[[], Any], trace: CallTrace, bypass: bool = False
+    ) -> Any:
+        """
+        Get the cached result of an extraction from the page, or run it and cache its result.
+        Args:
+            page: The page to extract data from.
+            key: Identifies the extraction.
+            extract: Runs the extraction.
+            trace: Trace of the call, recording the `cache` phase and whether the cache was hit.
+            bypass: Whether to skip the lookup. The result is still cached.
+        Returns:
+            The extracted data.
+        """
+        with trace.phase("cache"):
+            dom_version = _dom_version(page)
+        if dom_version is None:
+            return extract()
+        cached = None if bypass else self.get(page, key, dom_version)
+        trace.set(cache_hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        data = extract()
+        # The version differs if the page navigated or changed during the extraction
+        if _dom_version(page) == dom_version:
+            self.set(page, key, dom_version, data)
+        return data
+
+    async def aget_or_extract(
+        self,
+        page: AsyncPage,
+        key: Hashable,
+        extract: Callable[[], Awaitable[Any]],
+        trace: CallTrace,
+        bypass: bool = False,
+    ) -> Any:
+        """
+        Get the cached result of an extraction from the page, or run it and cache its result.
+        Args:
+            page: The page to extract data from.
+            key: Identifies the extraction.
+            extract: Runs the extraction.
+            trace: Trace of the call, recording the `cache` phase and whether the cache was hit.
+            bypass: Whether to skip the lookup. The result is still cached.
+        Returns:
+            The extracted data.
+        """
+        with trace.phase("cache"):
+            dom_version = await _adom_version(page)
+        if dom_version is None:
+            return await extract()
+        cached = None if bypass else self.get(page, key, dom_version)
+        trace.set(cache_hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        data = await extract()
+        # The version differs if the page navigated or changed during the extraction
+        if await _adom_version(page) == dom_version:
+            self.set(page, key, dom_version, data)
+        return data
+
+
+def _dom_version(page: SyncPage) -> Optional[str]:
+    """Get the DOM version of the page, or `None` if it is navigating or closed."""
+    try:
+        return page.evaluate(DOM_VERSION_SCRIPT)
+    except SyncPlaywrightError:
+        return None
+
+
+async def _adom_version(page: AsyncPage) -> Optional[str]:
+    """Get the DOM version of the page, or `None` if it is navigating or closed."""
+    try:
+        return await page.evaluate(DOM_VERSION_SCRIPT)
+    except AsyncPlaywrightError:
+        return None
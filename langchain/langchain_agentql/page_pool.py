@@ -0,0 +1,396 @@
+"""Pools of pre-warmed, AgentQL-wrapped Playwright pages.
+
+A single browser can only serve one extraction at a time through its "current page".
+A page pool keeps several pages open, each in its own browser context by default, and
+lends them out so that one Chromium process can serve many concurrent agent sessions:
+
+.. code-block:: python
+
+    async with AsyncPagePool(async_browser, size=8) as pool:
+        async with pool.acquire() as page:
+            await page.goto("https://www.agentql.com/blog")
+            tools = AgentQLBrowserToolkit(async_page=page).get_tools()
+"""
+
+import asyncio
+import queue
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+import agentql  # type: ignore[import-untyped]
+
+from langchain_agentql.const import DEFAULT_PAGE_POOL_MAX_USES, DEFAULT_PAGE_POOL_SIZE
+from langchain_agentql.errors import AgentQLTimeoutError
+from langchain_agentql.messages import (
+    CLOSED_PAGE_POOL_ERROR_MESSAGE,
+    INVALID_PAGE_POOL_SIZE_ERROR_MESSAGE,
+    PAGE_POOL_TIMEOUT_ERROR_MESSAGE,
+)
+from langchain_agentql.metrics import BROWSER_PAGES_IN_USE, BROWSER_PAGES_WRAPPED
+
+try:
+    from playwright.async_api import Browser as AsyncBrowser
+    from playwright.async_api import Error as AsyncPlaywrightError
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Browser as SyncBrowser
+    from playwright.sync_api import Error as SyncPlaywrightError
+    from playwright.sync_api import Page as SyncPage
+except ImportError as e:
+    raise ImportError(
+        "Unable to import playwright. Please make sure playwright module is properly installed."
+    ) from e
+
+BLANK_PAGE_URL = "about:blank"
+
+# An idle slot of a pool is either an open page, or `None` for a page to open on its next checkout,
+# e.g. after replacing a page failed. Closing a pool puts a `None` in its queue to wake the waiters,
+# which pass it on to each other.
+
+
+@dataclass
+class _PooledPage:
+    page: Any
+    context: Optional[Any]
+    uses: int = 0
+
+
+class AsyncPagePool:
+    """Pool of pre-warmed, AgentQL-wrapped pages of an async Playwright browser."""
+
+    def __init__(
+        self,
+        browser: AsyncBrowser,
+        size: int = DEFAULT_PAGE_POOL_SIZE,
+        max_uses: Optional[int] = DEFAULT_PAGE_POOL_MAX_USES,
+        isolate_contexts: bool = True,
+        reset_on_release: bool = True,
+    ):
+        """
+        Args:
+            browser: The browser to open pages in.
+            size: Number of pages in the pool. Defaults to 4.
+            max_uses: Number of checkouts after which a page is closed and replaced by a fresh one. `None` never recycles pages. Defaults to 50.
+            isolate_contexts: Whether to open each page in its own browser context, so sessions do not share cookies and storage. Defaults to `True`.
+            reset_on_release: Whether to navigate a page to `about:blank` when it is returned to the pool, freeing the memory of the previous web page. Defaults to `True`.
+        """
+        if size < 1:
+            raise ValueError(INVALID_PAGE_POOL_SIZE_ERROR_MESSAGE)
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.isolate_contexts = isolate_contexts
+        self.reset_on_release = reset_on_release
+        self._idle: "asyncio.Queue[Optional[_PooledPage]]" = asyncio.Queue()
+        self._pages: List[_PooledPage] = []
+        self._started = False
+        self._closed = False
+
+    async def _open(self) -> _PooledPage:
+        context = await self.browser.new_context() if self.isolate_contexts else None
+        page = None
+        try:
+            page = await (context.new_page() if context else self.browser.new_page())
+            entry = _PooledPage(page=await agentql.wrap_async(page), context=context)
+        except BaseException:
+            # Close what was opened of the page
+            if context is not None or page is not None:
+                await self._discard(_PooledPage(page=page, context=context))
+            raise
+        self._pages.append(entry)
+        BROWSER_PAGES_WRAPPED.inc()
+        return entry
+
+    async def _discard(self, entry: _PooledPage) -> None:
+        if entry in self._pages:
+            self._pages.remove(entry)
+            BROWSER_PAGES_WRAPPED.dec()
+        try:
+            if entry.context:
+                await entry.context.close()
+            else:
+                await entry.page.close()
+        except AsyncPlaywrightError:
+            # The page or browser already went away
+            pass
+
+    async def _is_healthy(self, entry: _PooledPage) -> bool:
+        if entry.page.is_closed() or not self.browser.is_connected():
+            return False
+        try:
+            await entry.page.evaluate("1")
+        except AsyncPlaywrightError:
+            return False
+        return True
+
+    async def start(self) -> None:
+        """Open and wrap all the pages of the pool. Pages that fail to open are opened on their first checkout."""
+        if self._started:
+            return
+        self._started = True
+        results = await asyncio.gather(*(self._open() for _ in range(self.size)), return_exceptions=True)
+        for result in results:
+            self._idle.put_nowait(result if isinstance(result, _PooledPage) else None)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+    @asynccontextmanager
+    async def acquire(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncPage]:
+        """
+        Check out a healthy page for the duration of the block, waiting for one to be returned if all are in use.
+        Args:
+            timeout: Maximum number of seconds to wait for a page. `None` waits until one is returned. Defaults to `None`.
+        Returns:
+            AsyncIterator[Page]: The AgentQL-wrapped page.
+        Raises:
+            AgentQLTimeoutError: No page was returned within `timeout` seconds.
+            RuntimeError: The pool is closed, or was closed while waiting.
+        """
+        if self._closed:
+            raise RuntimeError(CLOSED_PAGE_POOL_ERROR_MESSAGE)
+        await self.start()
+        try:
+            entry = await asyncio.wait_for(self._idle.get(), timeout)
+        except asyncio.TimeoutError:
+            raise AgentQLTimeoutError(PAGE_POOL_TIMEOUT_ERROR_MESSAGE.format(timeout=timeout)) from None
+        if self._closed:
+            self._idle.put_nowait(None)
+            if entry is not None:
+                await self._discard(entry)
+            raise RuntimeError(CLOSED_PAGE_POOL_ERROR_MESSAGE)
+        try:
+            if entry is None or not await self._is_healthy(entry):
+                if entry is not None:
+                    await self._discard(entry)
+                    entry = None
+                entry = await self._open()
+        except BaseException:
+            # Keep the pool at its size, the page is replaced on its next checkout
+            self._idle.put_nowait(entry)
+            raise
+
+        BROWSER_PAGES_IN_USE.inc()
+        try:
+            yield entry.page
+        finally:
+            BROWSER_PAGES_IN_USE.dec()
+            entry.uses += 1
+            await self._release(entry)
+
+    async def _release(self, entry: _PooledPage) -> None:
+        if self._closed:
+            await self._discard(entry)
+            return
+        slot: Optional[_PooledPage] = entry
+        try:
+            if (self.max_uses is not None and entry.uses >= self.max_uses) or entry.page.is_closed():
+                slot = None
+                await self._discard(entry)
+                slot = await self._open()
+            elif self.reset_on_release:
+                try:
+                    await entry.page.goto(BLANK_PAGE_URL)
+                except AsyncPlaywrightError:
+                    slot = None
+                    await self._discard(entry)
+                    slot = await self._open()
+        finally:
+            # Return the slot even if replacing the page failed, it is then refilled on its next checkout
+            if self._closed and slot is not None:
+                await self._discard(slot)
+            else:
+                self._idle.put_nowait(slot)
+
+    async def close(self) -> None:
+        """Close all pages of the pool and wake the callers waiting for a page. Pages in use are closed when they are returned."""
+        self._closed = True
+        idle = []
+        while not self._idle.empty():
+            idle.append(self._idle.get_nowait())
+        self._idle.put_nowait(None)
+        for entry in idle:
+            if entry is not None:
+                await self._discard(entry)
+
+    async def __aenter__(self) -> "AsyncPagePool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class SyncPagePool:
+    """
+    Pool of pre-warmed, AgentQL-wrapped pages of a sync Playwright browser.
+    Sync Playwright objects may only be used from the thread that created them, so the pool must be used from that thread as well.
+    """
+
+    def __init__(
+        self,
+        browser: SyncBrowser,
+        size: int = DEFAULT_PAGE_POOL_SIZE,
+        max_uses: Optional[int] = DEFAULT_PAGE_POOL_MAX_USES,
+        isolate_contexts: bool = True,
+        reset_on_release: bool = True,
+    ):
+        """
+        Args:
+            browser: The browser to open pages in.
+            size: Number of pages in the pool. Defaults to 4.
+            max_uses: Number of checkouts after which a page is closed and replaced by a fresh one. `None` never recycles pages. Defaults to 50.
+            isolate_contexts: Whether to open each page in its own browser context, so sessions do not share cookies and storage. Defaults to `True`.
+            reset_on_release: Whether to navigate a page to `about:blank` when it is returned to the pool, freeing the memory of the previous web page. Defaults to `True`.
+        """
+        if size < 1:
+            raise ValueError(INVALID_PAGE_POOL_SIZE_ERROR_MESSAGE)
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.isolate_contexts = isolate_contexts
+        self.reset_on_release = reset_on_release
+        self._idle: "queue.Queue[Optional[_PooledPage]]" = queue.Queue()
+        self._pages: List[_PooledPage] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def _open(self) -> _PooledPage:
+        context = self.browser.new_context() if self.isolate_contexts else None
+        page = None
+        try:
+            page = context.new_page() if context else self.browser.new_page()
+            entry = _PooledPage(page=agentql.wrap(page), context=context)
+        except BaseException:
+            # Close what was opened of the page
+            if context is not None or page is not None:
+                self._discard(_PooledPage(page=page, context=context))
+            raise
+        self._pages.append(entry)
+        BROWSER_PAGES_WRAPPED.inc()
+        return entry
+
+    def _discard(self, entry: _PooledPage) -> None:
+        if entry in self._pages:
+            self._pages.remove(entry)
+            BROWSER_PAGES_WRAPPED.dec()
+        try:
+            if entry.context:
+                entry.context.close()
+            else:
+                entry.page.close()
+        except SyncPlaywrightError:
+            # The page or browser already went away
+            pass
+
+    def _is_healthy(self, entry: _PooledPage) -> bool:
+        if entry.page.is_closed() or not self.browser.is_connected():
+            return False
+        try:
+            entry.page.evaluate("1")
+        except SyncPlaywrightError:
+            return False
+        return True
+
+    def start(self) -> None:
+        """Open and wrap all the pages of the pool. Pages that fail to open are opened on their first checkout."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for _ in range(self.size):
+            try:
+                entry: Optional[_PooledPage] = self._open()
+            except Exception:
+                entry = None
+            self._idle.put_nowait(entry)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[SyncPage]:
+        """
+        Check out a healthy page for the duration of the block.
+        Args:
+            timeout: Maximum number of seconds to wait for a page. `None` waits until one is returned. Defaults to `None`.
+        Returns:
+            Iterator[Page]: The AgentQL-wrapped page.
+        Raises:
+            AgentQLTimeoutError: No page was returned within `timeout` seconds.
+            RuntimeError: The pool is closed, or was closed while waiting.
+        """
+        if self._closed:
+            raise RuntimeError(CLOSED_PAGE_POOL_ERROR_MESSAGE)
+        self.start()
+        try:
+            entry = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise AgentQLTimeoutError(PAGE_POOL_TIMEOUT_ERROR_MESSAGE.format(timeout=timeout)) from None
+        if self._closed:
+            self._idle.put_nowait(None)
+            if entry is not None:
+                self._discard(entry)
+            raise RuntimeError(CLOSED_PAGE_POOL_ERROR_MESSAGE)
+        try:
+            if entry is None or not self._is_healthy(entry):
+                if entry is not None:
+                    self._discard(entry)
+                    entry = None
+                entry = self._open()
+        except BaseException:
+            # Keep the pool at its size, the page is replaced on its next checkout
+            self._idle.put_nowait(entry)
+            raise
+
+        BROWSER_PAGES_IN_USE.inc()
+        try:
+            yield entry.page
+        finally:
+            BROWSER_PAGES_IN_USE.dec()
+            entry.uses += 1
+            self._release(entry)
+
+    def _release(self, entry: _PooledPage) -> None:
+        if self._closed:
+            self._discard(entry)
+            return
+        slot: Optional[_PooledPage] = entry
+        try:
+            if (self.max_uses is not None and entry.uses >= self.max_uses) or entry.page.is_closed():
+                slot = None
+                self._discard(entry)
+                slot = self._open()
+            elif self.reset_on_release:
+                try:
+                    entry.page.goto(BLANK_PAGE_URL)
+                except SyncPlaywrightError:
+                    slot = None
+                    self._discard(entry)
+                    slot = self._open()
+        finally:
+            # Return the slot even if replacing the page failed, it is then refilled on its next checkout
+            if self._closed and slot is not None:
+                self._discard(slot)
+            else:
+                self._idle.put_nowait(slot)
+
+    def close(self) -> None:
+        """Close all pages of the pool and wake the callers waiting for a page. Pages in use are closed when they are returned."""
+        self._closed = True
+        idle = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        self._idle.put_nowait(None)
+        for entry in idle:
+            if entry is not None:
+                self._discard(entry)
+
+    def __enter__(self) -> "SyncPagePool":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,220 @@
+"""Client-side parsing and normalization of AgentQL queries."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+from langchain_agentql.const import DEFAULT_QUERY_CACHE_MAX_SIZE
+from langchain_agentql.errors import AgentQLQuerySyntaxError
+from langchain_agentql.messages import INVALID_QUERY_ERROR_MESSAGE
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATORS = "{}[],"
+
+
+@dataclass(frozen=True)
+class QueryNode:
+    """
+    A field of an AgentQL query, e.g. `posts[] { title }`.
+    The root of a query is an unnamed container.
+    """
+
+    name: str
+    description: Optional[str] = None
+    """Natural Language description given in parentheses, e.g. `price(in USD)`."""
+    is_list: bool = False
+    children: Tuple["QueryNode", ...] = ()
+    """Fields of a container. Empty for a leaf field."""
+
+    @property
+    def is_container(self) -> bool:
+        return bool(self.children)
+
+    def __str__(self) -> str:
+        """The canonical form of the query, e.g. `{ posts[] { title } }`."""
+        text = self.name
+        if self.description is not None:
+            text += f"({self.description})"
+        if self.is_list:
+            text += "[]"
+        if self.children:
+            fields = " ".join(str(child) for child in self.children)
+            text = f"{text} {{ {fields} }}" if text else f"{{ {fields} }}"
+        return text
+
+    def find_mismatches(self, data: Any, path: str = "") -> List[str]:
+        """
+        Compare extracted data with the shape of the query.
+        Fields that were not found on the page may be `null`.
+        Args:
+            data: The extracted data, i.e. the `data` of an API response or the result of `query_data`.
+            path: Dotted path of `data` in the response, prefixed to the reported paths.
+        Returns:
+            List[str]: The paths of the missing fields and of the fields of the wrong type. Empty if the data matches.
+        """
+        if not isinstance(data, dict):
+            return [f"{path or '<root>'}: expected an object"]
+        mismatches = []
+        for child in self.children:
+            child_path = f"{path}.{child.name}" if path else child.name
+            if child.name not in data:
+                mismatches.append(f"{child_path}: missing")
+                continue
+            value = data[child.name]
+            if value is None:
+                continue
+            if child.is_list:
+                if not isinstance(value, list):
+                    mismatches.append(f"{child_path}: expected a list")
+                    continue
+                if child.is_container:
+                    for i, item in enumerate(value):
+                        if item is not None:
+                            mismatches.extend(child.find_mismatches(item, f"{child_path}[{i}]"))
+            elif child.is_container:
+                mismatches.extend(child.find_mismatches(value, child_path))
+        return mismatches
+
+
+class _Token:
+    __slots__ = ("kind", "value", "line", "column")
+
+    def __init__(self, kind: str, value: str, line: int, column: int):
+        self.kind = kind
+        self.value = value
+        self.line = line
+        self.column = column
+
+    def describe(self) -> str:
+        if self.kind == "identifier":
+            return f"identifier '{self.value}'"
+        if self.kind == "description":
+            return "description"
+        if self.kind == "end":
+            return "end of query"
+        return f"'{self.value}'"
+
+
+def _syntax_error(reason: str, line: int, column: int) -> AgentQLQuerySyntaxError:
+    message = INVALID_QUERY_ERROR_MESSAGE.format(reason=reason, line=line, column=column)
+    return AgentQLQuerySyntaxError(message, line=line, column=column)
+
+
+def _tokenize(query: str) -> Iterator[_Token]:
+    line, line_start, position = 1, 0, 0
+    while position < len(query):
+        char = query[position]
+        column = position - line_start + 1
+        if char == "\n":
+            line, line_start = line + 1, position + 1
+            position += 1
+        elif char.isspace():
+            position += 1
+        elif char in _PUNCTUATORS:
+            yield _Token(char, char, line, column)
+            position += 1
+        elif char == "(":
+            # Descriptions are free text and may contain balanced parentheses
+            start, start_line, depth = position, line, 0
+            while position < len(query):
+                if query[position] == "(":
+                    depth += 1
+                elif query[position] == ")":
+                    depth -= 1
+                    if not depth:
+                        break
+                elif query[position] == "\n":
+                    line, line_start = line + 1, position + 1
+                position += 1
+            else:
+                raise _syntax_error("unclosed description", start_line, column)
+            yield _Token("description", query[start + 1 : position], start_line, column)
+            position += 1
+        else:
+            match = _IDENTIFIER.match(query, position)
+            if match is None:
+                raise _syntax_error(f"unexpected character '{char}'", line, column)
+            yield _Token("identifier", match.group(), line, column)
+            position = match.end()
+    yield _Token("end", "", line, position - line_start + 1)
+
+
+class _Parser:
+    def __init__(self, query: str):
+        self._tokens = _tokenize(query)
+        self._token = next(self._tokens)
+
+    def _advance(self) -> _Token:
+        token = self._token
+        self._token = next(self._tokens, token)
+        return token
+
+    def _expect(self, kind: str, expected: str) -> _Token:
+        if self._token.kind != kind:
+            token = self._token
+            raise _syntax_error(f"expected {expected}, found {token.describe()}", token.line, token.column)
+        return self._advance()
+
+    def parse(self) -> QueryNode:
+        root = QueryNode(name="", children=self._parse_fields())
+        self._expect("end", "end of query")
+        return root
+
+    def _parse_fields(self) -> Tuple[QueryNode, ...]:
+        self._expect("{", "'{'")
+        fields: List[QueryNode] = []
+        names = set()
+        while True:
+            token = self._expect("identifier", "a field name")
+            if token.value in names:
+                raise _syntax_error(f"duplicate field '{token.value}'", token.line, token.column)
+            names.add(token.value)
+            fields.append(self._parse_field(token.value))
+            if self._token.kind == ",":
+                self._advance()
+            if self._token.kind == "}":
+                self._advance()
+                return tuple(fields)
+
+    def _parse_field(self, name: str) -> QueryNode:
+        description = None
+        if self._token.kind == "description":
+            description = _WHITESPACE.sub(" ", self._advance().value).strip() or None
+        is_list = self._token.kind == "["
+        if is_list:
+            self._advance()
+            self._expect("]", "']'")
+        children = self._parse_fields() if self._token.kind == "{" else ()
+        return QueryNode(name=name, description=description, is_list=is_list, children=children)
+
+
+@lru_cache(maxsize=DEFAULT_QUERY_CACHE_MAX_SIZE)
+def parse_query(query: str) -> QueryNode:
+    """
+    Parse an AgentQL query, e.g. `{ posts[] { title } }`.
+    Parsed queries are cached, so parsing the same query again is a dictionary lookup.
+    Args:
+        query: The AgentQL query.
+    Returns:
+        QueryNode: The unnamed root container of the query.
+    Raises:
+        AgentQLQuerySyntaxError: The query is malformed, e.g. has unbalanced braces or duplicate fields.
+    """
+    return _Parser(query).parse()
+
+
+@lru_cache(maxsize=DEFAULT_QUERY_CACHE_MAX_SIZE)
+def normalize_query(query: str) -> str:
+    """
+    Validate an AgentQL query and get its canonical form, so that queries that only differ in whitespace,
+    commas or the spacing of descriptions share a cache entry.
+    Args:
+        query: The AgentQL query.
+    Returns:
+        str: The canonical form of the query, e.g. `{ posts[] { title } }`.
+    Raises:
+        AgentQLQuerySyntaxError: The query is malformed.
+    """
+    return str(parse_query(query))
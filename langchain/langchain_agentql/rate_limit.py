@@ -0,0 +1,203 @@
+"""Client-side rate limiting of AgentQL API calls.
+
+A single `RateLimiter` is shared by all AgentQL tools and loaders of a process, across
+threads and event loops, so scaled-out workers stay within the plan's rate limit
+instead of running into bursts of 429 responses.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Deque, Iterator, Optional
+
+from langchain_agentql.const import (
+    RATE_LIMIT_BURST_ENV,
+    RATE_LIMIT_MAX_CONCURRENCY_ENV,
+    RATE_LIMIT_REQUESTS_PER_SECOND_ENV,
+)
+from langchain_agentql.messages import INVALID_RATE_LIMIT_ERROR_MESSAGE
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the request rate, combined with a cap on requests in flight.
+    Usable from threads with `limit()` and from coroutines with `alimit()`; waiters are
+    served in arrival order.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Sustained number of requests started per second. Defaults to `None`, i.e. unlimited.
+            burst: Number of requests that may start at once after an idle period. Defaults to `requests_per_second` rounded up.
+            max_concurrency: Maximum number of requests in flight. Defaults to `None`, i.e. unlimited.
+        """
+        if (
+            (requests_per_second is not None and requests_per_second <= 0)
+            or (burst is not None and burst < 1)
+            or (max_concurrency is not None and max_concurrency < 1)
+        ):
+            raise ValueError(INVALID_RATE_LIMIT_ERROR_MESSAGE)
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst or (math.ceil(requests_per_second) if requests_per_second else 1)
+        self.max_concurrency = max_concurrency
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._in_flight = 0
+        self._waiters: Deque[Callable[[], None]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a concurrency slot."""
+        return self._in_flight
+
+    def _reserve_token(self) -> float:
+        """Take a token, going into debt if none is left. Returns the seconds to wait."""
+        if self.requests_per_second is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.requests_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.requests_per_second)
+
+    def _try_enter(self, waiter: Callable[[], None]) -> bool:
+        """Take a concurrency slot, or queue the waiter to be woken up with a slot handed over."""
+        with self._lock:
+            if self.max_concurrency is None:
+                return True
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return True
+            self._waiters.append(waiter)
+            return False
+
+    def _release(self) -> None:
+        if self.max_concurrency is None:
+            return
+        with self._lock:
+            waiter = self._waiters.popleft() if self._waiters else None
+            if waiter is None:
+                self._in_flight -= 1
+        if waiter is not None:
+            waiter()
+
+    def acquire(self) -> None:
+        """Block until a request may start. Must be paired with `release`."""
+        entered = threading.Event()
+        if not self._try_enter(entered.set):
+            entered.wait()
+        delay = self._reserve_token()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait until a request may start. Must be paired with `release`."""
+        loop = asyncio.get_running_loop()
+        entered: "asyncio.Future[None]" = loop.create_future()
+
+        def set_entered() -> None:
+            if not entered.done():
+                entered.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(set_entered)
+
+        if not self._try_enter(wake):
+            try:
+                await entered
+            except asyncio.CancelledError:
+                with self._lock:
+                    handed_over = wake not in self._waiters
+                    if not handed_over:
+                        self._waiters.remove(wake)
+                if handed_over:
+                    self._release()
+                raise
+        try:
+            delay = self._reserve_token()
+            if delay:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._release()
+            raise
+
+    def release(self) -> None:
+        """Release the concurrency slot taken by `acquire` or `aacquire`."""
+        self._release()
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        """Context manager holding a request slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def alimit(self) -> AsyncIterator[None]:
+        """Async context manager holding a request slot for the duration of the block."""
+        await self.aacquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _from_env() -> RateLimiter:
+    requests_per_second = os.getenv(RATE_LIMIT_REQUESTS_PER_SECOND_ENV)
+    burst = os.getenv(RATE_LIMIT_BURST_ENV)
+    max_concurrency = os.getenv(RATE_LIMIT_MAX_CONCURRENCY_ENV)
+    return RateLimiter(
+        requests_per_second=float(requests_per_second) if requests_per_second else None,
+        burst=int(burst) if burst else None,
+        max_concurrency=int(max_concurrency) if max_concurrency else None,
+    )
+
+
+_rate_limiter = _from_env()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter.
+    Unlimited unless configured with `configure_rate_limiter` or the `AGENTQL_RATE_LIMIT_RPS`,
+    `AGENTQL_RATE_LIMIT_BURST` and `AGENTQL_MAX_CONCURRENCY` environment variables.
+    Returns:
+        RateLimiter: The shared rate limiter.
+    """
+    return _rate_limiter
+
+
+def configure_rate_limiter(
+    requests_per_second: Optional[float] = None,
+    burst: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> RateLimiter:
+    """
+    Replace the process-wide rate limiter. Requests already in flight keep their slots in the previous limiter.
+    Args:
+        requests_per_second: Sustained number of requests started per second. Defaults to `None`, i.e. unlimited.
+        burst: Number of requests that may start at once after an idle period. Defaults to `requests_per_second` rounded up.
+        max_concurrency: Maximum number of requests in flight. Defaults to `None`, i.e. unlimited.
+    Returns:
+        RateLimiter: The new shared rate limiter.
+    """
+    global _rate_limiter
+    _rate_limiter = RateLimiter(requests_per_second, burst, max_concurrency)
+    return _rate_limiter
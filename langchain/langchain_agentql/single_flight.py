@@ -0,0 +1,110 @@
+"""Coalescing of concurrent identical calls ("single-flight")."""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from langchain_agentql.errors import AgentQLTimeoutError
+from langchain_agentql.messages import DEADLINE_EXCEEDED_ERROR_MESSAGE
+from langchain_agentql.timeouts import Deadline, get_deadline
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time and shares its outcome with every caller
+    that asks for the same key while the call is in flight.
+    Waiters other than the caller that started the call receive a deep copy of the result,
+    so they can mutate it freely.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[Any]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        """
+        Run `fn`, or wait for the in-flight call with the same key started by another thread.
+        Args:
+            key: Identifies identical calls.
+            fn: The call to run.
+            deadline: Deadline of the caller, bounding the wait for another thread's call. Defaults to the deadline of the current context.
+        Returns:
+            The result of the call.
+        Raises:
+            AgentQLTimeoutError: The deadline passed while waiting for another thread's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            deadline = deadline if deadline is not None else get_deadline()
+            if not call.done.wait(deadline.remaining()):
+                raise AgentQLTimeoutError(DEADLINE_EXCEEDED_ERROR_MESSAGE)
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def ado(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]], deadline: Optional[Deadline] = None
+    ) -> Any:
+        """
+        Run `fn`, or wait for the in-flight call with the same key on the running event loop.
+        Cancelling one waiter does not cancel the shared call.
+        Args:
+            key: Identifies identical calls.
+            fn: Returns the awaitable to run.
+            deadline: Deadline of the caller, bounding the wait for a call started by another caller. Defaults to the deadline of the current context.
+        Returns:
+            The result of the call.
+        Raises:
+            AgentQLTimeoutError: The deadline passed while waiting for a call started by another caller.
+        """
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            is_leader = task is None
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda t: self._forget(task_key, t))
+
+        if is_leader:
+            return await asyncio.shield(task)
+        deadline = deadline if deadline is not None else get_deadline()
+        # Unlike `wait_for`, `wait` neither cancels the shared call on timeout nor confuses it with a timeout of the call
+        done, _ = await asyncio.wait({task}, timeout=deadline.remaining())
+        if not done:
+            raise AgentQLTimeoutError(DEADLINE_EXCEEDED_ERROR_MESSAGE)
+        return copy.deepcopy(task.result())
+
+    def _forget(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls) + len(self._tasks)
@@ -0,0 +1,375 @@
+"""Incremental decoding of large AgentQL REST API responses."""
+
+import json
+import os
+from typing import (
+    IO,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from langchain_agentql.messages import INVALID_JSON_STREAM_ERROR_MESSAGE
+
+Path = Tuple[Union[str, int], ...]
+ScreenshotTarget = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Path of the Base64 screenshot in a response
+SCREENSHOT_PATH: Path = ("metadata", "screenshot")
+
+_DECODER = json.JSONDecoder()
+# The C string scanner of `json`, or its pure Python version. Neither is in the type stubs.
+_scanstring: Callable[[str, int], Tuple[str, int]] = getattr(json.decoder, "scanstring", None) or getattr(
+    json.decoder, "py_scanstring"
+)
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = ",]}" + _WHITESPACE
+
+
+def to_item_path(item_path: Optional[str]) -> Optional[Path]:
+    """
+    Convert a dotted path in the extracted `data`, e.g. `products` or `results.products`, to a response path.
+    Args:
+        item_path: The dotted path.
+    Returns:
+        Optional[Path]: The path from the root of the response, or `None` if no path is given.
+    """
+    if item_path is None:
+        return None
+    return ("data", *item_path.split("."))
+
+
+class JSONStreamParser:
+    """
+    Parser of a JSON document fed in text chunks.
+
+    The document is built as chunks arrive, except for the value at `item_path` and the strings at `string_sinks` paths.
+    Elements of the array at `item_path` (or the value itself if it is not an array) are returned by `feed` and `close` as
+    soon as they are complete, and are not kept in the document. Strings at `string_sinks` paths are passed in pieces to
+    their sink instead of being kept in the document. Paths only go through object keys.
+    """
+
+    def __init__(
+        self,
+        item_path: Optional[Sequence[Union[str, int]]] = None,
+        string_sinks: Optional[Mapping[Path, Callable[[str], Any]]] = None,
+    ):
+        self.item_path: Optional[Path] = tuple(item_path) if item_path is not None else None
+        self.string_sinks = dict(string_sinks or {})
+        self.document: Any = None
+        self._items: List[Any] = []
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._done = False
+        self._parser = self._parse_document()
+        next(self._parser)
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Parse the next chunk of the document.
+        Args:
+            text: The chunk.
+        Returns:
+            List[Any]: The items completed by this chunk.
+        """
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += text
+        return self._resume()
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing once the whole document was fed.
+        Returns:
+            List[Any]: The items completed at the end of the document.
+        """
+        self._eof = True
+        items = self._resume()
+        if not self._done:
+            raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+        return items
+
+    def _resume(self) -> List[Any]:
+        if not self._done:
+            try:
+                self._parser.send(None)
+            except StopIteration:
+                self._done = True
+        items, self._items = self._items, []
+        return items
+
+    def _parse_document(self) -> Generator[None, None, None]:
+        yield
+        self.document = yield from self._parse_value(())
+        if (yield from self._peek()):
+            raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+
+    def _peek(self) -> Generator[None, None, str]:
+        """Skip whitespace and return the next character, or an empty string at the end of the document."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self._eof:
+                return ""
+            yield
+
+    def _expect(self, chars: str) -> Generator[None, None, str]:
+        char = yield from self._peek()
+        if not char or char not in chars:
+            raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+        self._pos += 1
+        return char
+
+    def _is_plain(self, path: Path) -> bool:
+        """Whether the value at `path` contains neither items nor strings passed to a sink."""
+        special = [self.item_path] if self.item_path is not None else []
+        return not any(other[: len(path)] == path for other in [*special, *self.string_sinks])
+
+    def _parse_value(self, path: Path) -> Generator[None, None, Any]:
+        char = yield from self._peek()
+        if char and self._is_plain(path):
+            # Decode the value at once if it was fed whole. A number not followed by a delimiter may be cut off.
+            buffer = self._buffer
+            try:
+                value, end = _DECODER.raw_decode(buffer, self._pos)
+            except ValueError:
+                pass
+            else:
+                if char in '{["' or self._eof or (end < len(buffer) and buffer[end] in _SCALAR_END):
+                    self._pos = end
+                    return value
+        if char == "{":
+            return (yield from self._parse_object(path))
+        if char == "[":
+            return (yield from self._parse_array(path))
+        if char == '"':
+            return (yield from self._parse_string())
+        if not char:
+            raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+        return (yield from self._parse_scalar())
+
+    def _parse_object(self, path: Path) -> Generator[None, None, dict]:
+        self._pos += 1
+        obj: dict = {}
+        if not path:
+            # Expose the document while it is parsed
+            self.document = obj
+        if (yield from self._peek()) == "}":
+            self._pos += 1
+            return obj
+        while True:
+            if (yield from self._peek()) != '"':
+                raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+            key = yield from self._parse_string()
+            yield from self._expect(":")
+            child = path + (key,)
+            if child == self.item_path:
+                yield from self._emit_items(child)
+            elif child in self.string_sinks and (yield from self._peek()) == '"':
+                yield from self._stream_string(self.string_sinks[child])
+            else:
+                obj[key] = yield from self._parse_value(child)
+            if (yield from self._expect(",}")) == "}":
+                return obj
+
+    def _parse_array(self, path: Path) -> Generator[None, None, list]:
+        self._pos += 1
+        array: list = []
+        if (yield from self._peek()) == "]":
+            self._pos += 1
+            return array
+        while True:
+            value = yield from self._parse_value(path + (len(array),))
+            array.append(value)
+            if (yield from self._expect(",]")) == "]":
+                return array
+
+    def _emit_items(self, path: Path) -> Generator[None, None, None]:
+        if (yield from self._peek()) != "[":
+            item = yield from self._parse_value(path)
+            self._items.append(item)
+            return
+        self._pos += 1
+        if (yield from self._peek()) == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            # The pending items may be handed out while the item is parsed
+            item = yield from self._parse_value(path + (index,))
+            self._items.append(item)
+            index += 1
+            if (yield from self._expect(",]")) == "]":
+                return
+
+    def _parse_scalar(self) -> Generator[None, None, Any]:
+        while True:
+            buffer, end = self._buffer, self._pos
+            while end < len(buffer) and buffer[end] not in _SCALAR_END:
+                end += 1
+            if end < len(buffer) or self._eof:
+                try:
+                    value = json.loads(buffer[self._pos : end])
+                except ValueError as e:
+                    raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE) from e
+                self._pos = end
+                return value
+            yield
+
+    def _find_string_end(self, start: int) -> int:
+        """Find the closing quote of the string being parsed, searching from `start`, or -1 if it was not fed yet."""
+        buffer = self._buffer
+        end = buffer.find('"', start)
+        while end != -1:
+            escape = end - 1
+            while escape >= 0 and buffer[escape] == "\\":
+                escape -= 1
+            if (end - 1 - escape) % 2 == 0:
+                return end
+            end = buffer.find('"', end + 1)
+        return -1
+
+    def _parse_string(self) -> Generator[None, None, str]:
+        offset = 1
+        while True:
+            end = self._find_string_end(self._pos + offset)
+            if end != -1:
+                try:
+                    value, self._pos = _scanstring(self._buffer, self._pos + 1)
+                except ValueError as e:
+                    raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE) from e
+                return value
+            if self._eof:
+                raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+            offset = max(len(self._buffer) - self._pos, 1)
+            yield
+
+    def _stream_string(self, sink: Callable[[str], Any]) -> Generator[None, None, None]:
+        self._pos += 1
+        while True:
+            buffer = self._buffer
+            end = self._find_string_end(self._pos)
+            if end != -1:
+                self._write_piece(sink, buffer[self._pos : end])
+                self._pos = end + 1
+                return
+            if self._eof:
+                raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE)
+            # Hold back an escape sequence that may be cut off by the end of the chunk
+            cut = len(buffer)
+            escape = buffer.rfind("\\", max(self._pos, cut - 6))
+            if escape != -1:
+                cut = escape
+                while cut > self._pos and buffer[cut - 1] == "\\":
+                    cut -= 1
+            self._write_piece(sink, buffer[self._pos : cut])
+            self._pos = cut
+            yield
+
+    @staticmethod
+    def _write_piece(sink: Callable[[str], Any], piece: str) -> None:
+        if "\\" in piece:
+            try:
+                piece = json.loads(f'"{piece}"')
+            except ValueError as e:
+                raise ValueError(INVALID_JSON_STREAM_ERROR_MESSAGE) from e
+        if piece:
+            sink(piece)
+
+
+class ScreenshotWriter:
+    """Writes a Base64 screenshot to a file path or a binary buffer. A file is only created once there is data to write."""
+
+    def __init__(self, target: ScreenshotTarget):
+        self.target = target
+        self._file: Optional[IO[bytes]] = None
+
+    def write(self, text: str) -> None:
+        if self._file is None:
+            if isinstance(self.target, (str, os.PathLike)):
+                self._file = open(self.target, "wb")
+            else:
+                self._file = self.target
+        self._file.write(text.encode("ascii"))
+
+    def close(self) -> None:
+        """Close the file opened for a path. Buffers passed by the caller are left open."""
+        if self._file is not None and self._file is not self.target:
+            self._file.close()
+
+
+class ExtractionStream(Iterator[Any]):
+    """
+    Items of an extraction response, yielded as they are decoded from the response body.
+    `response` holds the rest of the response, and is complete once the stream is exhausted.
+    `request_id` holds the `X-Request-Id` header of the response once it is received, before the first item.
+    """
+
+    def __init__(self, parser: JSONStreamParser, items: Generator[Any, None, None]):
+        self._parser = parser
+        self._items = items
+        self.request_id: Optional[str] = None
+
+    @property
+    def response(self) -> dict:
+        """The response without the streamed items and screenshot, filled in as the stream is consumed."""
+        return self._parser.document if isinstance(self._parser.document, dict) else {}
+
+    def __next__(self) -> Any:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop streaming and release the connection."""
+        self._items.close()
+
+    def __enter__(self) -> "ExtractionStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncExtractionStream(AsyncIterator[Any]):
+    """
+    Items of an extraction response, yielded as they are decoded from the response body.
+    `response` holds the rest of the response, and is complete once the stream is exhausted.
+    `request_id` holds the `X-Request-Id` header of the response once it is received, before the first item.
+    """
+
+    def __init__(self, parser: JSONStreamParser, items: AsyncGenerator[Any, None]):
+        self._parser = parser
+        self._items = items
+        self.request_id: Optional[str] = None
+
+    @property
+    def response(self) -> dict:
+        """The response without the streamed items and screenshot, filled in as the stream is consumed."""
+        return self._parser.document if isinstance(self._parser.document, dict) else {}
+
+    async def __anext__(self) -> Any:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop streaming and release the connection."""
+        await self._items.aclose()
+
+    async def __aenter__(self) -> "AsyncExtractionStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -1,11 +1,18 @@
 """ AgentQL toolkit """
 
-from typing import List
+from typing import Any, List, Optional
 
 from langchain_community.agent_toolkits.playwright.toolkit import (
     PlayWrightBrowserToolkit,
 )
+from langchain_community.tools.playwright.base import lazy_import_playwright_browsers
 from langchain_core.tools import BaseTool
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page as SyncPage
+from pydantic import model_validator
+
+from langchain_agentql.messages import MISSING_BROWSER_OR_PAGE_ERROR_MESSAGE
+from langchain_agentql.page_cache import PageResultCache
 
 from langchain_agentql.tools import (
     ExtractWebDataBrowserTool,
@@ -29,6 +36,12 @@ class AgentQLBrowserToolkit(PlayWrightBrowserToolkit):
             A synchronous browser instance for executing tools synchronously
         async_browser: Optional[AsyncBrowser]
             An asynchronous browser instance for executing tools asynchronously
+        sync_page: Optional[SyncPage]
+            A page the tools work with instead of the sync browser's current page, e.g. a page checked out from a ``SyncPagePool``
+        async_page: Optional[AsyncPage]
+            A page the tools work with instead of the async browser's current page, e.g. a page checked out from an ``AsyncPagePool``
+        page_cache: Optional[PageResultCache]
+            A cache of the extracted data, reused until the page navigates or its DOM changes
 
     Instantiate:
         .. code-block:: python
@@ -45,6 +58,19 @@ class AgentQLBrowserToolkit(PlayWrightBrowserToolkit):
                 sync_browser=sync_browser
             )
 
+            or, to relaunch the browser after a crash, creating the toolkit per browser lease since
+            it keeps the browser it was created with
+
+            async with AsyncBrowserManager() as manager:
+                async with manager.browser() as async_browser:
+                    toolkit = AgentQLBrowserToolkit(async_browser=async_browser)
+
+            or, to serve concurrent sessions from one browser
+
+            async with AsyncPagePool(async_browser, size=8) as pool:
+                async with pool.acquire() as page:
+                    toolkit = AgentQLBrowserToolkit(async_page=page)
+
     Tools:
         .. code-block:: python
 
@@ -112,9 +138,36 @@ class AgentQLBrowserToolkit(PlayWrightBrowserToolkit):
             ...
     """  # noqa: E501
 
+    sync_page: Optional[SyncPage] = None
+    async_page: Optional[AsyncPage] = None
+    page_cache: Optional[PageResultCache] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_imports_and_browser_provided(cls, values: dict) -> Any:
+        """Check that a browser or a page is provided."""
+        lazy_import_playwright_browsers()
+        if all(
+            values.get(key) is None
+            for key in ("async_browser", "sync_browser", "async_page", "sync_page")
+        ):
+            raise ValueError(MISSING_BROWSER_OR_PAGE_ERROR_MESSAGE)
+        return values
+
     def get_tools(self) -> List[BaseTool]:
         """Get the tools in the toolkit."""
         return [
-          ExtractWebDataBrowserTool.from_browser(sync_browser=self.sync_browser, async_browser=self.async_browser),
-          GetWebElementBrowserTool.from_browser(sync_browser=self.sync_browser, async_browser=self.async_browser)
+          ExtractWebDataBrowserTool(
+              sync_browser=self.sync_browser,
+              async_browser=self.async_browser,
+              sync_page=self.sync_page,
+              async_page=self.async_page,
+              page_cache=self.page_cache,
+          ),
+          GetWebElementBrowserTool(
+              sync_browser=self.sync_browser,
+              async_browser=self.async_browser,
+              sync_page=self.sync_page,
+              async_page=self.async_page,
+          )
         ]
@@ -1,9 +1,36 @@
-from langchain_agentql.tools.extract_web_data_browser_tool import ExtractWebDataBrowserTool
-from langchain_agentql.tools.get_web_element_browser_tool import GetWebElementBrowserTool
-from langchain_agentql.tools.extract_web_data_tool import ExtractWebDataTool
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from langchain_agentql.tools.extract_web_data_browser_tool import (
+        ExtractWebDataBrowserTool,
+    )
+    from langchain_agentql.tools.extract_web_data_tool import ExtractWebDataTool
+    from langchain_agentql.tools.get_web_element_browser_tool import (
+        GetWebElementBrowserTool,
+    )
+
+# Modules of the tools, imported on first access so that the REST tool does not import Playwright and agentql
+_LAZY_IMPORTS = {
+    "ExtractWebDataBrowserTool": "langchain_agentql.tools.extract_web_data_browser_tool",
+    "ExtractWebDataTool": "langchain_agentql.tools.extract_web_data_tool",
+    "GetWebElementBrowserTool": "langchain_agentql.tools.get_web_element_browser_tool",
+}
 
 __all__ = [
     "ExtractWebDataBrowserTool",
     "ExtractWebDataTool",
     "GetWebElementBrowserTool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
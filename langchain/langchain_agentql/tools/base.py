@@ -0,0 +1,132 @@
+""" Base class of AgentQL browser tools """
+
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from langchain_community.tools.playwright.base import (
+    BaseBrowserTool,
+    lazy_import_playwright_browsers,
+)
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.runnables import ensure_config
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page as SyncPage
+from pydantic import Field, model_validator
+
+from langchain_agentql.const import TIMEOUT_CONFIG_KEY
+from langchain_agentql.errors import AgentQLTimeoutError
+from langchain_agentql.messages import (
+    DEADLINE_EXCEEDED_ERROR_MESSAGE,
+    MISSING_BROWSER_ERROR_MESSAGE,
+    MISSING_BROWSER_OR_PAGE_ERROR_MESSAGE,
+)
+from langchain_agentql.rate_limit import get_rate_limiter
+from langchain_agentql.timeouts import get_deadline
+from langchain_agentql.tracing import CallTrace, areport_trace, report_trace
+from langchain_agentql.utils import _aget_agentql_page, _get_agentql_page
+
+
+class BaseAgentQLBrowserTool(BaseBrowserTool):
+    """Base class of AgentQL browser tools, working with a browser's current page or with a given page."""
+
+    sync_page: Optional[SyncPage] = Field(default=None, exclude=True)
+    """Page to work with instead of the sync browser's current page, e.g. a page checked out from a `SyncPagePool`."""
+    async_page: Optional[AsyncPage] = Field(default=None, exclude=True)
+    """Page to work with instead of the async browser's current page, e.g. a page checked out from an `AsyncPagePool`."""
+    timeout: int
+    """Seconds the query may take. Each tool sets its own default."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_browser_provided(cls, values: dict) -> Any:
+        """Check that a browser or a page is provided."""
+        lazy_import_playwright_browsers()
+        if all(
+            values.get(key) is None
+            for key in ("async_browser", "sync_browser", "async_page", "sync_page")
+        ):
+            raise ValueError(MISSING_BROWSER_OR_PAGE_ERROR_MESSAGE)
+        return values
+
+    def _get_page(self) -> SyncPage:
+        if not self.sync_browser and not self.sync_page:
+            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
+        return _get_agentql_page(self.sync_browser, self.sync_page)
+
+    async def _aget_page(self) -> AsyncPage:
+        if not self.async_browser and not self.async_page:
+            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
+        return await _aget_agentql_page(self.async_browser, self.async_page)
+
+    def _get_timeout(self) -> int:
+        """Seconds the query may take: the tool's `timeout`, bounded by the deadline of the invocation."""
+        configurable = ensure_config().get("configurable", {})
+        deadline = get_deadline(self.timeout, configurable.get(TIMEOUT_CONFIG_KEY))
+        if deadline.expired:
+            raise AgentQLTimeoutError(DEADLINE_EXCEEDED_ERROR_MESSAGE)
+        timeout = deadline.timeout()
+        return self.timeout if timeout is None else timeout
+
+    @contextmanager
+    def _open_page(
+        self, trace: CallTrace, run_manager: Optional[CallbackManagerForToolRun]
+    ) -> Iterator[SyncPage]:
+        """Get the page, timing the `wrap` phase, and report the trace once the block exits."""
+        try:
+            with trace.run():
+                with trace.phase("wrap"):
+                    page = self._get_page()
+                yield page
+        finally:
+            report_trace(run_manager, trace)
+
+    @asynccontextmanager
+    async def _aopen_page(
+        self, trace: CallTrace, run_manager: Optional[AsyncCallbackManagerForToolRun]
+    ) -> AsyncIterator[AsyncPage]:
+        """Get the page, timing the `wrap` phase, and report the trace once the block exits."""
+        try:
+            with trace.run():
+                with trace.phase("wrap"):
+                    page = await self._aget_page()
+                yield page
+        finally:
+            await areport_trace(run_manager, trace)
+
+    @contextmanager
+    def _limit_query(self, trace: CallTrace) -> Iterator[None]:
+        """Query the page within the block once the rate limiter allows it, timing the `queue` and `query` phases."""
+        queued_at = time.perf_counter()
+        with get_rate_limiter().limit():
+            trace.add_phase("queue", time.perf_counter() - queued_at)
+            with trace.phase("query"):
+                yield
+
+    @asynccontextmanager
+    async def _alimit_query(self, trace: CallTrace) -> AsyncIterator[None]:
+        """Query the page within the block once the rate limiter allows it, timing the `queue` and `query` phases."""
+        queued_at = time.perf_counter()
+        async with get_rate_limiter().alimit():
+            trace.add_phase("queue", time.perf_counter() - queued_at)
+            with trace.phase("query"):
+                yield
+
+    @contextmanager
+    def _query_page(
+        self, trace: CallTrace, run_manager: Optional[CallbackManagerForToolRun]
+    ) -> Iterator[SyncPage]:
+        """Get the page and query it within the block, timing the `wrap`, `queue` and `query` phases."""
+        with self._open_page(trace, run_manager) as page, self._limit_query(trace):
+            yield page
+
+    @asynccontextmanager
+    async def _aquery_page(
+        self, trace: CallTrace, run_manager: Optional[AsyncCallbackManagerForToolRun]
+    ) -> AsyncIterator[AsyncPage]:
+        """Get the page and query it within the block, timing the `wrap`, `queue` and `query` phases."""
+        async with self._aopen_page(trace, run_manager) as page, self._alimit_query(trace):
+            yield page
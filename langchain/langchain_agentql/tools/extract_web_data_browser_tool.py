@@ -1,26 +1,27 @@
 """ AgentQL extract web data from browser tool """
 
-from typing import Optional, Type
+from typing import Any, Literal, Optional, Type
 from typing_extensions import Self
 
-from langchain_community.tools.playwright.base import BaseBrowserTool
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
+from langchain_core.runnables import ensure_config
 from pydantic import BaseModel, Field, model_validator
 
 from langchain_agentql.const import (
+    BYPASS_CACHE_CONFIG_KEY,
     DEFAULT_EXTRACT_DATA_TIMEOUT_SECONDS,
     DEFAULT_INCLUDE_HIDDEN_DATA,
     DEFAULT_RESPONSE_MODE,
     DEFAULT_WAIT_FOR_NETWORK_IDLE,
     REQUEST_ORIGIN
 )
-from langchain_agentql.utils import (
-    _aget_current_agentql_page,
-    _get_current_agentql_page
-)
+from langchain_agentql.page_cache import PageResultCache
+from langchain_agentql.query import normalize_query
+from langchain_agentql.tools.base import BaseAgentQLBrowserTool
+from langchain_agentql.tracing import CallTrace, to_tool_output
 from langchain_agentql.llm_descriptions import (
     QUERY_FIELD_DESCRIPTION,
     PROMPT_FIELD_DATA_DESCRIPTION,
@@ -29,10 +30,13 @@ from langchain_agentql.llm_descriptions import (
 from langchain_agentql.messages import (
     QUERY_PROMPT_REQUIRED_ERROR_MESSAGE,
     QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE,
-    MISSING_BROWSER_ERROR_MESSAGE
 )
 
 
+def _bypass_cache() -> bool:
+    return ensure_config().get("configurable", {}).get(BYPASS_CACHE_CONFIG_KEY, False)
+
+
 class ExtractWebDataBrowserToolInput(BaseModel):
     """Input schema for AgentQL extract web data from browser tool."""
 
@@ -43,17 +47,19 @@ class ExtractWebDataBrowserToolInput(BaseModel):
     @classmethod
     def check_query_and_prompt(cls, model: Self) -> Self:
         """
-        Check that query and prompt cannot be both empty or both provided
+        Check that query and prompt cannot be both empty or both provided, and that the query is well-formed
         """
         if not model.query and not model.prompt:
             raise ValueError(QUERY_PROMPT_REQUIRED_ERROR_MESSAGE)
         if model.query and model.prompt:
             raise ValueError(QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE)
+        if model.query:
+            model.query = normalize_query(model.query)
         
         return model
 
 
-class ExtractWebDataBrowserTool(BaseBrowserTool):
+class ExtractWebDataBrowserTool(BaseAgentQLBrowserTool):
     """AgentQL extract web data from browser tool.
 
     Setup:
@@ -77,11 +83,23 @@ class ExtractWebDataBrowserTool(BaseBrowserTool):
                 async_browser=async_browser,
             )
 
+            # usage with a page checked out from an AsyncPagePool
+            tool = ExtractWebDataBrowserTool(
+                async_page=page,
+            )
+
     Navigate to the target page with Playwright Navigate Tool:
         .. code-block:: python
 
             NavigateTool(sync_browser=sync_browser).invoke({"url": "https://www.agentql.com/blog"})
 
+    Caching results while the page is unchanged:
+        .. code-block:: python
+
+            from langchain_agentql.page_cache import PageResultCache
+
+            tool = ExtractWebDataBrowserTool(async_page=page, page_cache=PageResultCache())
+
     Invocation with args:
         .. code-block:: python
 
@@ -100,9 +118,12 @@ class ExtractWebDataBrowserTool(BaseBrowserTool):
     name: str = "extract_web_data_from_browser"
     description: str = EXTRACT_WEB_DATA_BROWSER_TOOL_DESCRIPTION
     args_schema: Type[BaseModel] = ExtractWebDataBrowserToolInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+    """The data is the content of the tool message, and the timing of the call is its artifact."""
 
     timeout: int = Field(default=DEFAULT_EXTRACT_DATA_TIMEOUT_SECONDS)
-    """The number of seconds to wait for a request before timing out. Defaults to 900."""
+    """The number of seconds to wait for a request before timing out. Defaults to 900.
+    Bounded by the `agentql_timeout` configurable of the invocation and by `langchain_agentql.timeouts.deadline`."""
     wait_for_network_idle: bool = Field(default=DEFAULT_WAIT_FOR_NETWORK_IDLE)
     """Whether to wait until the network reaches a full idle state before executing. Defaults to `True`."""
     include_hidden: bool = Field(default=DEFAULT_INCLUDE_HIDDEN_DATA)
@@ -110,61 +131,83 @@ class ExtractWebDataBrowserTool(BaseBrowserTool):
     mode: str = Field(default=DEFAULT_RESPONSE_MODE)
     """'standard' uses deep data analysis, while 'fast' trades some depth of analysis for speed and is adequate for most usecases.
     Learn more about the modes in this guide: https://docs.agentql.com/accuracy/standard-mode. Defaults to 'fast'."""
+    page_cache: Optional[PageResultCache] = Field(default=None, exclude=True)
+    """Cache of results by page, URL, query or prompt and options, e.g. `PageResultCache()`, reused until the page navigates
+    or its DOM changes. Defaults to `None`, i.e. no caching. Skip the lookup for a call with the `agentql_bypass_cache` configurable."""
+
+    def _cache_key(self, page: Any, query: Optional[str], prompt: Optional[str]) -> tuple:
+        return (page.url, query, prompt, self.mode, self.include_hidden)
 
     def _run(
         self,
         query: Optional[str] = None,
         prompt: Optional[str] = None,
-        _: Optional[CallbackManagerForToolRun] = None,
-    ) -> dict:
-        if not self.sync_browser:
-            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
-        
-        page = _get_current_agentql_page(self.sync_browser)
-        if query:
-            return page.query_data(
-                query,
-                self.timeout,
-                self.wait_for_network_idle,
-                self.include_hidden,
-                self.mode,
-                request_origin=REQUEST_ORIGIN
-            )
-        elif prompt:
-            return page.get_data_by_prompt_experimental(
-                prompt,
-                self.timeout,
-                self.wait_for_network_idle,
-                self.include_hidden,
-                self.mode,
-                request_origin=REQUEST_ORIGIN
-            )
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Any:
+        trace = CallTrace("agentql.extract_web_data_browser")
+        with self._open_page(trace, run_manager) as page:
+
+            def extract() -> Any:
+                with self._limit_query(trace):
+                    if query:
+                        return page.query_data(
+                            query,
+                            self._get_timeout(),
+                            self.wait_for_network_idle,
+                            self.include_hidden,
+                            self.mode,
+                            request_origin=REQUEST_ORIGIN
+                        )
+                    return page.get_data_by_prompt_experimental(
+                        prompt,
+                        self._get_timeout(),
+                        self.wait_for_network_idle,
+                        self.include_hidden,
+                        self.mode,
+                        request_origin=REQUEST_ORIGIN
+                    )
+
+            if self.page_cache is None:
+                data = extract()
+            else:
+                data = self.page_cache.get_or_extract(
+                    page, self._cache_key(page, query, prompt), extract, trace, bypass=_bypass_cache()
+                )
+        return to_tool_output(self, data, trace)
 
     async def _arun(
         self,
         query: Optional[str] = None,
         prompt: Optional[str] = None,
-        _: Optional[AsyncCallbackManagerForToolRun] = None,
-    ) -> dict:
-        if not self.async_browser:
-            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
-        
-        page = await _aget_current_agentql_page(self.async_browser)
-        if query:
-            return await page.query_data(
-                query,
-                self.timeout,
-                self.wait_for_network_idle,
-                self.include_hidden,
-                self.mode,
-                request_origin=REQUEST_ORIGIN
-            )
-        elif prompt:
-            return await page.get_data_by_prompt_experimental(
-                prompt,
-                self.timeout,
-                self.wait_for_network_idle,
-                self.include_hidden,
-                self.mode,
-                request_origin=REQUEST_ORIGIN
-            )
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Any:
+        trace = CallTrace("agentql.extract_web_data_browser")
+        async with self._aopen_page(trace, run_manager) as page:
+
+            async def extract() -> Any:
+                async with self._alimit_query(trace):
+                    if query:
+                        return await page.query_data(
+                            query,
+                            self._get_timeout(),
+                            self.wait_for_network_idle,
+                            self.include_hidden,
+                            self.mode,
+                            request_origin=REQUEST_ORIGIN
+                        )
+                    return await page.get_data_by_prompt_experimental(
+                        prompt,
+                        self._get_timeout(),
+                        self.wait_for_network_idle,
+                        self.include_hidden,
+                        self.mode,
+                        request_origin=REQUEST_ORIGIN
+                    )
+
+            if self.page_cache is None:
+                data = await extract()
+            else:
+                data = await self.page_cache.aget_or_extract(
+                    page, self._cache_key(page, query, prompt), extract, trace, bypass=_bypass_cache()
+                )
+        return to_tool_output(self, data, trace)
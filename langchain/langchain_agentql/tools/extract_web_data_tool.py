@@ -1,26 +1,40 @@
 """ AgentQL extract web data with REST API tool """
 
 import os
-from typing import Optional, Type
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Literal, Optional, Type, Union
 from typing_extensions import Self
 
 from urllib.parse import urlparse
 
+import httpx
 from langchain_core.tools import BaseTool
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
+from langchain_core.runnables import ensure_config
 from pydantic import BaseModel, Field, model_validator
 
-from langchain_agentql.load_data import aload_data, load_data
+from langchain_agentql.batch import ExtractionResult, aiter_extractions, iter_extractions
+from langchain_agentql.cache import BaseCache
+from langchain_agentql.query import parse_query
+from langchain_agentql.load_data import aload_data, astream_data, load_data, stream_data
+from langchain_agentql.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from langchain_agentql.streaming import AsyncExtractionStream, ExtractionStream, ScreenshotTarget
+from langchain_agentql.timeouts import Deadline, Timeouts
+from langchain_agentql.tracing import CallTrace, areport_trace, report_trace, to_tool_output
+from langchain_agentql.webhook import CallbackReceiver
 from langchain_agentql.const import (
+    BYPASS_CACHE_CONFIG_KEY,
+    CACHE_MAX_AGE_CONFIG_KEY,
     DEFAULT_IS_STEALTH_MODE_ENABLED,
     DEFAULT_WAIT_FOR_PAGE_LOAD_SECONDS,
     DEFAULT_IS_SCROLL_TO_BOTTOM_ENABLED,
     DEFAULT_IS_SCREENSHOT_ENABLED,
     DEFAULT_API_TIMEOUT_SECONDS,
-    DEFAULT_RESPONSE_MODE
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_RESPONSE_MODE,
+    TIMEOUT_CONFIG_KEY,
 )
 from langchain_agentql.llm_descriptions import (
     EXTRACT_WEB_DATA_TOOL_DESCRIPTION,
@@ -35,6 +49,15 @@ from langchain_agentql.messages import (
 )
 
 
+def _check_query_and_prompt(query: Optional[str], prompt: Optional[str]) -> None:
+    if not query and not prompt:
+        raise ValueError(QUERY_PROMPT_REQUIRED_ERROR_MESSAGE)
+    if query and prompt:
+        raise ValueError(QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE)
+    if query:
+        parse_query(query)
+
+
 class ExtractWebDataToolInput(BaseModel):
     """Input schema for AgentQL extract web data with REST API tool."""
 
@@ -53,11 +76,8 @@ class ExtractWebDataToolInput(BaseModel):
             if parsed_url.scheme not in ("http", "https"):
                 raise ValueError("URL scheme must be 'http' or 'https'")
 
-        # Check that query and prompt cannot be both empty or both provided
-        if not model.query and not model.prompt:
-            raise ValueError(QUERY_PROMPT_REQUIRED_ERROR_MESSAGE)
-        if model.query and model.prompt:
-            raise ValueError(QUERY_PROMPT_EXCLUSIVE_ERROR_MESSAGE)
+        # Check that query and prompt cannot be both empty or both provided, and that the query is well-formed
+        _check_query_and_prompt(model.query, model.prompt)
 
         return model
     
@@ -94,16 +114,84 @@ class ExtractWebDataTool(BaseTool):
                     ]}, 
                 'metadata': {'request_id': 'xxxxxx-xxxx-xxxx-xxxx-xxxx'}
             }
+
+    Invocation with a tool call, returning the timing of the call as artifact:
+        .. code-block:: python
+
+            message = tool.invoke({'type': 'tool_call', 'id': '1', 'name': tool.name, 'args': {'url': url, 'query': query}})
+            message.artifact['timing']
+
+        .. code-block:: python
+
+            {'total_ms': 2710.4, 'phases_ms': {'queue': 0.1, 'connect': 40.2, 'server': 2601.3, 'decode': 0.9, ...},
+             'attempts': 1, 'request_bytes': 180, 'response_bytes': 5120, 'request_id': 'xxxxxx-xxxx-xxxx-xxxx-xxxx', ...}
+
+    Caching:
+        .. code-block:: python
+
+            from langchain_agentql.cache import InMemoryCache
+
+            tool = ExtractWebDataTool(cache=InMemoryCache(ttl=600))
+
+            # Skip the cache lookup or tighten the max age for a single call
+            tool.invoke(args, config={"configurable": {"agentql_bypass_cache": True}})
+            tool.invoke(args, config={"configurable": {"agentql_cache_max_age": 60}})
+
+    Timeouts:
+        .. code-block:: python
+
+            from langchain_agentql.timeouts import Timeouts, deadline
+
+            tool = ExtractWebDataTool(timeout=Timeouts(total=120, connect=5))
+
+            # Bound a single call, or every call made within a block, e.g. an agent run
+            tool.invoke(args, config={"configurable": {"agentql_timeout": 30}})
+            with deadline(60):
+                agent.invoke(...)
+
+    Extraction from many URLs:
+        .. code-block:: python
+
+            for result in tool.extract_many(urls, query="{ product { name price } }", concurrency=20):
+                if result.ok:
+                    print(result.url, result.data["data"])
+                else:
+                    print(result.url, result.error)
+
+            # or asynchronously
+            async for result in tool.aextract_many(urls, query="{ product { name price } }", concurrency=20):
+                ...
+
+    Streaming large responses:
+        .. code-block:: python
+
+            with tool.extract_stream(url, query="{ products[] { name price } }", item_path="products", screenshot="page.b64") as stream:
+                for product in stream:
+                    print(product["name"])
+                print(stream.response["metadata"]["request_id"])
+
+    Results posted to a webhook:
+        .. code-block:: python
+
+            from langchain_agentql.webhook import EmbeddedCallbackServer
+
+            async with EmbeddedCallbackServer(public_url="https://worker.example.com/agentql-callbacks", port=8080) as receiver:
+                tool = ExtractWebDataTool(callback_receiver=receiver)
+                await tool.ainvoke({"url": "https://www.agentql.com/blog", "query": "{ posts[] { title } }"})
     """  # noqa: E501
 
     name: str = "extract_web_data_with_rest_api"
     description: str = EXTRACT_WEB_DATA_TOOL_DESCRIPTION
     args_schema: Type[BaseModel] = ExtractWebDataToolInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+    """The data is the content of the tool message, and the timing of the call is its artifact."""
 
     api_key: Optional[str] = Field(default=None)
     """AgentQL API key. You can create one at https://dev.agentql.com."""
-    timeout: int = Field(default=DEFAULT_API_TIMEOUT_SECONDS)
-    """The number of seconds to wait for a request before timing out. Defaults to 900."""
+    timeout: Union[float, Timeouts] = Field(default=DEFAULT_API_TIMEOUT_SECONDS)
+    """The number of seconds a call may take, including retries, or `Timeouts` splitting it into connect, write, read and pool
+    timeouts. Defaults to 900 seconds in total, with 10 seconds to connect. A call is also bounded by the `agentql_timeout`
+    configurable of the invocation and by `langchain_agentql.timeouts.deadline`."""
     is_stealth_mode_enabled: bool = Field(default=DEFAULT_IS_STEALTH_MODE_ENABLED)
     """Whether to enable experimental anti-bot evasion strategies. This feature may not work for all websites at all times. 
     Data extraction may take longer to complete with this mode enabled. Defaults to `False`."""
@@ -116,7 +204,27 @@ class ExtractWebDataTool(BaseTool):
     Learn more about the modes in this guide: https://docs.agentql.com/accuracy/standard-mode. Defaults to 'fast'."""
     is_screenshot_enabled: bool = Field(default=DEFAULT_IS_SCREENSHOT_ENABLED)
     """Whether to take a screenshot before extracting data. Returned in 'metadata' as a Base64 string. Defaults to `False`"""
-    
+    http_client: Optional[httpx.Client] = Field(default=None, exclude=True)
+    """HTTP client used for sync requests. Defaults to the shared, pooled client from `langchain_agentql.http_client`."""
+    async_http_client: Optional[httpx.AsyncClient] = Field(default=None, exclude=True)
+    """HTTP client used for async requests. Defaults to the shared, pooled client from `langchain_agentql.http_client`."""
+    cache: Optional[BaseCache] = Field(default=None, exclude=True)
+    """Cache of extraction results keyed by URL, query or prompt and params, e.g. `InMemoryCache` or `SQLiteCache`. Defaults to `None`, i.e. no caching."""
+    cache_max_age: Optional[float] = Field(default=None)
+    """Maximum age in seconds of a cached result to be reused. Defaults to `None`, i.e. the cache's own TTL."""
+    coalesce_requests: bool = Field(default=True)
+    """Whether identical requests in flight at the same time share a single call to the API and its result. Defaults to `True`."""
+    retry_policy: RetryPolicy = Field(default=DEFAULT_RETRY_POLICY)
+    """Retry policy for rate-limited (429), failed (5xx) and disconnected requests. Defaults to 3 attempts with exponential backoff and jitter.
+    Use `RetryPolicy(max_attempts=1)` to disable retries."""
+    api_base_url: Optional[Union[str, List[str]]] = Field(default=None)
+    """Base URL of the AgentQL REST API, e.g. a regional endpoint or a proxy, or a list of base URLs that requests are spread over.
+    Retries go to the next base URL, and base URLs that fail to connect or return server errors are skipped for 30 seconds.
+    Defaults to the comma-separated `AGENTQL_API_BASE_URL` environment variable, then `https://api.agentql.com`."""
+    callback_receiver: Optional[CallbackReceiver] = Field(default=None, exclude=True)
+    """Receiver of results posted to a webhook URL, e.g. `EmbeddedCallbackServer`. If set, extractions are submitted to the API
+    and their results are posted back to the receiver, instead of holding a connection open until they are ready. Defaults to `None`."""
+
     _params: dict = {}
     _metadata: dict = {}
     
@@ -134,15 +242,157 @@ class ExtractWebDataTool(BaseTool):
         self._api_key = self.api_key or os.getenv("AGENTQL_API_KEY")
         if not self._api_key:
             raise ValueError(UNSET_API_KEY_ERROR_MESSAGE)
-        
+
+    def _load_options(self) -> dict:
+        configurable = ensure_config().get("configurable", {})
+        return {
+            "cache": self.cache,
+            "cache_max_age": configurable.get(CACHE_MAX_AGE_CONFIG_KEY, self.cache_max_age),
+            "bypass_cache": configurable.get(BYPASS_CACHE_CONFIG_KEY, False),
+            "coalesce": self.coalesce_requests,
+            "retry_policy": self.retry_policy,
+            "base_url": self.api_base_url,
+            "callback_receiver": self.callback_receiver,
+            "deadline": Deadline.after(configurable.get(TIMEOUT_CONFIG_KEY)),
+        }
+
+    def _extract(self, url: str, query: Optional[str], prompt: Optional[str], trace: CallTrace) -> dict:
+        return load_data(
+            url=url,
+            query=query,
+            prompt=prompt,
+            params=self._params,
+            api_key=self._api_key,
+            timeout=self.timeout,
+            metadata=self._metadata,
+            client=self.http_client,
+            trace=trace,
+            **self._load_options(),
+        )
+
+    async def _aextract(self, url: str, query: Optional[str], prompt: Optional[str], trace: CallTrace) -> dict:
+        return await aload_data(
+            url=url,
+            query=query,
+            prompt=prompt,
+            params=self._params,
+            api_key=self._api_key,
+            timeout=self.timeout,
+            metadata=self._metadata,
+            client=self.async_http_client,
+            trace=trace,
+            **self._load_options(),
+        )
+
     def _run(
         self,
         url: str,
         query: Optional[str] = None,
         prompt: Optional[str] = None,
-        _: Optional[CallbackManagerForToolRun] = None,
-    ) -> dict:
-        return load_data(
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Any:
+        trace = CallTrace("agentql.extract_web_data")
+        try:
+            data = self._extract(url, query, prompt, trace)
+        finally:
+            report_trace(run_manager, trace)
+        return to_tool_output(self, data, trace)
+
+    async def _arun(
+        self,
+        url: str,
+        query: Optional[str] = None,
+        prompt: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Any:
+        trace = CallTrace("agentql.extract_web_data")
+        try:
+            data = await self._aextract(url, query, prompt, trace)
+        finally:
+            await areport_trace(run_manager, trace)
+        return to_tool_output(self, data, trace)
+
+    def extract_many(
+        self,
+        urls: Iterable[str],
+        query: Optional[str] = None,
+        prompt: Optional[str] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        stop_on_error: bool = False,
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extract data from many web pages with the same query or prompt, using a thread pool.
+
+        Args:
+            urls (Iterable[str]): The URLs of the web pages, consumed lazily.
+            query (Optional[str]): The AgentQL query to execute.
+            prompt (Optional[str]): The Natural Language description of the data to extract.
+            concurrency (int): Maximum number of extractions in flight. Defaults to 10.
+            stop_on_error (boolean): Whether to raise the first error and cancel pending extractions, instead of yielding failed results. Defaults to `False`.
+
+        Returns:
+            Iterator[ExtractionResult]: The result or error of each URL, in completion order.
+        """
+        _check_query_and_prompt(query, prompt)
+
+        def extract(url: str) -> dict:
+            ExtractWebDataToolInput.model_validate({"url": url, "query": query, "prompt": prompt})
+            return self._extract(url, query, prompt, CallTrace("agentql.extract_web_data"))
+
+        return iter_extractions(extract, urls, concurrency, stop_on_error)
+
+    def aextract_many(
+        self,
+        urls: Union[Iterable[str], AsyncIterable[str]],
+        query: Optional[str] = None,
+        prompt: Optional[str] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        stop_on_error: bool = False,
+    ) -> AsyncIterator[ExtractionResult]:
+        """
+        Extract data from many web pages with the same query or prompt, concurrently on the event loop.
+
+        Args:
+            urls (Union[Iterable[str], AsyncIterable[str]]): The URLs of the web pages, consumed lazily.
+            query (Optional[str]): The AgentQL query to execute.
+            prompt (Optional[str]): The Natural Language description of the data to extract.
+            concurrency (int): Maximum number of extractions in flight. Defaults to 10.
+            stop_on_error (boolean): Whether to raise the first error and cancel pending extractions, instead of yielding failed results. Defaults to `False`.
+
+        Returns:
+            AsyncIterator[ExtractionResult]: The result or error of each URL, in completion order.
+        """
+        _check_query_and_prompt(query, prompt)
+
+        async def extract(url: str) -> dict:
+            ExtractWebDataToolInput.model_validate({"url": url, "query": query, "prompt": prompt})
+            return await self._aextract(url, query, prompt, CallTrace("agentql.extract_web_data"))
+
+        return aiter_extractions(extract, urls, concurrency, stop_on_error)
+
+    def extract_stream(
+        self,
+        url: str,
+        query: Optional[str] = None,
+        prompt: Optional[str] = None,
+        item_path: Optional[str] = None,
+        screenshot: Optional[ScreenshotTarget] = None,
+    ) -> ExtractionStream:
+        """
+        Extract data from a web page, decoding the response as it is received. Streamed responses are not cached.
+
+        Args:
+            url (str): The URL of the web page.
+            query (Optional[str]): The AgentQL query to execute.
+            prompt (Optional[str]): The Natural Language description of the data to extract.
+            item_path (Optional[str]): Dotted path of a list in the extracted data, e.g. `products`, whose elements are yielded as they are decoded.
+            screenshot (Optional[Union[str, os.PathLike, IO[bytes]]]): File path or binary buffer the Base64 screenshot is written to instead of being kept in the metadata.
+
+        Returns:
+            ExtractionStream: The list elements, with the rest of the response in `response` once exhausted.
+        """
+        ExtractWebDataToolInput.model_validate({"url": url, "query": query, "prompt": prompt})
+        return stream_data(
             url=url,
             query=query,
             prompt=prompt,
@@ -150,16 +400,36 @@ class ExtractWebDataTool(BaseTool):
             api_key=self._api_key,
             timeout=self.timeout,
             metadata=self._metadata,
+            client=self.http_client,
+            item_path=item_path,
+            screenshot=screenshot,
+            retry_policy=self.retry_policy,
+            base_url=self.api_base_url,
         )
 
-    async def _arun(
+    def aextract_stream(
         self,
         url: str,
         query: Optional[str] = None,
         prompt: Optional[str] = None,
-        _: Optional[AsyncCallbackManagerForToolRun] = None,
-    ) -> dict:
-        return await aload_data(
+        item_path: Optional[str] = None,
+        screenshot: Optional[ScreenshotTarget] = None,
+    ) -> AsyncExtractionStream:
+        """
+        Extract data from a web page, decoding the response as it is received. Streamed responses are not cached.
+
+        Args:
+            url (str): The URL of the web page.
+            query (Optional[str]): The AgentQL query to execute.
+            prompt (Optional[str]): The Natural Language description of the data to extract.
+            item_path (Optional[str]): Dotted path of a list in the extracted data, e.g. `products`, whose elements are yielded as they are decoded.
+            screenshot (Optional[Union[str, os.PathLike, IO[bytes]]]): File path or binary buffer the Base64 screenshot is written to instead of being kept in the metadata.
+
+        Returns:
+            AsyncExtractionStream: The list elements, with the rest of the response in `response` once exhausted.
+        """
+        ExtractWebDataToolInput.model_validate({"url": url, "query": query, "prompt": prompt})
+        return astream_data(
             url=url,
             query=query,
             prompt=prompt,
@@ -167,4 +437,9 @@ class ExtractWebDataTool(BaseTool):
             api_key=self._api_key,
             timeout=self.timeout,
             metadata=self._metadata,
+            client=self.async_http_client,
+            item_path=item_path,
+            screenshot=screenshot,
+            retry_policy=self.retry_policy,
+            base_url=self.api_base_url,
         )
@@ -1,8 +1,7 @@
 """ AgentQL get web element from browser tool """
 
-from typing import Optional, Type
+from typing import Any, Literal, Optional, Type
 
-from langchain_community.tools.playwright.base import BaseBrowserTool
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -16,11 +15,8 @@ from langchain_agentql.const import (
     DEFAULT_WAIT_FOR_NETWORK_IDLE,
     REQUEST_ORIGIN
 )
-from langchain_agentql.utils import (
-    _aget_current_agentql_page,
-    _get_current_agentql_page
-)
-from langchain_agentql.messages import MISSING_BROWSER_ERROR_MESSAGE
+from langchain_agentql.tools.base import BaseAgentQLBrowserTool
+from langchain_agentql.tracing import CallTrace, to_tool_output
 from langchain_agentql.llm_descriptions import (
     GET_WEB_ELEMENT_BROWSER_TOOL_DESCRIPTION,
     PROMPT_FIELD_ELEMENT_DESCRIPTION
@@ -33,7 +29,7 @@ class GetWebElementBrowserToolInput(BaseModel):
     prompt: str = Field(..., description=PROMPT_FIELD_ELEMENT_DESCRIPTION)
 
 
-class GetWebElementBrowserTool(BaseBrowserTool):
+class GetWebElementBrowserTool(BaseAgentQLBrowserTool):
     """AgentQL get web element from browser tool.
 
     Setup:
@@ -57,6 +53,11 @@ class GetWebElementBrowserTool(BaseBrowserTool):
                 async_browser=async_browser,
             )
 
+            # usage with a page checked out from an AsyncPagePool
+            tool = GetWebElementBrowserTool(
+                async_page=page,
+            )
+
     Navigate to the target page with Playwright Navigate Tool:
         .. code-block:: python
 
@@ -80,9 +81,12 @@ class GetWebElementBrowserTool(BaseBrowserTool):
     name: str = "get_web_element_from_browser"
     description: str = GET_WEB_ELEMENT_BROWSER_TOOL_DESCRIPTION
     args_schema: Type[BaseModel] = GetWebElementBrowserToolInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+    """The selector is the content of the tool message, and the timing of the call is its artifact."""
 
     timeout: int = DEFAULT_EXTRACT_ELEMENTS_TIMEOUT_SECONDS
-    """The number of seconds to wait for a request before timing out. Defaults to 300."""
+    """The number of seconds to wait for a request before timing out. Defaults to 300.
+    Bounded by the `agentql_timeout` configurable of the invocation and by `langchain_agentql.timeouts.deadline`."""
     wait_for_network_idle: bool = DEFAULT_WAIT_FOR_NETWORK_IDLE
     """Whether to wait until the network reaches a full idle state before executing. Defaults to `True`."""
     include_hidden: bool = DEFAULT_INCLUDE_HIDDEN_ELEMENTS
@@ -94,39 +98,35 @@ class GetWebElementBrowserTool(BaseBrowserTool):
     def _run(
         self, 
         prompt: str, 
-        _: Optional[CallbackManagerForToolRun] = None
-    ) -> str:
-        if not self.sync_browser:
-            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
-        
-        page = _get_current_agentql_page(self.sync_browser)
-        element = page.get_by_prompt(
-            prompt,
-            self.timeout,
-            self.wait_for_network_idle,
-            self.include_hidden,
-            self.mode,
-            request_origin=REQUEST_ORIGIN
-        )
+        run_manager: Optional[CallbackManagerForToolRun] = None
+    ) -> Any:
+        trace = CallTrace("agentql.get_web_element_browser")
+        with self._query_page(trace, run_manager) as page:
+            element = page.get_by_prompt(
+                prompt,
+                self._get_timeout(),
+                self.wait_for_network_idle,
+                self.include_hidden,
+                self.mode,
+                request_origin=REQUEST_ORIGIN
+            )
         tf_id = element.get_attribute("tf623_id")
-        return f"[tf623_id='{tf_id}']"
+        return to_tool_output(self, f"[tf623_id='{tf_id}']", trace)
 
     async def _arun(
         self, 
         prompt: str, 
-        _: Optional[AsyncCallbackManagerForToolRun] = None
-    ) -> str:
-        if not self.async_browser:
-            raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
-        
-        page = await _aget_current_agentql_page(self.async_browser)
-        element = await page.get_by_prompt(
-            prompt,
-            self.timeout,
-            self.wait_for_network_idle,
-            self.include_hidden,
-            self.mode,
-            request_origin=REQUEST_ORIGIN
-        )
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> Any:
+        trace = CallTrace("agentql.get_web_element_browser")
+        async with self._aquery_page(trace, run_manager) as page:
+            element = await page.get_by_prompt(
+                prompt,
+                self._get_timeout(),
+                self.wait_for_network_idle,
+                self.include_hidden,
+                self.mode,
+                request_origin=REQUEST_ORIGIN
+            )
         tf_id = await element.get_attribute("tf623_id")
-        return f"[tf623_id='{tf_id}']"
+        return to_tool_output(self, f"[tf623_id='{tf_id}']", trace)
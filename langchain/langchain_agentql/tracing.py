@@ -0,0 +1,225 @@
+"""Instrumentation of AgentQL calls: per-phase timings, payload sizes, attempts and request IDs.
+
+Every call records a `CallTrace`, which feeds the metrics of `langchain_agentql.metrics`. It is exported as an
+OpenTelemetry span when `opentelemetry-api` is installed, dispatched to LangChain callbacks as an `agentql_call` custom
+event by the tools, and returned as the tools' artifact and in the loader's `Document.metadata` as `agentql_timing`:
+
+.. code-block:: python
+
+    message = tool.invoke({"type": "tool_call", "id": "1", "name": tool.name, "args": {"url": url, "query": query}})
+    message.artifact["timing"]
+    # {'total_ms': 2710.4, 'phases_ms': {'queue': 0.1, 'connect': 40.2, 'tls': 61.0, 'send': 0.2, 'server': 2601.3,
+    #  'download': 5.1, 'decode': 0.9}, 'attempts': 1, 'request_bytes': 180, 'response_bytes': 5120, ...}
+
+Phases are `queue` (rate limiter), `connect` and `tls` (new connections only), `send`, `server` (waiting for the
+response, i.e. page rendering and extraction), `download`, `decode`, `backoff` (between retries), and for the browser
+tools `wrap` (`agentql.wrap`) and `query`.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from langchain_agentql.metrics import record_call, record_call_started
+
+if TYPE_CHECKING:
+    from langchain_core.callbacks import (
+        AsyncCallbackManagerForToolRun,
+        CallbackManagerForToolRun,
+    )
+    from langchain_core.tools import BaseTool
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore[import-not-found]
+    from opentelemetry.trace import Status, StatusCode  # type: ignore[import-not-found]
+except ImportError:
+    otel_trace = None  # type: ignore[assignment]
+
+# Name of the LangChain custom event dispatched by the tools
+CALL_EVENT_NAME = "agentql_call"
+
+# Steps of the `httpcore` trace events, by phase
+_HTTP_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+
+class CallTrace:
+    """Timings and attributes of one AgentQL call, including all its attempts."""
+
+    def __init__(self, name: str, **attributes: Any):
+        """
+        Args:
+            name: Name of the call, e.g. `agentql.extract_web_data`, used as the span name.
+            attributes: Attributes of the call, e.g. its `url`.
+        """
+        self.name = name
+        self.attributes: Dict[str, Any] = {key: value for key, value in attributes.items() if value is not None}
+        self.phases: Dict[str, float] = {}
+        self.attempts = 0
+        self.started_at: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._span: Any = None
+        self._http_started: Dict[str, float] = {}
+
+    @property
+    def operation(self) -> str:
+        """Name of the call without the `agentql.` prefix, e.g. `extract_web_data`, used as the metrics label."""
+        return self.name.removeprefix("agentql.")
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase. Phases of retried attempts add up."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the block as a phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - started)
+
+    def set(self, **attributes: Any) -> None:
+        """Set attributes of the call, e.g. `request_id`. `None` values are ignored."""
+        self.attributes.update((key, value) for key, value in attributes.items() if value is not None)
+
+    def http_event(self, event_name: str, info: dict) -> None:
+        """Receive an `httpcore` trace event, passed as the `trace` extension of a request."""
+        _, _, step_status = event_name.partition(".")
+        step, _, status = step_status.rpartition(".")
+        phase = _HTTP_PHASES.get(step)
+        if phase is None:
+            return
+        if status == "started":
+            self._http_started[step] = time.perf_counter()
+        elif step in self._http_started:
+            self.add_phase(phase, time.perf_counter() - self._http_started.pop(step))
+
+    async def ahttp_event(self, event_name: str, info: dict) -> None:
+        """Receive an `httpcore` trace event of an async request."""
+        self.http_event(event_name, info)
+
+    def start(self) -> None:
+        """Start the call, unless it was already started."""
+        if self.started_at is not None:
+            return
+        self.started_at = time.perf_counter()
+        record_call_started(self)
+        if otel_trace is not None:
+            self._span = otel_trace.get_tracer("langchain_agentql").start_span(self.name)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Finish the call, unless it was already finished, and end its span."""
+        if self.started_at is None or self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self.started_at
+        self.error = error
+        record_call(self)
+        if self._span is not None:
+            self._span.set_attributes(_to_span_attributes(self.to_dict()))
+            if error is not None:
+                self._span.record_exception(error)
+                self._span.set_status(Status(StatusCode.ERROR, str(error)))
+            self._span.end()
+
+    @contextmanager
+    def run(self) -> Iterator["CallTrace"]:
+        """
+        Run the call within the block. The span is the current span within the block, so spans of instrumented HTTP
+        clients nest under it. A trace already running is left to the block that started it.
+        """
+        if self.started_at is not None:
+            yield self
+            return
+        self.start()
+        try:
+            if self._span is not None:
+                with otel_trace.use_span(self._span, end_on_exit=False):
+                    yield self
+            else:
+                yield self
+        except BaseException as e:
+            self.finish(e)
+            raise
+        self.finish()
+
+    def to_dict(self) -> dict:
+        """
+        Get the timing breakdown of the call.
+        Returns:
+            dict: `total_ms`, `phases_ms`, `attempts`, and the attributes of the call, e.g. `request_id`.
+        """
+        duration = self.duration
+        if duration is None and self.started_at is not None:
+            duration = time.perf_counter() - self.started_at
+        timing = {
+            "total_ms": round((duration or 0.0) * 1000, 3),
+            "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in self.phases.items()},
+            "attempts": self.attempts,
+            **self.attributes,
+        }
+        if self.error is not None:
+            timing["error"] = type(self.error).__name__
+        return timing
+
+
+def _to_span_attributes(timing: dict) -> dict:
+    attributes = {}
+    for key, value in timing.items():
+        if key == "phases_ms":
+            attributes.update({f"agentql.phase.{phase}_ms": ms for phase, ms in value.items()})
+        elif isinstance(value, (str, bool, int, float)):
+            attributes[f"agentql.{key}"] = value
+    return attributes
+
+
+def report_trace(run_manager: Optional["CallbackManagerForToolRun"], trace: CallTrace) -> None:
+    """Dispatch the timing of a call to the callbacks of the tool run as an `agentql_call` custom event."""
+    if run_manager is None:
+        return
+    # Imported here, so that `load_data` does not import LangChain
+    from langchain_core.callbacks.manager import handle_event
+
+    handle_event(
+        run_manager.handlers,
+        "on_custom_event",
+        "ignore_custom_event",
+        CALL_EVENT_NAME,
+        trace.to_dict(),
+        run_id=run_manager.run_id,
+        tags=run_manager.tags,
+        metadata=run_manager.metadata,
+    )
+
+
+async def areport_trace(run_manager: Optional["AsyncCallbackManagerForToolRun"], trace: CallTrace) -> None:
+    """Dispatch the timing of a call to the callbacks of the tool run as an `agentql_call` custom event."""
+    if run_manager is None:
+        return
+    from langchain_core.callbacks.manager import ahandle_event
+
+    await ahandle_event(
+        run_manager.handlers,
+        "on_custom_event",
+        "ignore_custom_event",
+        CALL_EVENT_NAME,
+        trace.to_dict(),
+        run_id=run_manager.run_id,
+        tags=run_manager.tags,
+        metadata=run_manager.metadata,
+    )
+
+
+def to_tool_output(tool: "BaseTool", content: Any, trace: CallTrace) -> Any:
+    """Get the output of a tool run: the content, with the timing of the call as artifact if the tool returns one."""
+    if tool.response_format == "content_and_artifact":
+        return content, {"timing": trace.to_dict()}
+    return content
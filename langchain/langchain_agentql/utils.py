@@ -1,12 +1,20 @@
-from typing import Optional, List, TYPE_CHECKING
+import asyncio
+import threading
+import weakref
+from typing import Any, Optional, List, TYPE_CHECKING
 
 import agentql
+from agentql.ext.playwright.async_api import Page as AsyncAgentQLPage  # type: ignore[import-untyped]
+from agentql.ext.playwright.sync_api import Page as SyncAgentQLPage  # type: ignore[import-untyped]
 from langchain_community.tools.playwright.utils import (
     aget_current_page,
     get_current_page
 )
 from langchain_community.tools.playwright.utils import create_sync_playwright_browser as create_sync_playwright_browser_from_tools
 
+from langchain_agentql.messages import MISSING_BROWSER_ERROR_MESSAGE
+from langchain_agentql.metrics import BROWSER_PAGES_WRAPPED
+
 try:
     from playwright.async_api import Browser as AsyncBrowser
     from playwright.async_api import Page as AsyncPage
@@ -17,6 +25,74 @@ except ImportError as e:
         "Unable to import playwright. Please make sure playwright module is properly installed."
     ) from e
 
+# AgentQL pages by Playwright page, shared by all tools. An entry is dropped when its page
+# is closed; the wrapped page references the Playwright page, so the weak key alone would
+# not release it.
+_agentql_pages: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+_agentql_page_tasks: "weakref.WeakKeyDictionary[Any, asyncio.Future]" = weakref.WeakKeyDictionary()
+_agentql_pages_lock = threading.Lock()
+
+
+def _forget_agentql_page(page: Any) -> None:
+    with _agentql_pages_lock:
+        agentql_page = _agentql_pages.pop(page, None)
+        task = _agentql_page_tasks.pop(page, None)
+    if agentql_page is not None or task is not None:
+        BROWSER_PAGES_WRAPPED.dec()
+
+
+def _wrap_page(page: SyncPage) -> SyncPage:
+    """
+    Wrap a page with AgentQL, reusing the AgentQL page of previous calls until the page is closed.
+    Args:
+        page: The Playwright page.
+    Returns:
+        Page: The AgentQL page.
+    """
+    if isinstance(page, SyncAgentQLPage):
+        # Already wrapped and counted, e.g. a page of a `SyncPagePool`
+        return page
+    with _agentql_pages_lock:
+        agentql_page = _agentql_pages.get(page)
+    if agentql_page is None:
+        agentql_page = agentql.wrap(page)
+        with _agentql_pages_lock:
+            # Another thread may have wrapped the page meanwhile
+            is_new = page not in _agentql_pages
+            agentql_page = _agentql_pages.setdefault(page, agentql_page)
+        if is_new:
+            BROWSER_PAGES_WRAPPED.inc()
+            page.once("close", lambda _: _forget_agentql_page(page))
+    return agentql_page
+
+
+async def _awrap_page(page: AsyncPage) -> AsyncPage:
+    """
+    Wrap a page with AgentQL, reusing the AgentQL page of previous calls until the page is closed.
+    Concurrent calls for the same page share a single wrapping.
+    Args:
+        page: The Playwright page.
+    Returns:
+        Page: The AgentQL page.
+    """
+    if isinstance(page, AsyncAgentQLPage):
+        # Already wrapped and counted, e.g. a page of an `AsyncPagePool`
+        return page
+    with _agentql_pages_lock:
+        task = _agentql_page_tasks.get(page)
+        is_new = task is None
+        if task is None:
+            task = _agentql_page_tasks[page] = asyncio.ensure_future(agentql.wrap_async(page))
+    if is_new:
+        BROWSER_PAGES_WRAPPED.inc()
+        page.once("close", lambda _: _forget_agentql_page(page))
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        _forget_agentql_page(page)
+        raise
+
+
 def _get_current_agentql_page(browser: SyncBrowser) -> SyncPage:
     """
     Get the current page of the browser.
@@ -25,7 +101,7 @@ def _get_current_agentql_page(browser: SyncBrowser) -> SyncPage:
     Returns:
         Page: The current page.
     """
-    return agentql.wrap(get_current_page(browser))
+    return _wrap_page(get_current_page(browser))
 
 
 async def _aget_current_agentql_page(browser: AsyncBrowser) -> AsyncPage:
@@ -36,7 +112,43 @@ async def _aget_current_agentql_page(browser: AsyncBrowser) -> AsyncPage:
     Returns:
         Page: The current page.
     """
-    return await agentql.wrap_async(await aget_current_page(browser))
+    return await _awrap_page(await aget_current_page(browser))
+
+
+def _get_agentql_page(
+    browser: Optional[SyncBrowser], page: Optional[SyncPage] = None
+) -> SyncPage:
+    """
+    Get the given page, or the current page of the browser if no page is given.
+    Args:
+        browser: The browser to get the current page from.
+        page: The page to use instead of the browser's current page.
+    Returns:
+        Page: The AgentQL page.
+    """
+    if page is not None:
+        return _wrap_page(page)
+    if browser is None:
+        raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
+    return _get_current_agentql_page(browser)
+
+
+async def _aget_agentql_page(
+    browser: Optional[AsyncBrowser], page: Optional[AsyncPage] = None
+) -> AsyncPage:
+    """
+    Get the given page, or the current page of the browser if no page is given.
+    Args:
+        browser: The browser to get the current page from.
+        page: The page to use instead of the browser's current page.
+    Returns:
+        Page: The AgentQL page.
+    """
+    if page is not None:
+        return await _awrap_page(page)
+    if browser is None:
+        raise ValueError(MISSING_BROWSER_ERROR_MESSAGE)
+    return await _aget_current_agentql_page(browser)
 
 
 def create_sync_playwright_browser(
@@ -59,7 +171,8 @@ async def create_async_playwright_browser(
     headless: bool = True, args: Optional[List[str]] = None
 ) -> AsyncBrowser:
     """
-    Create an async playwright browser.
+    Create an async playwright browser. The Playwright driver is stopped once the browser is closed.
+    Use `AsyncBrowserManager` to share a browser that is relaunched after a crash.
     Args:
         headless: Whether to run the browser in headless mode. Defaults to True.
         args: arguments to pass to browser.chromium.launch
@@ -70,4 +183,9 @@ async def create_async_playwright_browser(
 
     playwright = await async_playwright().start()
     browser = await playwright.chromium.launch(headless=headless, args=args)
+
+    async def stop_playwright(_: Any) -> None:
+        await playwright.stop()
+
+    browser.once("disconnected", stop_playwright)
     return browser
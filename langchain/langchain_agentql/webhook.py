@@ -0,0 +1,241 @@
+"""Receivers of extraction results posted by the AgentQL API to a webhook URL.
+
+In webhook mode, an extraction is submitted to the `query-data-async` endpoint with a callback URL, and its result is
+posted back to that URL once it is ready, so no connection is held open while the page is processed:
+
+.. code-block:: python
+
+    async with EmbeddedCallbackServer(public_url="https://worker.example.com/agentql-callbacks", port=8080) as receiver:
+        tool = ExtractWebDataTool(callback_receiver=receiver)
+        await tool.ainvoke({"url": "https://www.agentql.com/blog", "query": "{ posts[] { title } }"})
+
+Results are correlated with the waiting extractions by a token in the callback URL, or by the `request_id` returned
+when the extraction was submitted.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from langchain_agentql.const import DEFAULT_CALLBACK_MAX_BODY_SIZE
+from langchain_agentql.errors import AgentQLTimeoutError, from_callback
+from langchain_agentql.messages import (
+    CALLBACK_TIMEOUT_ERROR_MESSAGE,
+    MISSING_AIOHTTP_ERROR_MESSAGE,
+)
+from langchain_agentql.serialization import loads
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+
+def _import_web() -> Any:
+    # aiohttp is only imported by the embedded server, it takes longer to import than the rest of the package
+    try:
+        from aiohttp import web
+    except ImportError as e:
+        raise ImportError(MISSING_AIOHTTP_ERROR_MESSAGE) from e
+    return web
+
+
+class PendingCallback:
+    """An extraction waiting for its result to be posted to `url`."""
+
+    def __init__(self, receiver: "CallbackReceiver", token: str, url: str):
+        self.receiver = receiver
+        self.token = token
+        self.url = url
+        self.future: "concurrent.futures.Future[dict]" = concurrent.futures.Future()
+
+    def bind_request_id(self, submission: Any) -> None:
+        """
+        Correlate callbacks without the token with the `request_id` of the submission.
+        Args:
+            submission: The response body of the submission.
+        """
+        if not isinstance(submission, dict):
+            return
+        request_id = submission.get("request_id") or (submission.get("metadata") or {}).get("request_id")
+        if request_id:
+            self.receiver._bind_request_id(request_id, self.token)
+
+    def result(self, timeout: Optional[float] = None) -> dict:
+        """
+        Wait for the result.
+        Args:
+            timeout: Seconds to wait. Defaults to `None`, i.e. forever.
+        Returns:
+            dict: The extracted `data` and its `metadata`.
+        """
+        try:
+            body = self.future.result(timeout)
+        except concurrent.futures.TimeoutError as e:
+            raise AgentQLTimeoutError(CALLBACK_TIMEOUT_ERROR_MESSAGE.format(timeout=timeout)) from e
+        return _to_result(body)
+
+    async def aresult(self, timeout: Optional[float] = None) -> dict:
+        """
+        Wait for the result.
+        Args:
+            timeout: Seconds to wait. Defaults to `None`, i.e. forever.
+        Returns:
+            dict: The extracted `data` and its `metadata`.
+        """
+        try:
+            body = await asyncio.wait_for(asyncio.wrap_future(self.future), timeout)
+        except asyncio.TimeoutError as e:
+            raise AgentQLTimeoutError(CALLBACK_TIMEOUT_ERROR_MESSAGE.format(timeout=timeout)) from e
+        return _to_result(body)
+
+
+def _to_result(body: dict) -> dict:
+    if body.get("error_info"):
+        raise from_callback(body)
+    return {"data": body.get("data"), "metadata": body.get("metadata") or {}}
+
+
+class CallbackReceiver:
+    """
+    Correlates extraction results posted to callback URLs with the extractions waiting for them.
+
+    Serve `public_url` from your own web server and pass each callback to `deliver`, or use `EmbeddedCallbackServer`.
+    Callback URLs are `{public_url}/{token}`. Results can be delivered from any thread.
+    """
+
+    def __init__(self, public_url: str):
+        """
+        Args:
+            public_url: URL the AgentQL API can reach the receiver at, e.g. `https://worker.example.com/agentql-callbacks`.
+        """
+        self.public_url = public_url.rstrip("/")
+        self._pending: Dict[str, PendingCallback] = {}
+        self._tokens_by_request_id: Dict[str, str] = {}
+        self._request_ids_by_token: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of extractions waiting for their result."""
+        return len(self._pending)
+
+    @contextmanager
+    def expect(self) -> Iterator[PendingCallback]:
+        """
+        Expect a result for the duration of the block.
+        Returns:
+            Iterator[PendingCallback]: The pending callback, whose `url` is passed as the webhook URL of the extraction.
+        """
+        token = uuid.uuid4().hex
+        pending = PendingCallback(self, token, f"{self.public_url}/{token}")
+        with self._lock:
+            self._pending[token] = pending
+        try:
+            yield pending
+        finally:
+            self._forget(token)
+
+    def deliver(self, body: Any, token: Optional[str] = None) -> bool:
+        """
+        Deliver a callback to the extraction waiting for it.
+        Args:
+            body: The callback body, with `data`, `metadata` and `error_info`.
+            token: The last segment of the callback URL. Defaults to `None`, i.e. correlate by `metadata.request_id`.
+        Returns:
+            bool: Whether an extraction was waiting for the callback.
+        """
+        if not isinstance(body, dict):
+            return False
+        with self._lock:
+            if token is None:
+                request_id = (body.get("metadata") or {}).get("request_id")
+                token = self._tokens_by_request_id.get(request_id) if request_id else None
+            pending = self._pending.get(token) if token is not None else None
+        if pending is None or pending.future.done():
+            return False
+        pending.future.set_result(body)
+        return True
+
+    def _bind_request_id(self, request_id: str, token: str) -> None:
+        with self._lock:
+            if token in self._pending:
+                self._tokens_by_request_id[request_id] = token
+                self._request_ids_by_token[token] = request_id
+
+    def _forget(self, token: str) -> None:
+        with self._lock:
+            self._pending.pop(token, None)
+            request_id = self._request_ids_by_token.pop(token, None)
+            if request_id is not None:
+                self._tokens_by_request_id.pop(request_id, None)
+
+
+class EmbeddedCallbackServer(CallbackReceiver):
+    """
+    Callback receiver serving callbacks with an embedded `aiohttp` server on the running event loop.
+    Callbacks are accepted as `POST {path}/{token}` requests.
+    """
+
+    def __init__(
+        self,
+        public_url: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        path: str = "/agentql-callbacks",
+        unix_socket: Optional[str] = None,
+        client_max_size: int = DEFAULT_CALLBACK_MAX_BODY_SIZE,
+    ):
+        """
+        Args:
+            public_url: URL the AgentQL API can reach `path` at, e.g. through a reverse proxy or a tunnel. Defaults to `http://{host}:{port}{path}`.
+            host: Host to listen on. Defaults to `127.0.0.1`.
+            port: Port to listen on. Defaults to 8080.
+            path: Path of the callbacks. Defaults to `/agentql-callbacks`.
+            unix_socket: Path of a Unix socket to listen on instead of `host` and `port`, e.g. behind a reverse proxy.
+            client_max_size: Largest callback body in bytes. Larger callbacks are rejected, and their extractions time out. Defaults to 64 MiB.
+        """
+        self._web = _import_web()
+        self.path = "/" + path.strip("/")
+        super().__init__(public_url or f"http://{host}:{port}{self.path}")
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.client_max_size = client_max_size
+        self._runner: Optional["web.AppRunner"] = None
+
+    async def _handle(self, request: "web.Request") -> "web.Response":
+        try:
+            body = await request.json(loads=loads)
+        except ValueError:
+            return self._web.json_response({"error_info": "Invalid JSON"}, status=400)
+        if not self.deliver(body, request.match_info["token"]):
+            return self._web.json_response({"error_info": "Unknown callback"}, status=404)
+        return self._web.json_response({})
+
+    async def start(self) -> None:
+        """Start serving callbacks."""
+        web = self._web
+        app = web.Application(client_max_size=self.client_max_size)
+        app.router.add_post(f"{self.path}/{{token}}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        if self.unix_socket is not None:
+            site = web.UnixSite(self._runner, self.unix_socket)
+        else:
+            site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+    async def close(self) -> None:
+        """Stop serving callbacks."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "EmbeddedCallbackServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
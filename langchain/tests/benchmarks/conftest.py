@@ -0,0 +1,109 @@
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Iterator, List
+
+import httpx
+import pytest
+
+from langchain_agentql.const import API_BASE_URL_ENV
+from langchain_agentql.http_client import close_http_clients
+from tests.benchmarks.mock_server import CONFIG_PATH
+
+
+class MockServer:
+    """The mock AgentQL server, run in a separate process so that it does not compete with the client for the GIL."""
+
+    def __init__(self) -> None:
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "tests.benchmarks.mock_server", "--port", "0"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.endpoint = httpx.URL(self._process.stdout.readline().split()[-1])
+        self.base_url = str(self.endpoint.copy_with(path="/")).rstrip("/")
+        self._config_url = self.endpoint.copy_with(path=CONFIG_PATH)
+
+    def configure(self, **config: Any) -> None:
+        """Reset the server configuration to the defaults of `MockServerConfig`, except for the given fields."""
+        httpx.put(self._config_url, json=config).raise_for_status()
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.wait()
+
+
+@pytest.fixture(scope="session")
+def mock_server() -> Iterator[MockServer]:
+    server = MockServer()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def server(mock_server: MockServer, monkeypatch: pytest.MonkeyPatch) -> Iterator[MockServer]:
+    """The mock server, reset to its default configuration, with requests sent to it."""
+    mock_server.configure()
+    monkeypatch.setenv(API_BASE_URL_ENV, mock_server.base_url)
+    yield mock_server
+    close_http_clients()
+
+
+class LatencyRecorder:
+    """Records the latency of each request of a workload."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+
+    def time(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def atime(self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+
+def _percentile(values: List[float], percentile: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+@pytest.fixture
+def run_workload(benchmark: Any) -> Callable[..., None]:
+    """
+    Benchmark a workload of `requests` requests and report requests/sec, p50 and p99 request latency, and the peak
+    Python memory allocated by one extra, untimed run.
+    """
+
+    def run(workload: Callable[[LatencyRecorder], None], requests: int, rounds: int = 3) -> None:
+        recorder = LatencyRecorder()
+        benchmark.pedantic(workload, args=(recorder,), rounds=rounds, iterations=1, warmup_rounds=1)
+
+        tracemalloc.start()
+        try:
+            workload(LatencyRecorder())
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        latencies = recorder.latencies[requests:]  # skip the warmup round
+        benchmark.extra_info.update(
+            {
+                "requests_per_second": round(requests / benchmark.stats.stats.mean, 1),
+                "p50_latency_ms": round(_percentile(latencies, 50) * 1000, 2),
+                "p99_latency_ms": round(_percentile(latencies, 99) * 1000, 2),
+                "peak_memory_mb": round(peak / 2**20, 2),
+            }
+        )
+
+    return run
@@ -0,0 +1,176 @@
+"""Local stand-in for the AgentQL `/v1/query-data` endpoint.
+
+Run it standalone to point load tests at it:
+
+    python -m tests.benchmarks.mock_server --port 8000 --latency 0.2 --items 1000 --error-rate 0.01
+
+The configuration of a running server can be changed with a `PUT /_mock/config` request whose JSON body holds the fields
+of `MockServerConfig` to change, e.g. `{"latency": 0.5}`. Fields that are not given are reset to their defaults.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+QUERY_DATA_PATH = "/v1/query-data"
+CONFIG_PATH = "/_mock/config"
+
+
+@dataclass(frozen=True)
+class MockServerConfig:
+    latency: float = 0.0
+    """Seconds to wait before responding, i.e. the extraction time."""
+    latency_jitter: float = 0.0
+    """Maximum random seconds added to `latency`."""
+    items: int = 1
+    """Number of elements in the `data.products` list of the response."""
+    item_size: int = 64
+    """Approximate size in bytes of each list element."""
+    screenshot_size: int = 0
+    """Size in bytes of the Base64 screenshot in the response metadata. 0 for no screenshot."""
+    error_rate: float = 0.0
+    """Fraction of requests answered with a 500 error."""
+    rate_limit_rps: Optional[float] = None
+    """Requests per second above which requests are answered with a 429 error. `None` for no limit."""
+    retry_after: Optional[float] = None
+    """`Retry-After` header of 429 errors, in seconds. `None` for no header."""
+
+
+def build_response(config: MockServerConfig) -> bytes:
+    products = [
+        {"name": f"Product {i}", "description": "x" * config.item_size, "price": i * 1.25}
+        for i in range(config.items)
+    ]
+    screenshot = "A" * config.screenshot_size if config.screenshot_size else None
+    response = {
+        "data": {"products": products},
+        "metadata": {"request_id": "mock-request", "generated_query": None, "screenshot": screenshot},
+    }
+    return json.dumps(response).encode()
+
+
+class MockAgentQLServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Concurrent clients open many connections at once, more than the default backlog of 5
+    request_queue_size = 1024
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[MockServerConfig] = None):
+        super().__init__((host, port), _Handler)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.configure(config or MockServerConfig())
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.base_url}{QUERY_DATA_PATH}"
+
+    def configure(self, config: Optional[MockServerConfig] = None, **changes: Any) -> None:
+        """Replace the server configuration, or change some of its fields."""
+        config = replace(config or MockServerConfig(), **changes)
+        with self._lock:
+            self.config = config
+            self.body = build_response(config)
+            self._tokens = config.rate_limit_rps or 0.0
+            self._refilled_at = time.monotonic()
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            rate = self.config.rate_limit_rps
+            if rate is None:
+                return True
+            now = time.monotonic()
+            self._tokens = min(rate, self._tokens + (now - self._refilled_at) * rate)
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def start(self) -> "MockAgentQLServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so delayed ACKs would stall every response
+    disable_nagle_algorithm = True
+    server: MockAgentQLServer
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _respond(self, status: int, body: bytes, headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != CONFIG_PATH:
+            self._respond(404, b'{"error_info": "Not found"}')
+            return
+        self.server.configure(**json.loads(body))
+        self._respond(200, b"{}")
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != QUERY_DATA_PATH:
+            self._respond(404, b'{"error_info": "Not found"}')
+            return
+
+        config = self.server.config
+        if not self.server._take_token():
+            headers = {"Retry-After": f"{config.retry_after:g}"} if config.retry_after is not None else None
+            self._respond(429, b'{"error_info": "Too many requests"}', headers)
+            return
+
+        time.sleep(config.latency + random.uniform(0, config.latency_jitter))
+        if random.random() < config.error_rate:
+            self._respond(500, b'{"error_info": "Internal server error"}')
+            return
+        self._respond(200, self.server.body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=1)
+    parser.add_argument("--item-size", type=int, default=64)
+    parser.add_argument("--screenshot-size", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rps", type=float, default=None)
+    parser.add_argument("--retry-after", type=float, default=None)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    server = MockAgentQLServer(host, port, MockServerConfig(**args))
+    print(f"Serving {server.endpoint}", flush=True)  # noqa: T201
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
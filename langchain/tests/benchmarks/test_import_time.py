@@ -0,0 +1,52 @@
+"""Cold-start import time of the package, e.g. for serverless functions that only use the REST tool and the loader.
+
+Run with `make benchmarks`. Every round imports in a fresh interpreter; `import_ms` excludes the interpreter startup.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# Only needed by the browser tools and the embedded callback server
+HEAVY_MODULES = ("playwright", "agentql", "langchain_community", "aiohttp")
+
+IMPORTS = {
+    "package": ("import langchain_agentql", True),
+    "load_data": ("from langchain_agentql.load_data import load_data", True),
+    "rest": ("from langchain_agentql import AgentQLLoader, ExtractWebDataTool", True),
+    "browser": ("from langchain_agentql import AgentQLBrowserToolkit", False),
+}
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _import(statement: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("name", IMPORTS)
+def test_import_time(benchmark, name):
+    statement, is_light = IMPORTS[name]
+    results = []
+    benchmark.pedantic(lambda: results.append(_import(statement)), rounds=5, iterations=1, warmup_rounds=1)
+
+    benchmark.extra_info["import_ms"] = round(statistics.median(r["seconds"] for r in results) * 1000, 1)
+    if is_light:
+        assert results[-1]["modules"] == []
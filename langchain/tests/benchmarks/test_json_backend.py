@@ -0,0 +1,56 @@
+"""Encoding and decoding of large responses with each JSON backend.
+
+Run with `make benchmarks` and compare the `orjson` and `json` rows of each group.
+"""
+
+import pytest
+
+from langchain_agentql import serialization
+
+pytest.importorskip("pytest_benchmark")
+
+BACKENDS = [
+    pytest.param("orjson", marks=pytest.mark.skipif(serialization.orjson is None, reason="orjson is not installed")),
+    "json",
+]
+
+LIST_RESPONSE = {
+    "data": {
+        "products": [
+            {"name": f"Product {i} — ünïcode", "price": i * 1.25, "in_stock": i % 2 == 0, "tags": ["a", "b"]}
+            for i in range(20_000)
+        ]
+    },
+    "metadata": {"request_id": "benchmark", "screenshot": None},
+}
+SCREENSHOT_RESPONSE = {
+    "data": {"title": "Example"},
+    "metadata": {"request_id": "benchmark", "screenshot": "iVBORw0KGgoAAAANSUhEUgAA" * 200_000},
+}
+RESPONSES = {"list": LIST_RESPONSE, "screenshot": SCREENSHOT_RESPONSE}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    serialization.set_json_backend(request.param)
+    yield request.param
+    serialization.set_json_backend()
+
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_decode_response(benchmark, backend, response):
+    benchmark.group = f"decode-{response}"
+    body = serialization.dumps(RESPONSES[response])
+    assert benchmark(serialization.loads, body) == RESPONSES[response]
+
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_encode_response(benchmark, backend, response):
+    benchmark.group = f"encode-{response}"
+    benchmark(serialization.dumps, RESPONSES[response])
+
+
+def test_page_content(benchmark, backend):
+    benchmark.group = "page-content"
+    products = LIST_RESPONSE["data"]["products"]
+    benchmark(lambda: [serialization.dumps_str(product) for product in products])
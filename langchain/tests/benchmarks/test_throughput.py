@@ -0,0 +1,145 @@
+"""Throughput, latency and memory of the REST API paths against the local mock server.
+
+Each benchmark reports `requests_per_second`, `p50_latency_ms`, `p99_latency_ms` and `peak_memory_mb` in its extra info,
+e.g. with `make benchmarks BENCHMARK_ARGS="--benchmark-json=results.json"`.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from langchain_agentql.document_loaders import AgentQLLoader
+from langchain_agentql.load_data import aload_data, load_data, stream_data
+from langchain_agentql.retry import RetryPolicy
+from langchain_agentql.tools import ExtractWebDataTool
+
+pytest.importorskip("pytest_benchmark")
+
+LATENCY = 0.005
+REQUESTS = 200
+CONCURRENCY = 20
+QUERY = "{ products[] { name description price } }"
+FAST_RETRY_POLICY = RetryPolicy(backoff_base=0.01, backoff_max=0.05, jitter=False, retry_after_max=0.05)
+
+
+def _kwargs(i: int) -> dict:
+    # Distinct URLs, so that concurrent requests are not coalesced
+    return {
+        "url": f"https://example.com/products/{i}",
+        "query": QUERY,
+        "api_key": "benchmark-key",
+        "metadata": {},
+        "params": {},
+        "timeout": 30,
+    }
+
+
+def test_load_data_sequential(server, run_workload):
+    server.configure(latency=LATENCY, items=50)
+    requests = 50
+
+    def workload(recorder):
+        for i in range(requests):
+            recorder.time(load_data, **_kwargs(i))
+
+    run_workload(workload, requests)
+
+
+def test_aload_data_concurrent(server, run_workload):
+    server.configure(latency=LATENCY, items=50)
+
+    async def run(recorder):
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        async with httpx.AsyncClient() as client:
+
+            async def request(i):
+                async with semaphore:
+                    await recorder.atime(aload_data, **_kwargs(i), client=client)
+
+            await asyncio.gather(*(request(i) for i in range(REQUESTS)))
+
+    run_workload(lambda recorder: asyncio.run(run(recorder)), REQUESTS)
+
+
+def test_extract_many_batch(server, run_workload):
+    server.configure(latency=LATENCY, items=50)
+    tool = ExtractWebDataTool(api_key="benchmark-key")
+    urls = [f"https://example.com/products/{i}" for i in range(REQUESTS)]
+
+    def workload(recorder):
+        extract = tool._extract
+
+        def timed_extract(*args):
+            return recorder.time(extract, *args)
+
+        tool.__dict__["_extract"] = timed_extract
+        try:
+            results = list(tool.extract_many(urls, query=QUERY, concurrency=CONCURRENCY))
+        finally:
+            del tool.__dict__["_extract"]
+        assert all(result.ok for result in results)
+
+    run_workload(workload, REQUESTS)
+
+
+def test_loader_alazy_load(server, run_workload):
+    server.configure(latency=LATENCY, items=50)
+    urls = [f"https://example.com/products/{i}" for i in range(REQUESTS)]
+
+    async def run(recorder):
+        async with httpx.AsyncClient() as client:
+            loader = AgentQLLoader(
+                urls, query=QUERY, api_key="benchmark-key", async_http_client=client, concurrency=CONCURRENCY
+            )
+            loader._aload_documents = _timed(recorder, loader._aload_documents)
+            assert len([document async for document in loader.alazy_load()]) == REQUESTS
+
+    run_workload(lambda recorder: asyncio.run(run(recorder)), REQUESTS)
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["load", "stream"])
+def test_large_response(server, run_workload, streamed):
+    server.configure(items=20_000, item_size=128, screenshot_size=4 * 2**20)
+    requests = 5
+
+    def request(i):
+        if not streamed:
+            return len(load_data(**_kwargs(i))["data"]["products"])
+        with stream_data(**_kwargs(i), item_path="products", screenshot=None) as stream:
+            return sum(1 for _ in stream)
+
+    def workload(recorder):
+        for i in range(requests):
+            assert recorder.time(request, i) == 20_000
+
+    run_workload(workload, requests)
+
+
+def test_load_data_rate_limited(server, run_workload):
+    server.configure(latency=LATENCY, items=50, rate_limit_rps=200, retry_after=0.01, error_rate=0.02)
+
+    async def run(recorder):
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        async with httpx.AsyncClient() as client:
+
+            async def request(i):
+                async with semaphore:
+                    try:
+                        await recorder.atime(
+                            aload_data, **_kwargs(i), client=client, retry_policy=FAST_RETRY_POLICY
+                        )
+                    except ValueError:
+                        # Out of retries
+                        pass
+
+            await asyncio.gather(*(request(i) for i in range(REQUESTS)))
+
+    run_workload(lambda recorder: asyncio.run(run(recorder)), REQUESTS)
+
+
+def _timed(recorder, fn):
+    async def timed(*args, **kwargs):
+        return await recorder.atime(fn, *args, **kwargs)
+
+    return timed
@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from langchain_agentql.tools import ExtractWebDataTool
+
+TEST_QUERY = "{ title }"
+
+
+async def _async_handler(request: httpx.Request) -> httpx.Response:
+    url = json.loads(request.content)["url"]
+    await asyncio.sleep(0.01)
+    if url.endswith("/missing"):
+        return httpx.Response(404, json={"error_info": "Page not found"})
+    return httpx.Response(200, json={"data": {"url": url}, "metadata": {}})
+
+
+def _sync_handler(request: httpx.Request) -> httpx.Response:
+    url = json.loads(request.content)["url"]
+    if url.endswith("/missing"):
+        return httpx.Response(404, json={"error_info": "Page not found"})
+    return httpx.Response(200, json={"data": {"url": url}, "metadata": {}})
+
+
+@pytest.fixture()
+def tool() -> ExtractWebDataTool:
+    return ExtractWebDataTool(
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(_sync_handler)),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(_async_handler)),
+    )
+
+
+def test_extract_many_collects_errors(tool):
+    urls = [f"https://example.com/{i}" for i in range(5)] + ["https://example.com/missing"]
+    results = list(tool.extract_many(urls, query=TEST_QUERY, concurrency=3))
+    assert len(results) == 6
+    failed = [result for result in results if not result.ok]
+    assert [result.url for result in failed] == ["https://example.com/missing"]
+    assert "Page not found" in str(failed[0].error)
+    assert all(r.data["data"]["url"] == r.url for r in results if r.ok)
+
+
+def test_extract_many_stops_on_error(tool):
+    with pytest.raises(ValueError, match="Page not found"):
+        list(
+            tool.extract_many(
+                ["https://example.com/missing"], query=TEST_QUERY, stop_on_error=True
+            )
+        )
+
+
+def test_extract_many_reports_invalid_urls(tool):
+    results = list(tool.extract_many(["ftp://example.com"], query=TEST_QUERY))
+    assert "URL scheme" in str(results[0].error)
+
+
+def test_extract_many_reports_none_urls_and_continues(tool):
+    urls = ["https://example.com/0", None, "https://example.com/1"]
+    results = list(tool.extract_many(urls, query=TEST_QUERY, concurrency=1))
+    assert [result.url for result in results] == urls
+    assert [result.ok for result in results] == [True, False, True]
+
+
+def test_extract_many_requires_query_or_prompt(tool):
+    with pytest.raises(ValueError):
+        tool.extract_many(["https://example.com"])
+
+
+async def test_aextract_many(tool):
+    urls = (f"https://example.com/{i}" for i in range(20))
+    results = [result async for result in tool.aextract_many(urls, query=TEST_QUERY, concurrency=5)]
+    assert len(results) == 20
+    assert all(result.ok for result in results)
+
+
+async def test_aextract_many_stops_on_error(tool):
+    urls = ["https://example.com/missing"] + [f"https://example.com/{i}" for i in range(5)]
+    with pytest.raises(ValueError, match="Page not found"):
+        async for _ in tool.aextract_many(urls, query=TEST_QUERY, stop_on_error=True):
+            pass
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from langchain_agentql import browser_manager
+from langchain_agentql.browser_manager import AsyncBrowserManager
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages = []
+        self.listeners = []
+
+    def on(self, event: str, listener) -> None:
+        self.listeners.append(listener)
+
+    def open_page(self) -> None:
+        self.pages.append(object())
+        for listener in self.listeners:
+            listener(self.pages[-1])
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class FakeLauncher:
+    def __init__(self) -> None:
+        self.browsers = []
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        await asyncio.sleep(0)
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeLauncher()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    playwright = FakePlaywright()
+
+    class FakeContextManager:
+        async def start(self):
+            return playwright
+
+    monkeypatch.setattr(browser_manager, "async_playwright", FakeContextManager)
+    return playwright
+
+
+async def test_manager_reuses_browser_and_shuts_down(playwright):
+    async with AsyncBrowserManager() as manager:
+        browser = await manager.get_browser()
+        assert await manager.get_browser() is browser
+    assert len(playwright.chromium.browsers) == 1
+    assert not browser.is_connected()
+    assert playwright.stopped
+    with pytest.raises(RuntimeError):
+        await manager.get_browser()
+
+
+async def test_manager_relaunches_crashed_browser(playwright):
+    async with AsyncBrowserManager() as manager:
+        async with manager.browser() as browser:
+            browser.connected = False
+            assert await manager.get_browser() is not browser
+        assert manager.restarts == 1
+
+
+async def test_manager_relaunches_after_max_pages_once_released(playwright):
+    async with AsyncBrowserManager(max_pages=2) as manager:
+        async with manager.browser() as browser:
+            context = FakeContext()
+            browser.contexts.append(context)
+            context.open_page()
+            await manager.get_browser()
+            context.open_page()
+            assert await manager.get_browser() is browser
+        assert manager.pages_opened == 2
+        assert await manager.get_browser() is not browser
+        assert manager.pages_opened == 0
+
+
+async def test_concurrent_blocks_do_not_recycle_a_browser_in_use(playwright):
+    async with AsyncBrowserManager(max_pages=1) as manager:
+        worn_out = await manager.get_browser()
+        worn_out.contexts.append(FakeContext())
+        worn_out.contexts[0].open_page()
+
+        async def first_block():
+            async with manager.browser() as browser:
+                browser.contexts.append(FakeContext())
+                browser.contexts[0].open_page()
+                await asyncio.sleep(0.01)
+                assert browser.is_connected()
+                return browser
+
+        async def second_block():
+            async with manager.browser() as browser:
+                return browser
+
+        first, second = await asyncio.gather(first_block(), second_block())
+        assert first is second is not worn_out
+        assert manager.restarts == 1
@@ -0,0 +1,102 @@
+import time
+
+import httpx
+
+from langchain_agentql.cache import (
+    InMemoryCache,
+    SQLiteCache,
+    make_cache_key,
+    normalize_url,
+)
+from langchain_agentql.tools import ExtractWebDataTool
+
+TEST_ARGS = {"url": "https://example.com", "query": "{ title }"}
+
+
+class _CountingHandler:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(
+            200, json={"data": {"calls": self.calls}, "metadata": {"request_id": "id"}}
+        )
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.com:443?b=2&a=1#top") == (
+        "https://example.com/?a=1&b=2"
+    )
+    assert normalize_url("http://example.com:8080/path") == (
+        "http://example.com:8080/path"
+    )
+
+
+def test_cache_key_depends_on_params():
+    key = make_cache_key("https://example.com", "{ a }", None, {"mode": "fast"}, {})
+    assert key == make_cache_key("https://EXAMPLE.com/", "{ a }", None, {"mode": "fast"}, {})
+    assert key != make_cache_key("https://example.com", "{ a }", None, {"mode": "standard"}, {})
+
+
+def test_in_memory_cache_lru_and_ttl():
+    cache = InMemoryCache(max_size=2, ttl=60)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+
+    cache._entries["a"] = (time.time() - 120, {"v": 1})
+    assert cache.get("a") is None
+
+
+def test_in_memory_cache_max_age():
+    cache = InMemoryCache()
+    cache._entries["a"] = (time.time() - 10, {"v": 1})
+    assert cache.get("a", max_age=5) is None
+    assert cache.get("a") == {"v": 1}
+
+
+def test_sqlite_cache(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=60)
+    cache.set("a", {"v": [1, 2]})
+    assert cache.get("a") == {"v": [1, 2]}
+    assert cache.get("missing") is None
+    cache.clear()
+    assert cache.get("a") is None
+    cache.close()
+
+
+def _tool(handler: _CountingHandler) -> ExtractWebDataTool:
+    transport = httpx.MockTransport(handler)
+    return ExtractWebDataTool(
+        api_key="test-key",
+        cache=InMemoryCache(),
+        http_client=httpx.Client(transport=transport),
+        async_http_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_tool_reuses_cached_result():
+    handler = _CountingHandler()
+    tool = _tool(handler)
+    assert tool.invoke(TEST_ARGS)["data"] == {"calls": 1}
+    assert tool.invoke(TEST_ARGS)["data"] == {"calls": 1}
+    bypassed = tool.invoke(
+        TEST_ARGS, config={"configurable": {"agentql_bypass_cache": True}}
+    )
+    assert bypassed["data"] == {"calls": 2}
+    assert tool.invoke(TEST_ARGS)["data"] == {"calls": 2}
+
+
+async def test_tool_reuses_cached_result_async():
+    handler = _CountingHandler()
+    tool = _tool(handler)
+    assert (await tool.ainvoke(TEST_ARGS))["data"] == {"calls": 1}
+    assert (await tool.ainvoke(TEST_ARGS))["data"] == {"calls": 1}
+    refreshed = await tool.ainvoke(
+        TEST_ARGS, config={"configurable": {"agentql_cache_max_age": 0}}
+    )
+    assert refreshed["data"] == {"calls": 2}
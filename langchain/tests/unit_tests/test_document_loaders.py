@@ -0,0 +1,211 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from langchain_agentql.cache import InMemoryCache
+from langchain_agentql.document_loaders import AgentQLLoader
+
+TEST_QUERY = "{ title }"
+DELAYS = {"https://example.com/slow": 0.05, "https://example.com/fast": 0.0}
+
+
+class _AsyncHandler:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(DELAYS.get(payload["url"], 0.01))
+        self.in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "data": {"query": payload["query"]},
+                "metadata": {"request_id": payload["url"]},
+            },
+        )
+
+
+def _loader(handler: _AsyncHandler, url, **kwargs) -> AgentQLLoader:
+    return AgentQLLoader(
+        url=url,
+        api_key="test-key",
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+async def test_alazy_load_yields_in_completion_order():
+    loader = _loader(
+        _AsyncHandler(),
+        ["https://example.com/slow", "https://example.com/fast"],
+        query=TEST_QUERY,
+    )
+    urls = [doc.metadata["url"] async for doc in loader.alazy_load()]
+    assert urls == ["https://example.com/fast", "https://example.com/slow"]
+
+
+async def test_alazy_load_preserves_input_order():
+    loader = _loader(
+        _AsyncHandler(),
+        ["https://example.com/slow", "https://example.com/fast"],
+        query=TEST_QUERY,
+        preserve_order=True,
+    )
+    urls = [doc.metadata["url"] async for doc in loader.alazy_load()]
+    assert urls == ["https://example.com/slow", "https://example.com/fast"]
+
+
+async def test_alazy_load_bounds_concurrency():
+    handler = _AsyncHandler()
+    urls = (f"https://example.com/{i}" for i in range(10))
+    loader = _loader(handler, urls, query=TEST_QUERY, concurrency=3)
+    docs = [doc async for doc in loader.alazy_load()]
+    assert len(docs) == 10
+    assert handler.max_in_flight == 3
+
+
+async def test_alazy_load_with_url_query_pairs():
+    loader = _loader(
+        _AsyncHandler(),
+        [("https://example.com/a", "{ a }"), "https://example.com/b"],
+        query=TEST_QUERY,
+        preserve_order=True,
+    )
+    docs = [doc async for doc in loader.alazy_load()]
+    assert [doc.page_content for doc in docs] == [
+        '{"query":"{ a }"}',
+        '{"query":"{ title }"}',
+    ]
+
+
+def test_missing_query_raises():
+    loader = _loader(_AsyncHandler(), ["https://example.com"])
+    with pytest.raises(ValueError, match="No AgentQL query provided"):
+        loader.load()
+
+
+async def test_aload_does_not_use_threads(monkeypatch):
+    async def _no_executor(*args, **kwargs):
+        raise AssertionError("alazy_load must not run in an executor")
+
+    monkeypatch.setattr(
+        "langchain_core.document_loaders.base.run_in_executor", _no_executor
+    )
+
+    async def _urls():
+        for i in range(3):
+            yield f"https://example.com/{i}"
+
+    loader = _loader(_AsyncHandler(), _urls(), query=TEST_QUERY)
+    docs = await loader.aload()
+    assert len(docs) == 3
+
+
+def test_async_urls_cannot_be_loaded_synchronously():
+    async def _urls():
+        yield "https://example.com"
+
+    loader = _loader(_AsyncHandler(), _urls(), query=TEST_QUERY)
+    with pytest.raises(TypeError, match="alazy_load"):
+        loader.load()
+
+
+POSTS = [{"title": "Launch Week", "url": "/launch"}, {"title": "Pricing", "url": "/pricing"}]
+
+
+def _posts_client() -> httpx.Client:
+    return httpx.Client(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(
+                200,
+                headers={"X-Request-Id": "test-id"},
+                json={"data": {"posts": POSTS}, "metadata": {"request_id": "test-id"}},
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("cache", [None, InMemoryCache()])
+def test_lazy_load_yields_one_document_per_item(cache):
+    loader = AgentQLLoader(
+        url="https://example.com",
+        query="{ posts[] { title url } }",
+        api_key="test-key",
+        http_client=_posts_client(),
+        item_path="posts",
+        cache=cache,
+    )
+    documents = list(loader.lazy_load())
+    assert [json.loads(document.page_content) for document in documents] == POSTS
+    assert documents[1].page_content == '{"title":"Pricing","url":"/pricing"}'
+    if cache is None:
+        # Streamed documents get the request ID of the header instead of waiting for the response metadata
+        assert documents[1].metadata == {"request_id": "test-id", "url": "https://example.com", "index": 1}
+        return
+    timing = documents[1].metadata.pop("agentql_timing")
+    assert documents[1].metadata == {"request_id": "test-id", "url": "https://example.com", "index": 1}
+    assert timing["url"] == "https://example.com" and timing["attempts"] == 1
+
+
+def _chunked_posts(sent: list):
+    body = json.dumps({"data": {"posts": POSTS}, "metadata": {"request_id": "test-id"}}).encode()
+    for start in range(0, len(body), 16):
+        sent.append(start)
+        yield body[start : start + 16]
+
+
+def test_lazy_load_yields_items_before_the_response_is_read():
+    sent = []
+    loader = AgentQLLoader(
+        url="https://example.com",
+        query="{ posts[] { title url } }",
+        api_key="test-key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, content=_chunked_posts(sent)))
+        ),
+        item_path="posts",
+    )
+    documents = loader.lazy_load()
+    first = next(documents)
+    assert json.loads(first.page_content) == POSTS[0]
+    sent_before_first = len(sent)
+    assert [json.loads(document.page_content) for document in documents] == POSTS[1:]
+    assert sent_before_first < len(sent)
+
+
+async def test_alazy_load_yields_items_before_the_response_is_read():
+    sent = []
+
+    async def content():
+        for chunk in _chunked_posts(sent):
+            yield chunk
+            await asyncio.sleep(0)
+
+    loader = _loader(
+        lambda _: httpx.Response(200, content=content()),
+        "https://example.com",
+        query="{ posts[] { title url } }",
+        item_path="posts",
+    )
+    documents = loader.alazy_load()
+    first = await documents.__anext__()
+    assert first.metadata == {"url": "https://example.com", "index": 0}
+    sent_before_first = len(sent)
+    assert [json.loads(document.page_content) async for document in documents] == POSTS[1:]
+    assert sent_before_first < len(sent)
+
+
+async def test_aload_yields_one_document_per_item():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": {"posts": POSTS}, "metadata": {"request_id": "test-id"}})
+
+    urls = ["https://example.com/a", "https://example.com/b"]
+    documents = await _loader(handler, urls, query=TEST_QUERY, item_path="posts").aload()
+    assert len(documents) == 4
+    assert {document.metadata["url"] for document in documents} == set(urls)
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+
+from langchain_agentql.const import API_BASE_URL_ENV
+from langchain_agentql.endpoints import (
+    EndpointPool,
+    get_endpoint_pool,
+    resolve_base_urls,
+)
+from langchain_agentql.load_data import load_data
+from langchain_agentql.retry import RetryPolicy
+
+
+def test_resolve_base_urls(monkeypatch):
+    monkeypatch.delenv(API_BASE_URL_ENV, raising=False)
+    assert resolve_base_urls() == ("https://api.agentql.com",)
+    monkeypatch.setenv(API_BASE_URL_ENV, "http://eu.local/, http://us.local")
+    assert resolve_base_urls() == ("http://eu.local", "http://us.local")
+    assert resolve_base_urls(["http://proxy.local/"]) == ("http://proxy.local",)
+    with pytest.raises(ValueError):
+        resolve_base_urls(" , ")
+
+
+def test_pool_round_robin_skips_failed_endpoints():
+    pool = EndpointPool(["http://a", "http://b", "http://c"], cooldown=60)
+    assert [pool.next() for _ in range(3)] == ["http://a", "http://b", "http://c"]
+    pool.report("http://b", httpx.ConnectError("refused"))
+    assert [pool.next() for _ in range(4)] == ["http://a", "http://c", "http://a", "http://c"]
+    pool.report("http://b")
+    assert "http://b" in [pool.next() for _ in range(3)]
+
+
+def test_pool_falls_back_to_failed_endpoints():
+    pool = EndpointPool(["http://a", "http://b"], cooldown=60)
+    pool.report("http://a", httpx.ConnectError("refused"))
+    pool.report("http://b", httpx.ConnectError("refused"))
+    assert pool.next() == "http://a"
+
+
+def test_load_data_fails_over_to_next_endpoint():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.host)
+        if request.url.host == "down.local":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"data": {}, "metadata": {}})
+
+    base_url = ["http://down.local", "http://up.local"]
+    get_endpoint_pool(base_url).report("http://down.local")
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    kwargs = {"query": "{ title }", "api_key": "test-key", "metadata": {}, "params": {}, "timeout": 10}
+    policy = RetryPolicy(backoff_base=0, jitter=False)
+    for i in range(2):
+        load_data(url=f"https://example.com/{i}", client=client, base_url=base_url, retry_policy=policy, **kwargs)
+    assert requested == ["down.local", "up.local", "up.local"]
@@ -0,0 +1,67 @@
+import httpx
+import pytest
+
+from langchain_agentql.errors import (
+    AgentQLAPIError,
+    AgentQLAuthenticationError,
+    AgentQLConnectionError,
+    AgentQLRateLimitError,
+)
+from langchain_agentql.load_data import aload_data, load_data, stream_data
+from langchain_agentql.retry import RetryPolicy
+
+KWARGS = {
+    "url": "https://example.com",
+    "query": "{ title }",
+    "api_key": "test-key",
+    "metadata": {},
+    "params": {},
+    "timeout": 10,
+    "coalesce": False,
+    "retry_policy": RetryPolicy(max_attempts=1),
+}
+
+
+def _client(response: httpx.Response) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(lambda request: response))
+
+
+def test_api_error_carries_status_request_id_and_retryability():
+    response = httpx.Response(500, json={"error_info": "Extraction failed", "metadata": {"request_id": "req-1"}})
+    with pytest.raises(AgentQLAPIError, match="Extraction failed") as exc_info:
+        load_data(client=_client(response), **KWARGS)
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.request_id == "req-1"
+    assert exc_info.value.retryable
+    assert isinstance(exc_info.value, ValueError)
+
+
+def test_client_errors_are_not_retryable():
+    response = httpx.Response(400, text="bad gateway page", headers={"X-Request-Id": "req-2"})
+    with pytest.raises(AgentQLAPIError) as exc_info:
+        load_data(client=_client(response), **KWARGS)
+    assert exc_info.value.request_id == "req-2"
+    assert not exc_info.value.retryable
+
+
+def test_unauthorized_and_rate_limited_errors():
+    with pytest.raises(AgentQLAuthenticationError, match="Invalid AgentQL API key"):
+        load_data(client=_client(httpx.Response(401)), **KWARGS)
+
+    response = httpx.Response(429, json={"error_info": "Slow down"}, headers={"Retry-After": "7"})
+    with pytest.raises(AgentQLRateLimitError) as exc_info:
+        with stream_data(client=_client(response), **{k: v for k, v in KWARGS.items() if k != "coalesce"}) as stream:
+            list(stream)
+    assert exc_info.value.retry_after == 7
+    assert exc_info.value.retryable
+
+
+async def test_transport_errors_are_wrapped():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with pytest.raises(AgentQLConnectionError) as exc_info:
+        await aload_data(client=client, **KWARGS)
+    assert exc_info.value.retryable
+    assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
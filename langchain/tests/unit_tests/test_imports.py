@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+
+import langchain_agentql
+from langchain_agentql import tools
+
+
+def test_rest_imports_do_not_import_browser_dependencies():
+    code = (
+        "import sys\n"
+        "from langchain_agentql import AgentQLLoader, ExtractWebDataTool\n"
+        "from langchain_agentql.tools import ExtractWebDataTool\n"
+        "print(sorted(m for m in ('playwright', 'agentql', 'langchain_community', 'aiohttp') if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_exports_are_loaded_on_access():
+    from langchain_agentql.tools.extract_web_data_tool import ExtractWebDataTool
+
+    assert langchain_agentql.ExtractWebDataTool is ExtractWebDataTool
+    assert tools.ExtractWebDataTool is ExtractWebDataTool
+    assert set(langchain_agentql.__all__) <= set(dir(langchain_agentql))
+    with pytest.raises(AttributeError, match="Missing"):
+        langchain_agentql.Missing
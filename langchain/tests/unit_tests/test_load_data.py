@@ -0,0 +1,63 @@
+import httpx
+import pytest
+
+from langchain_agentql import http_client
+from langchain_agentql.const import EXTRACT_DATA_ENDPOINT
+from langchain_agentql.load_data import aload_data, load_data
+
+TEST_URL = "https://example.com"
+TEST_QUERY = "{ title }"
+TEST_RESPONSE = {"data": {"title": "Example"}, "metadata": {"request_id": "test-id"}}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    assert str(request.url) == EXTRACT_DATA_ENDPOINT
+    assert request.headers["X-API-Key"] == "test-key"
+    return httpx.Response(200, json=TEST_RESPONSE)
+
+
+def _load_kwargs() -> dict:
+    return {
+        "url": TEST_URL,
+        "query": TEST_QUERY,
+        "api_key": "test-key",
+        "metadata": {},
+        "params": {},
+        "timeout": 10,
+    }
+
+
+def test_load_data_with_injected_client():
+    client = httpx.Client(transport=httpx.MockTransport(_handler))
+    assert load_data(**_load_kwargs(), client=client) == TEST_RESPONSE
+
+
+async def test_aload_data_with_injected_client():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    assert await aload_data(**_load_kwargs(), client=client) == TEST_RESPONSE
+
+
+def test_load_data_error_message():
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(400, json={"error_info": "Bad query"})
+        )
+    )
+    with pytest.raises(ValueError, match="Bad query"):
+        load_data(**_load_kwargs(), client=client)
+
+
+def test_shared_sync_client_is_reused():
+    client = http_client.get_sync_client()
+    assert http_client.get_sync_client() is client
+    http_client.close_http_clients()
+    assert client.is_closed
+    assert http_client.get_sync_client() is not client
+    http_client.close_http_clients()
+
+
+async def test_shared_async_client_is_reused():
+    client = http_client.get_async_client()
+    assert http_client.get_async_client() is client
+    await http_client.aclose_http_clients()
+    assert client.is_closed
@@ -0,0 +1,116 @@
+import httpx
+import pytest
+
+from langchain_agentql import utils
+from langchain_agentql.cache import InMemoryCache
+from langchain_agentql.errors import AgentQLAPIError
+from langchain_agentql.load_data import load_data
+from langchain_agentql.metrics import (
+    MetricsExporter,
+    MetricsRegistry,
+    OpenMetricsFileExporter,
+    PeriodicExporter,
+    get_registry,
+)
+
+KWARGS = {
+    "query": "{ title }",
+    "api_key": "test-key",
+    "metadata": {},
+    "params": {},
+    "timeout": 10,
+    "coalesce": False,
+}
+RESPONSE = {"data": {"title": "Example"}, "metadata": {"request_id": "req-1"}}
+
+
+def _value(name: str, **labels: str) -> float:
+    return get_registry().get_sample_value(name, labels) or 0.0
+
+
+def _client(response: httpx.Response) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(lambda _: response))
+
+
+def test_calls_are_counted_by_outcome_and_status():
+    success = {"operation": "query_data", "outcome": "success", "status": "200"}
+    failure = {"operation": "query_data", "outcome": "error", "status": "400"}
+    before = (_value("agentql_requests_total", **success), _value("agentql_requests_total", **failure))
+    received = _value("agentql_response_bytes_total", operation="query_data")
+    observed = _value("agentql_request_duration_seconds_count", operation="query_data", outcome="success")
+
+    load_data(url="https://example.com/metrics", client=_client(httpx.Response(200, json=RESPONSE)), **KWARGS)
+    with pytest.raises(AgentQLAPIError):
+        load_data(url="https://example.com/metrics", client=_client(httpx.Response(400)), **KWARGS)
+
+    after = (_value("agentql_requests_total", **success), _value("agentql_requests_total", **failure))
+    assert after == (before[0] + 1, before[1] + 1)
+    assert _value("agentql_response_bytes_total", operation="query_data") > received
+    assert _value("agentql_request_duration_seconds_count", operation="query_data", outcome="success") == observed + 1
+    assert _value("agentql_requests_in_flight", operation="query_data") == 0
+
+
+def test_cache_lookups_are_counted():
+    hits = _value("agentql_cache_lookups_total", result="hit")
+    misses = _value("agentql_cache_lookups_total", result="miss")
+    cache = InMemoryCache()
+    client = _client(httpx.Response(200, json=RESPONSE))
+    for _ in range(3):
+        load_data(url="https://example.com/cached", client=client, cache=cache, **KWARGS)
+    assert _value("agentql_cache_lookups_total", result="hit") == hits + 2
+    assert _value("agentql_cache_lookups_total", result="miss") == misses + 1
+
+
+def test_wrapped_pages_are_counted(monkeypatch):
+    class FakePage:
+        def once(self, event, handler):
+            self.on_close = handler
+
+    monkeypatch.setattr(utils.agentql, "wrap", lambda page: ("wrapped", page))
+    wrapped = _value("agentql_browser_pages_wrapped")
+    page = FakePage()
+    utils._wrap_page(page)
+    utils._wrap_page(page)
+    assert _value("agentql_browser_pages_wrapped") == wrapped + 1
+    page.on_close(page)
+    assert _value("agentql_browser_pages_wrapped") == wrapped
+
+
+def test_openmetrics_text():
+    registry = MetricsRegistry()
+    registry.counter("jobs", "Jobs by state.", ("state",)).inc(state='done "ok"')
+    registry.histogram("latency_seconds", "Latency.", buckets=(1, 5)).observe(2)
+    assert registry.to_openmetrics() == (
+        "# HELP jobs Jobs by state.\n"
+        "# TYPE jobs counter\n"
+        'jobs_total{state="done \\"ok\\""} 1.0\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{le="1.0"} 0\n'
+        'latency_seconds_bucket{le="5.0"} 1\n'
+        'latency_seconds_bucket{le="+Inf"} 1\n'
+        "latency_seconds_count 1\n"
+        "latency_seconds_sum 2.0\n"
+        "# EOF\n"
+    )
+
+
+def test_periodic_exporter_exports_on_stop(tmp_path):
+    class RecordingExporter(MetricsExporter):
+        def __init__(self):
+            self.snapshots = []
+
+        def export(self, families):
+            self.snapshots.append(families)
+
+    registry = MetricsRegistry()
+    registry.gauge("workers", "Workers.").set(3)
+    exporter = RecordingExporter()
+    with PeriodicExporter(exporter, interval=3600, registry=registry):
+        pass
+    [[family]] = exporter.snapshots
+    assert family.samples[0].value == 3
+
+    path = tmp_path / "agentql.prom"
+    OpenMetricsFileExporter(str(path)).export(registry.collect())
+    assert path.read_text() == registry.to_openmetrics()
@@ -0,0 +1,118 @@
+import itertools
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from langchain_agentql.page_cache import DOM_VERSION_SCRIPT, PageResultCache
+from langchain_agentql.tools import ExtractWebDataBrowserTool
+from langchain_agentql.tracing import CallTrace
+
+_documents = itertools.count()
+
+
+class FakePage:
+    """Keeps the DOM version like `DOM_VERSION_SCRIPT` does in a browser."""
+
+    def __init__(self, url: str = "https://example.com") -> None:
+        self.url = url
+        self.queries = []
+        self.navigate(url)
+
+    def navigate(self, url: str) -> None:
+        self.url = url
+        self.document, self.version = next(_documents), 0
+
+    def mutate(self) -> None:
+        self.version += 1
+
+    def evaluate(self, script: str) -> str:
+        assert script == DOM_VERSION_SCRIPT
+        return f"{self.document}:{self.version}"
+
+    def query_data(self, query, *args, **kwargs) -> dict:
+        # The annotations AgentQL adds to the DOM it queries are not counted as mutations
+        self.queries.append(query)
+        return {"title": f"Title {len(self.queries)}"}
+
+
+@pytest.fixture()
+def tool(monkeypatch):
+    page = FakePage()
+    monkeypatch.setattr(ExtractWebDataBrowserTool, "_get_page", lambda self: page)
+    return ExtractWebDataBrowserTool.model_construct(page_cache=PageResultCache())
+
+
+def test_unchanged_page_returns_cached_data(tool):
+    page = tool._get_page()
+    first = tool.invoke({"query": "{ title }"})
+    first["title"] = "Changed"
+    assert tool.invoke({"query": "{\n  title\n}"}) == {"title": "Title 1"}
+    assert page.queries == ["{ title }"]
+
+    tool.invoke({"query": "{ heading }"})
+    assert len(page.queries) == 2
+
+
+def test_mutation_and_navigation_invalidate_cached_data(tool):
+    page = tool._get_page()
+    tool.invoke({"query": "{ title }"})
+    page.mutate()
+    assert tool.invoke({"query": "{ title }"}) == {"title": "Title 2"}
+
+    page.navigate("https://example.com")
+    assert tool.invoke({"query": "{ title }"}) == {"title": "Title 3"}
+    page.navigate("https://example.com/other")
+    tool.invoke({"query": "{ title }"})
+    assert len(page.queries) == 4
+    assert len(tool.page_cache) == 1
+
+
+def test_cache_can_be_bypassed(tool):
+    page = tool._get_page()
+    tool.invoke({"query": "{ title }"})
+    assert tool.invoke({"query": "{ title }"}, config={"configurable": {"agentql_bypass_cache": True}}) == {
+        "title": "Title 2"
+    }
+    assert tool.invoke({"query": "{ title }"}) == {"title": "Title 2"}
+    assert len(page.queries) == 2
+
+
+def test_data_extracted_across_a_navigation_is_not_cached():
+    cache = PageResultCache()
+    page = FakePage()
+
+    def extract():
+        page.navigate("https://example.com/next")
+        return {"title": "Title"}
+
+    trace = CallTrace("agentql.extract_web_data_browser")
+    assert cache.get_or_extract(page, "key", extract, trace) == {"title": "Title"}
+    assert len(cache) == 0
+    assert trace.attributes["cache_hit"] is False
+
+
+def test_data_extracted_while_the_page_changes_is_not_cached():
+    cache = PageResultCache()
+    page = FakePage()
+
+    def extract():
+        page.mutate()
+        return {"title": "Loading"}
+
+    trace = CallTrace("agentql.extract_web_data_browser")
+    assert cache.get_or_extract(page, "key", extract, trace) == {"title": "Loading"}
+    assert len(cache) == 0
+    assert cache.get_or_extract(page, "key", lambda: {"title": "Title"}, trace) == {"title": "Title"}
+    assert len(cache) == 1
+
+
+def test_failed_extraction_is_not_cached():
+    cache = PageResultCache()
+    page = FakePage()
+
+    def extract():
+        raise PlaywrightError("Timeout")
+
+    with pytest.raises(PlaywrightError):
+        cache.get_or_extract(page, "key", extract, CallTrace("agentql.extract_web_data_browser"))
+    assert len(cache) == 0
@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+from langchain_agentql import page_pool
+from langchain_agentql.errors import AgentQLTimeoutError
+from langchain_agentql.page_pool import AsyncPagePool
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+        self.urls = []
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def evaluate(self, expression: str) -> int:
+        return 1
+
+    async def goto(self, url: str) -> None:
+        self.urls.append(url)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, failing: bool = False) -> None:
+        self.page = FakePage()
+        self.failing = failing
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        if self.failing:
+            raise RuntimeError("Page crashed")
+        return self.page
+
+    async def close(self) -> None:
+        self.closed = self.page.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts = []
+        self.failing = False
+        self.failing_pages = 0
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self) -> FakeContext:
+        if self.failing:
+            raise RuntimeError("Browser crashed")
+        self.contexts.append(FakeContext(failing=self.failing_pages > 0))
+        self.failing_pages -= 1
+        return self.contexts[-1]
+
+
+@pytest.fixture(autouse=True)
+def no_agentql_wrap(monkeypatch):
+    async def wrap_async(page):
+        return page
+
+    monkeypatch.setattr(page_pool.agentql, "wrap_async", wrap_async)
+
+
+async def test_pool_prewarms_pages():
+    browser = FakeBrowser()
+    async with AsyncPagePool(browser, size=3):
+        assert len(browser.contexts) == 3
+
+
+async def test_pool_bounds_concurrent_checkouts():
+    pool = AsyncPagePool(FakeBrowser(), size=2)
+    in_use = set()
+    max_in_use = 0
+
+    async def session():
+        nonlocal max_in_use
+        async with pool.acquire() as page:
+            assert page not in in_use
+            in_use.add(page)
+            max_in_use = max(max_in_use, len(in_use))
+            await asyncio.sleep(0.01)
+            in_use.remove(page)
+
+    await asyncio.gather(*(session() for _ in range(6)))
+    assert max_in_use == 2
+    await pool.close()
+
+
+async def test_pool_recycles_pages_after_max_uses():
+    browser = FakeBrowser()
+    async with AsyncPagePool(browser, size=1, max_uses=2) as pool:
+        pages = []
+        for _ in range(3):
+            async with pool.acquire() as page:
+                pages.append(page)
+        assert pages[0] is pages[1]
+        assert pages[2] is not pages[0]
+        assert pages[0].closed
+
+
+async def test_pool_replaces_unhealthy_pages_and_resets_released_pages():
+    async with AsyncPagePool(FakeBrowser(), size=1) as pool:
+        async with pool.acquire() as page:
+            pass
+        assert page.urls == ["about:blank"]
+        page.closed = True
+        async with pool.acquire() as replacement:
+            assert replacement is not page
+
+
+async def test_closed_pool_rejects_checkouts():
+    pool = AsyncPagePool(FakeBrowser(), size=1)
+    await pool.start()
+    await pool.close()
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            pass
+
+
+async def test_pool_keeps_slot_when_replacing_a_page_fails():
+    browser = FakeBrowser()
+    async with AsyncPagePool(browser, size=1, max_uses=1) as pool:
+        browser.failing = True
+        with pytest.raises(RuntimeError, match="Browser crashed"):
+            async with pool.acquire():
+                pass
+        with pytest.raises(RuntimeError, match="Browser crashed"):
+            async with pool.acquire(timeout=1):
+                pass
+
+        browser.failing = False
+        async with pool.acquire(timeout=1) as page:
+            assert not page.closed
+        assert page.closed
+        async with pool.acquire(timeout=1) as replacement:
+            assert replacement is not page
+
+
+async def test_acquire_times_out():
+    async with AsyncPagePool(FakeBrowser(), size=1) as pool:
+        async with pool.acquire():
+            with pytest.raises(AgentQLTimeoutError):
+                async with pool.acquire(timeout=0.01):
+                    pass
+        async with pool.acquire(timeout=0.01):
+            pass
+
+
+async def test_close_wakes_waiting_checkouts():
+    pool = AsyncPagePool(FakeBrowser(), size=1)
+
+    async def wait_for_page():
+        async with pool.acquire():
+            pass
+
+    async with pool.acquire() as page:
+        waiters = [asyncio.create_task(wait_for_page()) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        await pool.close()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+    assert page.closed
+
+
+async def test_pages_failing_to_open_on_start_are_opened_on_checkout():
+    browser = FakeBrowser()
+    browser.failing_pages = 1
+    async with AsyncPagePool(browser, size=2) as pool:
+        assert browser.contexts[0].closed
+        assert len(pool._pages) == 1
+        async with pool.acquire(timeout=1) as first:
+            async with pool.acquire(timeout=1) as second:
+                assert first is not second
+        assert len(pool._pages) == 2
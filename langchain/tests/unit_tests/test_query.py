@@ -0,0 +1,101 @@
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from langchain_agentql.cache import InMemoryCache
+from langchain_agentql.errors import AgentQLQuerySyntaxError
+from langchain_agentql.load_data import load_data
+from langchain_agentql.query import normalize_query, parse_query
+from langchain_agentql.tools.extract_web_data_browser_tool import (
+    ExtractWebDataBrowserToolInput,
+)
+from langchain_agentql.tools.extract_web_data_tool import ExtractWebDataToolInput
+
+QUERY = """
+{
+    products[] {
+        name,
+        price(in  USD,
+              without (sales) tax)
+    }
+    page_title
+}
+"""
+
+
+def test_parse_query():
+    root = parse_query(QUERY)
+    products, page_title = root.children
+    assert products.name == "products" and products.is_list and products.is_container
+    assert [child.name for child in products.children] == ["name", "price"]
+    assert products.children[1].description == "in USD, without (sales) tax"
+    assert not page_title.is_list and not page_title.is_container
+    assert parse_query(QUERY) is root
+
+
+def test_normalize_query():
+    assert normalize_query(QUERY) == "{ products[] { name price(in USD, without (sales) tax) } page_title }"
+    assert normalize_query("{posts [ ]{title,}}") == normalize_query("{ posts[] { title } }") == "{ posts[] { title } }"
+
+
+@pytest.mark.parametrize(
+    "query, line, column",
+    [
+        ("{ posts[] { title }", 1, 20),
+        ("{}", 1, 2),
+        ("posts[] { title }", 1, 1),
+        ("{ title title }", 1, 9),
+        ("{\n  title-text\n}", 2, 8),
+        ("{ price(in USD }", 1, 8),
+        ("{ posts { title }[] }", 1, 18),
+    ],
+)
+def test_invalid_queries_raise(query, line, column):
+    with pytest.raises(AgentQLQuerySyntaxError) as info:
+        parse_query(query)
+    assert (info.value.line, info.value.column) == (line, column)
+    assert isinstance(info.value, ValueError)
+
+
+def test_find_mismatches():
+    root = parse_query("{ posts[] { title author { name } } total }")
+    assert root.find_mismatches({"posts": [{"title": "a", "author": None}], "total": None}) == []
+    assert root.find_mismatches({"posts": [{"title": "a", "author": "b"}, 1]}) == [
+        "posts[0].author: expected an object",
+        "posts[1]: expected an object",
+        "total: missing",
+    ]
+    assert root.find_mismatches({"data": {"posts": {}}}["data"], "data") == [
+        "data.posts: expected a list",
+        "data.total: missing",
+    ]
+
+
+def test_tool_inputs_reject_invalid_queries():
+    with pytest.raises(ValidationError, match="Invalid AgentQL query"):
+        ExtractWebDataToolInput(url="https://example.com", query="{ posts[] { title }")
+    with pytest.raises(ValidationError, match="Invalid AgentQL query"):
+        ExtractWebDataBrowserToolInput(query="{ posts[] { title }")
+    assert ExtractWebDataBrowserToolInput(query="{\n  title\n}").query == "{ title }"
+
+
+def test_load_data_normalizes_query_before_sending():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": {"title": "Example"}, "metadata": {}})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    cache = InMemoryCache()
+    kwargs = {"url": "https://example.com", "api_key": "key", "metadata": {}, "params": {}, "timeout": 10}
+    with pytest.raises(AgentQLQuerySyntaxError):
+        load_data(**kwargs, query="{ title", client=client, cache=cache)
+    assert not requests
+
+    load_data(**kwargs, query="{\n  title\n}", client=client, cache=cache)
+    load_data(**kwargs, query="{ title, }", client=client, cache=cache)
+    assert len(requests) == 1
+    assert json.loads(requests[0].content)["query"] == "{ title }"
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from langchain_agentql.rate_limit import RateLimiter
+
+
+def test_token_bucket_limits_rate():
+    limiter = RateLimiter(requests_per_second=20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        with limiter.limit():
+            pass
+    assert time.monotonic() - start >= 0.19
+
+
+async def test_token_bucket_allows_burst():
+    limiter = RateLimiter(requests_per_second=1, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        async with limiter.alimit():
+            pass
+    assert time.monotonic() - start < 0.1
+
+
+async def test_max_concurrency_async():
+    limiter = RateLimiter(max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request():
+        nonlocal in_flight, max_in_flight
+        async with limiter.alimit():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+def test_max_concurrency_shared_between_threads():
+    limiter = RateLimiter(max_concurrency=1)
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def request():
+        nonlocal in_flight, max_in_flight
+        with limiter.limit():
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max_in_flight == 1
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = RateLimiter(max_concurrency=1)
+    await limiter.aacquire()
+    waiter = asyncio.create_task(limiter.aacquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.aacquire(), timeout=1)
+
+
+def test_invalid_rate_limit():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_second=0)
@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from langchain_agentql.load_data import aload_data, load_data
+from langchain_agentql.retry import RetryPolicy, parse_retry_after
+
+FAST_RETRY_POLICY = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+class _FlakyHandler:
+    def __init__(self, *failures: httpx.Response) -> None:
+        self.failures = list(failures)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.failures:
+            return self.failures.pop(0)
+        return httpx.Response(200, json={"data": {}, "metadata": {}})
+
+
+def _load_kwargs(**kwargs) -> dict:
+    return {
+        "url": "https://example.com",
+        "query": "{ title }",
+        "api_key": "test-key",
+        "metadata": {},
+        "params": {},
+        "timeout": 10,
+        "coalesce": False,
+        **kwargs,
+    }
+
+
+def test_retries_rate_limited_and_server_errors():
+    handler = _FlakyHandler(httpx.Response(429), httpx.Response(503))
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    load_data(**_load_kwargs(client=client, retry_policy=FAST_RETRY_POLICY))
+    assert handler.calls == 3
+
+
+def test_gives_up_after_max_attempts():
+    handler = _FlakyHandler(*[httpx.Response(500, json={"error_info": "down"})] * 3)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(ValueError, match="down"):
+        load_data(**_load_kwargs(client=client, retry_policy=FAST_RETRY_POLICY))
+    assert handler.calls == 3
+
+
+def test_does_not_retry_client_errors():
+    handler = _FlakyHandler(httpx.Response(400, json={"error_info": "bad query"}))
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(ValueError, match="bad query"):
+        load_data(**_load_kwargs(client=client, retry_policy=FAST_RETRY_POLICY))
+    assert handler.calls == 1
+
+
+async def test_retries_transport_errors_async():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"data": {}, "metadata": {}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await aload_data(**_load_kwargs(client=client, retry_policy=FAST_RETRY_POLICY))
+    assert calls == 2
+
+
+def test_retry_after_is_respected_and_capped():
+    policy = RetryPolicy(retry_after_max=5)
+    request = httpx.Request("POST", "https://example.com")
+    response = httpx.Response(429, headers={"Retry-After": "120"}, request=request)
+    error = httpx.HTTPStatusError("rate limited", request=request, response=response)
+    assert parse_retry_after(response) == 120
+    assert policy.get_delay(0, error) == 5
+
+
+def test_backoff_is_exponential_and_bounded():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    error = httpx.ConnectError("refused")
+    assert [policy.get_delay(attempt, error) for attempt in range(4)] == [1, 2, 4, 5]
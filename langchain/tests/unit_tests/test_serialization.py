@@ -0,0 +1,30 @@
+import pytest
+
+from langchain_agentql import serialization
+
+DOCUMENT = {"title": "Ünïcode — title", "price": 1.5, "tags": ["a", None, True]}
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    serialization.set_json_backend()
+
+
+def test_orjson_is_the_default_backend_when_installed():
+    assert serialization.get_json_backend() == ("orjson" if serialization.orjson is not None else "json")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_backends_produce_the_same_compact_json(backend):
+    if backend == "orjson" and serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    serialization.set_json_backend(backend)
+    assert serialization.dumps_str(DOCUMENT) == '{"title":"Ünïcode — title","price":1.5,"tags":["a",null,true]}'
+    assert serialization.dumps(DOCUMENT) == serialization.dumps_str(DOCUMENT).encode()
+    assert serialization.loads(serialization.dumps(DOCUMENT)) == DOCUMENT
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        serialization.set_json_backend("simplejson")
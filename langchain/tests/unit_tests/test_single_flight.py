@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from langchain_agentql.errors import AgentQLTimeoutError
+from langchain_agentql.load_data import aload_data
+from langchain_agentql.single_flight import SingleFlight
+from langchain_agentql.timeouts import deadline
+
+
+async def test_ado_shares_one_call():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"items": [1]}
+
+    results = await asyncio.gather(*(single_flight.ado("key", fetch) for _ in range(5)))
+    assert calls == 1
+    assert all(result == {"items": [1]} for result in results)
+    assert results[0] is not results[1]
+    assert len(single_flight) == 0
+
+
+async def test_ado_shares_errors():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight.ado("key", fail) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_do_shares_one_call_across_threads():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait()
+        return {"value": 1}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(single_flight.do("key", fetch)))
+    leader.start()
+    started.wait()
+    followers = [
+        threading.Thread(target=lambda: results.append(single_flight.do("key", fetch)))
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+    assert calls == 1
+    assert results == [{"value": 1}] * 4
+
+
+def test_do_followers_stop_waiting_at_their_deadline():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait()
+        return {"value": 1}
+
+    leader = threading.Thread(target=lambda: single_flight.do("key", fetch))
+    leader.start()
+    started.wait()
+    try:
+        with deadline(0.05), pytest.raises(AgentQLTimeoutError):
+            single_flight.do("key", fetch)
+    finally:
+        release.set()
+        leader.join()
+
+
+async def test_ado_followers_stop_waiting_at_their_deadline():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return {"value": 1}
+
+    leader = asyncio.ensure_future(single_flight.ado("key", fetch))
+    await asyncio.sleep(0)
+    with deadline(0.05), pytest.raises(AgentQLTimeoutError):
+        await single_flight.ado("key", fetch)
+    release.set()
+    assert await leader == {"value": 1}
+
+
+@pytest.mark.parametrize("coalesce, expected_calls", [(True, 1), (False, 3)])
+async def test_aload_data_coalesces_identical_requests(coalesce, expected_calls):
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {}, "metadata": {}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await asyncio.gather(
+        *(
+            aload_data(
+                url="https://example.com",
+                query="{ title }",
+                api_key="test-key",
+                metadata={},
+                params={},
+                timeout=10,
+                client=client,
+                coalesce=coalesce,
+            )
+            for _ in range(3)
+        )
+    )
+    assert calls == expected_calls
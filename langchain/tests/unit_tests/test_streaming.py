@@ -0,0 +1,103 @@
+import io
+import json
+
+import httpx
+import pytest
+
+from langchain_agentql.document_loaders import AgentQLLoader
+from langchain_agentql.load_data import astream_data, stream_data
+from langchain_agentql.streaming import JSONStreamParser
+
+PRODUCTS = [{"name": "Widget \"A\"", "price": 1.5}, {"name": "Gadget\\n", "price": None}]
+SCREENSHOT = "iVBORw0KGgo" * 1000
+TEST_RESPONSE = {
+    "data": {"products": PRODUCTS, "total": 2},
+    "metadata": {"request_id": "test-id", "screenshot": SCREENSHOT},
+}
+
+
+def _chunks(size: int = 7):
+    body = json.dumps(TEST_RESPONSE).encode()
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def _stream_kwargs() -> dict:
+    return {
+        "url": "https://example.com",
+        "query": "{ products[] { name price } total }",
+        "api_key": "test-key",
+        "metadata": {},
+        "params": {},
+        "timeout": 10,
+    }
+
+
+def test_parser_yields_items_and_sinks_strings_across_chunks():
+    screenshot = []
+    parser = JSONStreamParser(
+        item_path=("data", "products"),
+        string_sinks={("metadata", "screenshot"): screenshot.append},
+    )
+    items = []
+    for chunk in _chunks(3):
+        items += parser.feed(chunk.decode())
+    items += parser.close()
+    assert items == PRODUCTS
+    assert "".join(screenshot) == SCREENSHOT
+    assert parser.document == {"data": {"total": 2}, "metadata": {"request_id": "test-id"}}
+
+
+def test_parser_rejects_truncated_documents():
+    parser = JSONStreamParser()
+    parser.feed('{"data": {"title": "Exa')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_stream_data_writes_screenshot_to_buffer():
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, content=iter(_chunks()))))
+    screenshot = io.BytesIO()
+    with stream_data(**_stream_kwargs(), client=client, item_path="products", screenshot=screenshot) as stream:
+        assert list(stream) == PRODUCTS
+    assert screenshot.getvalue() == SCREENSHOT.encode()
+    assert stream.response["metadata"] == {"request_id": "test-id"}
+
+
+def test_stream_data_error_message():
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda _: httpx.Response(400, json={"error_info": "Bad query"}))
+    )
+    with pytest.raises(ValueError, match="Bad query"):
+        list(stream_data(**_stream_kwargs(), client=client))
+
+
+async def test_astream_data_yields_items():
+    async def body():
+        for chunk in _chunks():
+            yield chunk
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(200, headers={"X-Request-Id": "test-id"}, content=body())
+        )
+    )
+    async with astream_data(**_stream_kwargs(), client=client, item_path="products") as stream:
+        first = await stream.__anext__()
+        assert stream.request_id == "test-id"
+        assert [first, *[item async for item in stream]] == PRODUCTS
+    assert stream.response["metadata"]["screenshot"] == SCREENSHOT
+
+
+def test_loader_streams_screenshots_to_directory(tmp_path):
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, content=iter(_chunks()))))
+    loader = AgentQLLoader(
+        "https://example.com",
+        query="{ products[] { name price } total }",
+        api_key="test-key",
+        http_client=client,
+        screenshot_dir=str(tmp_path),
+    )
+    (document,) = loader.load()
+    with open(document.metadata["screenshot"]) as f:
+        assert f.read() == SCREENSHOT
+    assert json.loads(document.page_content) == TEST_RESPONSE["data"]
@@ -0,0 +1,90 @@
+import time
+
+import httpx
+import pytest
+
+from langchain_agentql.errors import AgentQLAPIError, AgentQLTimeoutError
+from langchain_agentql.load_data import aload_data, load_data
+from langchain_agentql.retry import RetryPolicy
+from langchain_agentql.timeouts import Deadline, Timeouts, deadline, get_deadline
+from langchain_agentql.tools import ExtractWebDataBrowserTool
+
+KWARGS = {
+    "url": "https://example.com",
+    "query": "{ title }",
+    "api_key": "test-key",
+    "metadata": {},
+    "params": {},
+    "coalesce": False,
+}
+
+
+def test_timeouts_are_capped_by_the_time_left():
+    timeouts = Timeouts(total=60, connect=5, write=10)
+    assert Timeouts.of(30) == Timeouts(total=30)
+    assert Timeouts.of(timeouts) is timeouts
+    assert timeouts.to_httpx(None) == httpx.Timeout(connect=5, read=None, write=10, pool=None)
+    assert timeouts.to_httpx(3) == httpx.Timeout(connect=3, read=3, write=3, pool=3)
+
+
+def test_nested_deadlines_only_tighten():
+    assert get_deadline().remaining() is None
+    with deadline(10) as outer:
+        with deadline(60) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert get_deadline(1).remaining() <= 1
+        with deadline(None) as same:
+            assert same.expires_at == outer.expires_at
+    assert get_deadline().remaining() is None
+    assert Deadline.after(0).expired
+
+
+def test_attempts_get_split_timeouts():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"data": {}, "metadata": {}})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    load_data(client=client, timeout=Timeouts(total=120, connect=2), **KWARGS)
+    assert seen[0]["connect"] == 2
+    assert 119 < seen[0]["read"] <= 120
+
+
+def test_retries_stop_at_the_deadline():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, json={"error_info": "busy"}, headers={"Retry-After": "5"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    started = time.monotonic()
+    with pytest.raises(AgentQLAPIError, match="busy"):
+        load_data(client=client, timeout=1, retry_policy=RetryPolicy(max_attempts=5), **KWARGS)
+    assert calls == 1
+    assert time.monotonic() - started < 1
+
+
+async def test_expired_deadline_is_not_sent():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("request sent after the deadline")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with deadline(0):
+        with pytest.raises(AgentQLTimeoutError):
+            await aload_data(client=client, timeout=60, **KWARGS)
+    with pytest.raises(AgentQLTimeoutError):
+        await aload_data(client=client, timeout=60, deadline=Deadline.after(0), **KWARGS)
+
+
+def test_browser_query_timeout_follows_the_deadline():
+    tool = ExtractWebDataBrowserTool.model_construct(timeout=900)
+    assert tool._get_timeout() == 900
+    with deadline(30):
+        assert tool._get_timeout() == 30
+    with deadline(0):
+        with pytest.raises(AgentQLTimeoutError):
+            tool._get_timeout()
@@ -0,0 +1,109 @@
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackHandler
+
+from langchain_agentql.errors import AgentQLAPIError
+from langchain_agentql.load_data import load_data
+from langchain_agentql.retry import RetryPolicy
+from langchain_agentql.tools import ExtractWebDataTool
+from langchain_agentql.tracing import CALL_EVENT_NAME, CallTrace
+
+ARGS = {"url": "https://example.com", "query": "{ title }"}
+TOOL_CALL = {"type": "tool_call", "id": "call-1", "name": "extract_web_data_with_rest_api", "args": ARGS}
+RESPONSE = {"data": {"title": "Example"}, "metadata": {"request_id": "req-1"}}
+
+
+def _flaky_transport() -> httpx.MockTransport:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=RESPONSE)
+
+    return httpx.MockTransport(handler)
+
+
+def _tool(transport: httpx.MockTransport) -> ExtractWebDataTool:
+    return ExtractWebDataTool(
+        api_key="test-key",
+        http_client=httpx.Client(transport=transport),
+        retry_policy=RetryPolicy(backoff_base=0.01, jitter=False),
+    )
+
+
+class EventRecorder(BaseCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    def on_custom_event(self, name: str, data: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.events.append((name, data))
+
+
+class AsyncEventRecorder(AsyncCallbackHandler):
+    def __init__(self):
+        self.events = []
+
+    async def on_custom_event(self, name: str, data: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.events.append((name, data))
+
+
+def test_tool_call_returns_timing_as_artifact():
+    message = _tool(_flaky_transport()).invoke(TOOL_CALL)
+    timing = message.artifact["timing"]
+    assert message.tool_call_id == "call-1"
+    assert timing["attempts"] == 2
+    assert timing["status_code"] == 200
+    assert timing["request_id"] == "req-1"
+    assert timing["url"] == "https://example.com"
+    assert timing["request_bytes"] > 0 and timing["response_bytes"] > 0
+    assert {"queue", "backoff", "decode"} <= set(timing["phases_ms"])
+    assert timing["total_ms"] >= timing["phases_ms"]["backoff"] >= 10
+
+
+def test_invoking_with_args_returns_data_only():
+    assert _tool(_flaky_transport()).invoke(ARGS) == RESPONSE
+
+
+def test_timing_is_dispatched_to_callbacks():
+    recorder = EventRecorder()
+    _tool(_flaky_transport()).invoke(ARGS, config={"callbacks": [recorder]})
+    [(name, timing)] = recorder.events
+    assert name == CALL_EVENT_NAME
+    assert timing["attempts"] == 2
+
+
+async def test_async_timing_is_dispatched_to_callbacks():
+    recorder = AsyncEventRecorder()
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, json=RESPONSE))
+    tool = ExtractWebDataTool(api_key="test-key", async_http_client=httpx.AsyncClient(transport=transport))
+    message = await tool.ainvoke(TOOL_CALL, config={"callbacks": [recorder]})
+    [(name, timing)] = recorder.events
+    assert name == CALL_EVENT_NAME
+    assert timing == message.artifact["timing"]
+
+
+def test_failed_call_records_error_and_request_id():
+    trace = CallTrace("agentql.query_data")
+    response = httpx.Response(400, json={"error_info": "Bad query", "request_id": "req-2"})
+    client = httpx.Client(transport=httpx.MockTransport(lambda _: response))
+    with pytest.raises(AgentQLAPIError):
+        load_data(**ARGS, api_key="test-key", metadata={}, params={}, timeout=10, client=client, trace=trace)
+    timing = trace.to_dict()
+    assert timing["error"] == "AgentQLAPIError"
+    assert timing["request_id"] == "req-2"
+    assert timing["status_code"] == 400
+
+
+def test_http_events_are_timed_by_phase():
+    trace = CallTrace("agentql.query_data")
+    for step in ("connection.connect_tcp", "connection.start_tls", "http11.receive_response_headers"):
+        trace.http_event(f"{step}.started", {})
+        trace.http_event(f"{step}.complete", {})
+    trace.http_event("http11.receive_response_body.started", {})
+    trace.http_event("http11.response_closed.complete", {})
+    assert set(trace.phases) == {"connect", "tls", "server"}
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from agentql.ext.playwright.async_api import Page as AsyncAgentQLPage
+
+from langchain_agentql import utils
+from langchain_agentql.metrics import BROWSER_PAGES_WRAPPED
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.handlers = {}
+
+    def once(self, event, handler) -> None:
+        self.handlers[event] = handler
+
+    def close(self) -> None:
+        self.handlers.pop("close")(self)
+
+
+@pytest.fixture()
+def wrap_calls(monkeypatch):
+    calls = []
+
+    def wrap(page):
+        calls.append(page)
+        return ("wrapped", page)
+
+    async def wrap_async(page):
+        calls.append(page)
+        await asyncio.sleep(0.01)
+        return ("wrapped", page)
+
+    monkeypatch.setattr(utils.agentql, "wrap", wrap)
+    monkeypatch.setattr(utils.agentql, "wrap_async", wrap_async)
+    return calls
+
+
+def test_wrap_page_is_memoized_until_close(wrap_calls):
+    page = FakePage()
+    assert utils._wrap_page(page) is utils._wrap_page(page)
+    assert len(wrap_calls) == 1
+
+    page.close()
+    utils._wrap_page(page)
+    assert len(wrap_calls) == 2
+
+
+async def test_awrap_page_shares_concurrent_wraps(wrap_calls):
+    page = FakePage()
+    results = await asyncio.gather(*(utils._awrap_page(page) for _ in range(3)))
+    assert results == [("wrapped", page)] * 3
+    await utils._awrap_page(page)
+    assert len(wrap_calls) == 1
+
+    page.close()
+    await utils._awrap_page(page)
+    assert len(wrap_calls) == 2
+
+
+async def test_awrap_page_does_not_rewrap_agentql_pages(wrap_calls):
+    page = AsyncAgentQLPage.__new__(AsyncAgentQLPage)
+    wrapped = BROWSER_PAGES_WRAPPED.collect().samples
+    assert await utils._awrap_page(page) is page
+    assert not wrap_calls
+    assert BROWSER_PAGES_WRAPPED.collect().samples == wrapped
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from langchain_agentql.load_data import aload_data, load_data
+from langchain_agentql.webhook import CallbackReceiver, EmbeddedCallbackServer
+
+KWARGS = {"query": "{ title }", "api_key": "test-key", "metadata": {}, "params": {}, "timeout": 5}
+
+
+def _submit_handler(receiver: CallbackReceiver, callback: dict, use_token: bool = True):
+    submitted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        submitted.append((request.url.path, body))
+        token = body["webhook_url"].rsplit("/", 1)[-1] if use_token else None
+        # Post the result once the submission was acknowledged
+        threading.Timer(0.01, receiver.deliver, args=(callback, token)).start()
+        return httpx.Response(202, json={"request_id": "req-1", "status": "PENDING"})
+
+    return handler, submitted
+
+
+def test_load_data_waits_for_callback():
+    receiver = CallbackReceiver("https://worker.example.com/callbacks/")
+    callback = {"data": {"title": "Example"}, "metadata": {"request_id": "req-1"}, "status": "COMPLETED"}
+    handler, submitted = _submit_handler(receiver, callback)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    result = load_data(url="https://example.com", client=client, callback_receiver=receiver, **KWARGS)
+
+    assert result == {"data": {"title": "Example"}, "metadata": {"request_id": "req-1"}}
+    path, body = submitted[0]
+    assert path == "/v1/query-data-async"
+    assert body["webhook_url"].startswith("https://worker.example.com/callbacks/")
+    assert len(receiver) == 0
+
+
+def test_callbacks_are_correlated_by_request_id():
+    receiver = CallbackReceiver("https://worker.example.com/callbacks")
+    callback = {"data": {"title": "Example"}, "metadata": {"request_id": "req-1"}}
+    handler, _ = _submit_handler(receiver, callback, use_token=False)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    result = asyncio.run(aload_data(url="https://example.com", client=client, callback_receiver=receiver, **KWARGS))
+
+    assert result["data"] == {"title": "Example"}
+    assert not receiver.deliver(callback)
+
+
+def test_callback_error_is_raised():
+    receiver = CallbackReceiver("https://worker.example.com/callbacks")
+    handler, _ = _submit_handler(receiver, {"data": None, "error_info": "Page failed to load", "status": "FAILED"})
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(ValueError, match="Page failed to load"):
+        load_data(url="https://example.com", client=client, callback_receiver=receiver, **KWARGS)
+
+
+def test_missing_callback_times_out():
+    receiver = CallbackReceiver("https://worker.example.com/callbacks")
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(202, json={})))
+
+    with pytest.raises(TimeoutError):
+        load_data(url="https://example.com", client=client, callback_receiver=receiver, **{**KWARGS, "timeout": 0.05})
+    assert len(receiver) == 0
+
+
+def test_embedded_server_delivers_callbacks(tmp_path):
+    socket_path = str(tmp_path / "callbacks.sock")
+
+    async def run():
+        async with EmbeddedCallbackServer(public_url="https://worker.example.com/hooks", path="/hooks", unix_socket=socket_path) as server:
+            async with httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=socket_path)) as client:
+                with server.expect() as callback:
+                    response = await client.post(
+                        f"http://localhost/hooks/{callback.token}", json={"data": {"title": "Example"}, "metadata": {}}
+                    )
+                    assert response.status_code == 200
+                    assert (await callback.aresult(1))["data"] == {"title": "Example"}
+                response = await client.post("http://localhost/hooks/unknown", json={"data": {}})
+                assert response.status_code == 404
+                response = await client.post("http://localhost/hooks/unknown", content=b"{")
+                assert response.status_code == 400
+
+    asyncio.run(run())
+
+
+def test_embedded_server_accepts_large_callbacks(tmp_path):
+    socket_path = str(tmp_path / "callbacks.sock")
+    screenshot = "A" * (2 * 2**20)
+
+    async def run():
+        async with EmbeddedCallbackServer(unix_socket=socket_path) as server:
+            async with httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=socket_path)) as client:
+                with server.expect() as callback:
+                    response = await client.post(
+                        f"http://localhost/agentql-callbacks/{callback.token}",
+                        json={"data": {}, "metadata": {"screenshot": screenshot}},
+                    )
+                    assert response.status_code == 200
+                    assert (await callback.aresult(1))["metadata"]["screenshot"] == screenshot
+
+    asyncio.run(run())
@@ -0,0 +1,92 @@
+"""Copy the REST client core of `langchain_agentql` into the Dify plugin, which cannot install `langchain-agentql`.
+
+The copy in `dify/provider/core` is generated: change `langchain/langchain_agentql` and run this script instead of
+editing it. `--check` fails if the copy is out of date, e.g. in CI:
+
+.. code-block:: shell
+
+    python scripts/sync_dify_core.py
+    python scripts/sync_dify_core.py --check
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = ROOT / "langchain" / "langchain_agentql"
+TARGET_DIR = ROOT / "dify" / "provider" / "core"
+SOURCE_PACKAGE = "langchain_agentql"
+TARGET_PACKAGE = "provider.core"
+# The client and the modules it imports, none of which import LangChain at runtime
+MODULES = (
+    "client",
+    "const",
+    "endpoints",
+    "errors",
+    "http_client",
+    "messages",
+    "metrics",
+    "rate_limit",
+    "retry",
+    "serialization",
+    "timeouts",
+    "tracing",
+)
+HEADER = "# Generated from langchain/langchain_agentql/{module}.py by scripts/sync_dify_core.py. Do not edit.\n"
+INIT = (
+    '"""REST client core of `langchain_agentql`, generated by scripts/sync_dify_core.py. Do not edit."""\n'
+)
+_IMPORT = re.compile(rf"\bfrom {SOURCE_PACKAGE}\.(\w+) import")
+
+
+def render() -> Dict[str, str]:
+    """Get the files of the copy by name."""
+    files = {"__init__.py": INIT}
+    for module in MODULES:
+        source = (SOURCE_DIR / f"{module}.py").read_text(encoding="utf-8")
+        missing = sorted(set(_IMPORT.findall(source)) - set(MODULES))
+        if missing:
+            raise SystemExit(f"{module}.py imports modules that are not copied: {', '.join(missing)}")
+        source = re.sub(rf"\b{SOURCE_PACKAGE}\.(?=\w)", f"{TARGET_PACKAGE}.", source)
+        files[f"{module}.py"] = HEADER.format(module=module) + source
+    return files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail if the copy is out of date instead of updating it")
+    args = parser.parse_args()
+
+    files = render()
+    existing = {path.name for path in TARGET_DIR.glob("*.py")} if TARGET_DIR.is_dir() else set()
+    stale = sorted(
+        name
+        for name in existing | set(files)
+        if name not in files
+        or name not in existing
+        or (TARGET_DIR / name).read_text(encoding="utf-8") != files[name]
+    )
+    if args.check:
+        if stale:
+            print(
+                f"{TARGET_DIR.relative_to(ROOT)} is out of date ({', '.join(stale)}). "
+                "Run `python scripts/sync_dify_core.py`.",
+                file=sys.stderr,
+            )
+            return 1
+        return 0
+
+    TARGET_DIR.mkdir(exist_ok=True)
+    for name in stale:
+        if name in files:
+            (TARGET_DIR / name).write_text(files[name], encoding="utf-8")
+        else:
+            (TARGET_DIR / name).unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())